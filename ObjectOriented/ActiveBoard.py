@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Wed Oct 21 18:20:51 2026
+
+@author: ChrisZeThird
+
+Activity tracked stepping of the classic game. The board is cut into square tiles and only the tiles whose
+neighbourhood changed during the last generation are computed again. A tile whose neighbourhood did not change is a
+still region and is kept as it is, and a tile whose neighbourhood is back to its state of two generations ago is a
+period 2 region (blinkers, ...) whose next state is already known. Late soups being mostly made of still lifes and
+blinkers, only a small fraction of the board is computed at every generation.
+
+The board is held in two buffers: the next generation is written over the one of the previous generation, so the
+tiles that did not change are not even copied.
+"""
+
+import numpy as np
+
+import CellStates as cs
+
+""" Useful methods """
+
+def next_generation(padded):
+    """ Returns the next generation of the inner cells of padded, whose last two axes are tiles surrounded by a border
+        of one cell"""
+    alive = padded # classic boards only hold 0 and 1
+    N, M = alive.shape[-2] - 2, alive.shape[-1] - 2
+
+    ## Add up the 8 shifted views of the padded tiles
+    total = alive[..., :N, :M] + alive[..., :N, 1:M+1]
+    total += alive[..., :N, 2:]
+    total += alive[..., 1:N+1, :M]
+    total += alive[..., 1:N+1, 2:]
+    total += alive[..., 2:, :M]
+    total += alive[..., 2:, 1:M+1]
+    total += alive[..., 2:, 2:]
+
+    ## Apply Conway's rules
+    return ((total == 3) | ((alive[..., 1:N+1, 1:M+1] == 1) & (total == 2))).view(cs.DTYPE)
+
+def tile_size(n,tile):
+    """ Returns the side of the tiles covering n cells with as few tiles of at most tile cells as possible, all the
+        tiles having the same side. The last tile overhangs n by less than one cell per tile (not at all when the side
+        divides n), so a prime n is cut into tiles like any other."""
+    count = -(-n // min(n, tile))
+    return -(-n // count)
+
+def blocks(array,rows,cols,border=0):
+    """ Returns a (R, C, rows + 2*border, cols + 2*border) view of the rows x cols blocks of array, each one with the
+        given border around it (blocks then overlap, array holding the outer border of the first and last ones)"""
+    s0, s1 = array.strides
+    R, C = (array.shape[0] - 2*border) // rows, (array.shape[1] - 2*border) // cols
+    shape = (R, C, rows + 2*border, cols + 2*border)
+    return np.lib.stride_tricks.as_strided(array, shape, (rows*s0, cols*s1, s0, s1), writeable=(border == 0))
+
+def spread(flags):
+    """ Returns the boolean array of the tiles having a flagged tile in their 3x3 neighbourhood, tiles wrapping around
+        like the board"""
+    near = flags.copy()
+    for di in (-1, 0, 1):
+        for dj in (-1, 0, 1):
+            if di or dj:
+                near |= np.roll(flags, (di, dj), axis=(0, 1))
+    return near
+
+## Above this fraction of tiles to compute, the whole board is computed at once
+FULL = 0.5
+
+""" Classes """
+
+class ActiveBoard():
+
+    """ Classic board wrapping around its edges, stepped tile by tile. Tiles are at most tile x tile cells, the last
+        ones overhanging the board when their sides do not divide it. active_fraction is the fraction of the tiles
+        computed by the last step. """
+
+    def __init__(self,grid,tile=64):
+        grid = cs.as_states(grid)
+        self.N, self.M = grid.shape
+        self.rows = tile_size(self.N, tile)
+        self.cols = tile_size(self.M, tile)
+        R, C = -(-self.N // self.rows), -(-self.M // self.cols)
+
+        ## Both buffers hold the tiles with a border of one cell, current and other are views of the tiles. The row
+        ## and the column just past the board (in the border, or in the last tiles when they overhang the board) are
+        ## copied from the opposite edges, the other overhanging cells are never read by the cells of the board.
+        ## other holds the previous generation once the board has been stepped.
+        self.buffers = [np.zeros((R*self.rows + 2, C*self.cols + 2), dtype=cs.DTYPE) for _ in range(2)]
+        self.current, self.other = (buffer[1:-1, 1:-1] for buffer in self.buffers)
+        self.current[:self.N, :self.M] = grid
+        self.other[:self.N, :self.M] = grid
+        for buffer in self.buffers:
+            self.wrap(buffer)
+
+        ## Cells of the tiles that are on the board, the changes of the overhanging cells are left out
+        self.inside = None
+        if self.current.shape != (self.N, self.M):
+            self.inside = np.zeros(self.current.shape, dtype=bool)
+            self.inside[:self.N, :self.M] = True
+
+        ## Tile flags: changed since the previous generation, and changed since two generations ago
+        self.changed = np.ones((R, C), dtype=bool)
+        self.changed2 = self.changed.copy()
+
+        self.generation = 0
+        self.active_fraction = 1.0
+
+    def wrap(self,buffer):
+        """ Copies the edges of the board held by buffer past the opposite edges"""
+        N, M = self.N, self.M
+        buffer[0, 1:M+1] = buffer[N, 1:M+1]
+        buffer[N+1, 1:M+1] = buffer[1, 1:M+1]
+        buffer[:, 0] = buffer[:, M]
+        buffer[:, M+1] = buffer[:, 1]
+
+    def step(self):
+        """ Advances the board by one generation and returns the fraction of the tiles that were computed"""
+        ## Tiles next to a change are computed, unless their whole neighbourhood is back to its state of two
+        ## generations ago. The others are either still (nothing to do) or of period 2 (the previous generation,
+        ## already in the buffer receiving the next one, is kept)
+        moving = spread(self.changed)
+        compute = moving & spread(self.changed2)
+        self.active_fraction = float(compute.mean())
+
+        if self.active_fraction > FULL:
+            self.step_full()
+        else:
+            self.step_tiles(compute)
+        self.wrap(self.buffers[1])
+
+        self.buffers.reverse()
+        self.current, self.other = self.other, self.current
+        self.generation += 1
+        return self.active_fraction
+
+    def step_full(self):
+        """ Writes the next generation of the whole board in the other buffer and updates the tile flags"""
+        new = next_generation(self.buffers[0])
+        self.changed = self.differ(new, self.current)
+        self.changed2 = self.differ(new, self.other)
+        self.other[...] = new
+
+    def differ(self,a,b):
+        """ Returns the flags of the tiles where the cells of the board differ between a and b"""
+        different = (a != b)
+        if self.inside is not None:
+            different &= self.inside
+        return blocks(different, self.rows, self.cols).any(axis=(2, 3))
+
+    def step_tiles(self,compute):
+        """ Writes the next generation of the tiles to compute in the other buffer and updates the tile flags. The
+            tiles are copied with their border into a single (K, rows + 2, cols + 2) array and computed together."""
+        changed = self.changed & ~compute # period 2 tiles change as much as during the last generation
+        changed2 = np.zeros_like(self.changed2)
+
+        a, b = np.nonzero(compute)
+        if len(a):
+            padded = blocks(self.buffers[0], self.rows, self.cols, border=1)[a, b]
+            other = blocks(self.other, self.rows, self.cols)
+
+            new = next_generation(padded)
+            different, different2 = (new != padded[:, 1:-1, 1:-1]), (new != other[a, b])
+            if self.inside is not None:
+                inside = blocks(self.inside, self.rows, self.cols)[a, b]
+                different &= inside
+                different2 &= inside
+            changed[a, b] = different.any(axis=(1, 2))
+            changed2[a, b] = different2.any(axis=(1, 2))
+            other[a, b] = new
+
+        self.changed, self.changed2 = changed, changed2
+
+    def advance(self,generations):
+        """ Advances the board by the given number of generations and returns the active fraction of each one"""
+        return [self.step() for _ in range(generations)]
+
+    def touch(self,i,j):
+        """ Marks the tile of cell [i,j] as changed, to be called after editing the current generation in place"""
+        a, b = i // self.rows, j // self.cols
+        self.changed[a, b] = self.changed2[a, b] = True
+        self.wrap(self.buffers[0])
+
+    def to_array(self):
+        """ Returns a copy of the current generation"""
+        return self.current[:self.N, :self.M].copy()
+
+    def view(self):
+        """ Returns a read-only view of the current generation, only valid until the next step: copy it to keep it"""
+        view = self.current[:self.N, :self.M]
+        view.flags.writeable = False
+        return view
+
+    def population(self):
+        """ Returns the number of living cells"""
+        return int(np.count_nonzero(self.current[:self.N, :self.M]))
+
+
+class ActiveStepper():
+
+    """ Activity tracked engine for the Conway class, every game builds its own (see ConwayEngine.engine). Called with
+        the board it returned last, it steps its ActiveBoard forward; called with any other array, it starts a new
+        ActiveBoard from it. The board returned is a read-only view of the ActiveBoard, the board is not copied at
+        every generation: it is only valid until the next call (copy it to keep it), and its cells are edited with
+        touch. """
+
+    def __init__(self,tile=64):
+        self.tile = tile
+        self.board = None
+        self.last = None # board returned by the last call
+
+    def __call__(self,grid):
+        if self.board is None or grid is not self.last:
+            self.board = ActiveBoard(grid, self.tile)
+        self.board.step()
+        self.last = self.board.view()
+        return self.last
+
+    def __copy__(self):
+        ## A copy tracks its own board, two games can not share the buffers of an ActiveBoard
+        return ActiveStepper(self.tile)
+
+    def touch(self,grid,i,j,state):
+        """ Sets cell [i,j] of grid to state, grid being either the board returned last (read-only, the cell is
+            written into the ActiveBoard) or any other array"""
+        if self.board is not None and grid is self.last:
+            self.board.current[i, j] = state
+            self.board.touch(i, j)
+        else:
+            grid[i, j] = state
+
+    @property
+    def active_fraction(self):
+        return 1.0 if self.board is None else self.board.active_fraction
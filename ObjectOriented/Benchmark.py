@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Tue Oct 20 17:02:11 2026
+
+@author: ChrisZeThird
+
+Benchmark suite, run headlessly with the Agg backend. It measures the generations per second of Conway.update,
+Versus.update and of the update function of OriginalVersion/GameOfLife.py over several board sizes, densities and
+seeds, the time taken by initFig.init to set up a figure and the cost of drawing a frame. Results are written to a JSON
+file and can be compared with a baseline saved from a previous run:
+
+    python Benchmark.py --output bench.json --save-baseline baseline.json
+    python Benchmark.py --output bench.json --baseline baseline.json
+
+The comparison exits with status 1 if a measure got slower than the baseline by more than the tolerance. The time taken
+to import the headless core (Game) in a fresh interpreter is checked against a budget on every run, as is the fact
+that it does not load matplotlib.
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+
+import ConwayClassic as cc
+import ConwayVersus as cv
+import Game as gm
+import ConwayEngine as ce
+import VersusEngine as ve
+import Display as dp
+import CellStates as cs
+
+""" Useful methods """
+
+## Board sizes of the full and the quick suites, the reference loops only run on the smallest ones
+SIZES = [32, 128, 512, 2048]
+QUICK_SIZES = [32, 128]
+LOOP_MAX = 128
+
+## Import time allowed to the headless core in ms, most of it being numpy's
+IMPORT_BUDGET = 250
+
+def best_time(func,repeat=3,number=1):
+    """ Returns the best time in seconds of number calls to func, over repeat runs"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, time.perf_counter() - start)
+    return best / number
+
+def soup(N,density,seed,dtype=cs.DTYPE):
+    """ Returns a random N x N board of living cells"""
+    return (np.random.default_rng(seed).random((N, N)) < density).astype(dtype)
+
+def load_original():
+    """ Returns the OriginalVersion/GameOfLife.py script loaded as a module (it draws its figure on import)"""
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'OriginalVersion', 'GameOfLife.py')
+    spec = importlib.util.spec_from_file_location('GameOfLife', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def import_time(module,repeat=3):
+    """ Returns the best time in ms taken to import module in a fresh interpreter, and whether matplotlib was loaded"""
+    code = (f'import sys, time; start = time.perf_counter(); import {module}; '
+            f'print(time.perf_counter() - start, "matplotlib" in sys.modules)')
+    here = os.path.dirname(os.path.abspath(__file__))
+    best, loaded = float('inf'), False
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, '-c', code], cwd=here, capture_output=True, text=True, check=True)
+        seconds, matplotlib_loaded = out.stdout.split()
+        best = min(best, float(seconds) * 1000)
+        loaded = loaded or matplotlib_loaded == 'True'
+    return best, loaded
+
+""" Measures """
+
+def bench_conway(sizes,densities,seeds,generations):
+    """ Yields the generations per second of Conway.update for every engine, size, density and seed"""
+    for engine in ce.ENGINES:
+        for N in sizes:
+            if engine == 'reference' and N > LOOP_MAX:
+                continue
+            game = cc.Conway(N, engine=engine)
+            for density in densities:
+                for seed in seeds:
+                    game.data = soup(N, density, seed)
+                    rate = 1 / best_time(lambda: game.update(game.data), number=generations)
+                    yield f'conway.update[{engine}] N={N} density={density} seed={seed}', rate, 'generations/s'
+            plt.close(game.fig)
+
+def late_soup(N,active=0.02,seed=0):
+    """ Returns an N x N board standing for a late soup, made of blocks and blinkers with a random soup over about
+        the given fraction of the board"""
+    board = np.zeros((N, N), dtype=cs.DTYPE)
+    board[1::8, 1::8] = board[1::8, 2::8] = board[2::8, 1::8] = board[2::8, 2::8] = cs.ALIVE # blocks
+    board[5::8, 4::8] = board[5::8, 5::8] = board[5::8, 6::8] = cs.ALIVE # blinkers
+    side = int(N * active**0.5)
+    board[:side, :side] = soup(side, 0.35, seed)
+    return board
+
+def bench_late(sizes,generations):
+    """ Yields the generations per second of the headless Classic.update on late soups, where the 'active' engine
+        only computes a few tiles, for the 'numpy' and 'active' engines"""
+    for engine in ('numpy', 'active'):
+        for N in sizes:
+            game = gm.Classic(N, engine=engine)
+            game.data = late_soup(N)
+            game.update(game.data) # the active engine finds the still tiles during the first generations
+            game.update(game.data)
+            rate = 1 / best_time(lambda: game.update(game.data), number=generations)
+            yield f'classic.update[{engine}] late N={N}', rate, 'generations/s'
+
+def bench_versus(sizes,densities,seeds,generations):
+    """ Yields the generations per second of Versus.update for every engine, size, density and seed. Half of the
+        living cells belong to each player."""
+    for engine in ve.ENGINES:
+        for N in sizes:
+            if engine == 'reference' and N > LOOP_MAX:
+                continue
+            game = cv.Versus(N, N*N, engine=engine, seed=0)
+            for density in densities:
+                for seed in seeds:
+                    r = np.random.default_rng(seed).random((N, N))
+                    game.data = np.where(r < density/2, cs.P1, np.where(r < density, cs.P2, cs.EMPTY)).astype(cs.DTYPE)
+                    rate = 1 / best_time(lambda: game.update(game.data), number=generations)
+                    yield f'versus.update[{engine}] N={N} density={density} seed={seed}', rate, 'generations/s'
+            plt.close(game.fig)
+
+def bench_original(sizes,densities,seeds,generations):
+    """ Yields the generations per second of the update function of the original script"""
+    gol = load_original()
+    for N in sizes:
+        if N > LOOP_MAX:
+            continue
+        for density in densities:
+            for seed in seeds:
+                gol.data = soup(N, density, seed, dtype=float) # the original script works on floats
+                rate = 1 / best_time(lambda: gol.update(gol.data), number=generations)
+                yield f'original.update N={N} density={density} seed={seed}', rate, 'generations/s'
+    plt.close('all')
+
+def bench_figure(sizes):
+    """ Yields the time taken by initFig.init, and the cost of a full draw and of a blitted frame of a Conway game"""
+    for N in sizes:
+        def setup():
+            figure = dp.initFig(N)
+            figure.init()
+            figure.fig.canvas.draw()
+            plt.close(figure.fig)
+        yield f'initFig.init N={N}', best_time(setup) * 1000, 'ms'
+
+        game = cc.Conway(N)
+        game.data = soup(N, 0.5, 0)
+        game.img.set_data(game.data)
+        canvas = game.fig.canvas
+        yield f'draw.full N={N}', best_time(canvas.draw, number=5) * 1000, 'ms'
+
+        ## Blitted frame: restore the background, draw the animated artists and blit the axes
+        for artist in game.artists:
+            artist.set_animated(True)
+        canvas.draw()
+        background = canvas.copy_from_bbox(game.ax.bbox)
+        def frame():
+            canvas.restore_region(background)
+            game.update(game.data)
+            for artist in game.artists:
+                game.ax.draw_artist(artist)
+            canvas.blit(game.ax.bbox)
+        yield f'draw.blit N={N}', best_time(frame, number=5) * 1000, 'ms'
+        plt.close(game.fig)
+
+def bench_import(modules=('Game', 'ConwayClassic')):
+    """ Yields the import time of the headless core and of the classic front-end"""
+    for module in modules:
+        yield f'import {module}', import_time(module)[0], 'ms'
+
+def run(sizes,densities=(0.1, 0.5),seeds=(0, 1),generations=5):
+    """ Runs the whole suite and returns the list of results, each a dict with a name, a value and a unit"""
+    results = []
+    for bench in (bench_conway(sizes, densities, seeds, generations),
+                  bench_late(sizes, generations),
+                  bench_versus(sizes, densities, seeds, generations),
+                  bench_original(sizes, densities, seeds, 1),
+                  bench_figure(sizes),
+                  bench_import()):
+        for name, value, unit in bench:
+            results.append({'name': name, 'value': value, 'unit': unit})
+            print(f'{name:<60} {value:12.3f} {unit}')
+    return results
+
+""" Comparing with a baseline """
+
+def compare(results,baseline,tolerance=0.2):
+    """ Returns the list of (name, ratio) of the results slower than the baseline by more than tolerance. The ratio is
+        new speed / baseline speed, so rates (generations/s) and durations (ms) are compared the same way."""
+    reference = {r['name']: r for r in baseline['results']}
+    regressions = []
+    for r in results:
+        base = reference.get(r['name'])
+        if base is None or r['value'] == 0 or base['value'] == 0:
+            continue
+        ratio = r['value'] / base['value'] if r['unit'] == 'generations/s' else base['value'] / r['value']
+        print(f'{r["name"]:<60} x{ratio:.2f}')
+        if ratio < 1 - tolerance:
+            regressions.append((r['name'], ratio))
+    return regressions
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark the stepping engines and the rendering.')
+    parser.add_argument('--quick', action='store_true', help='only run the small board sizes')
+    parser.add_argument('--output', default='bench.json', help='JSON file receiving the results')
+    parser.add_argument('--baseline', help='JSON file of a previous run to compare with')
+    parser.add_argument('--save-baseline', help='also save the results as a baseline to this file')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='slowdown allowed before failing')
+    parser.add_argument('--import-budget', type=float, default=IMPORT_BUDGET, help='import time allowed to Game in ms')
+    args = parser.parse_args()
+
+    ## The headless core must import quickly and without matplotlib
+    elapsed, loaded = import_time('Game')
+    over_budget = loaded or elapsed > args.import_budget
+    if over_budget:
+        print(f'IMPORT BUDGET import Game: {elapsed:.1f} ms (budget {args.import_budget:.0f} ms)'
+              + (', matplotlib loaded' if loaded else ''))
+
+    results = run(QUICK_SIZES if args.quick else SIZES)
+    report = {'python': platform.python_version(), 'numpy': np.__version__, 'machine': platform.machine(),
+              'time': time.strftime('%Y-%m-%d %H:%M:%S'), 'results': results}
+
+    for path in filter(None, (args.output, args.save_baseline)):
+        with open(path, 'w') as f:
+            json.dump(report, f, indent=1)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for name, ratio in regressions:
+            print(f'REGRESSION {name}: x{ratio:.2f}')
+        sys.exit(1 if regressions or over_budget else 0)
+
+    sys.exit(1 if over_budget else 0)
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 11:03:47 2026
+
+@author: ChrisZeThird
+
+Bit-packed board for the classic game. Every row of the board is stored as uint64 words, 64 cells per word (cell j of a
+row is bit j%64 of word j//64), and the next generation is computed with bitwise adders working on whole words. The
+board wraps around its edges (torus) like the other engines of ConwayEngine.
+"""
+
+import numpy as np
+
+import CellStates as cs
+
+""" Useful methods """
+
+WORD = 64
+
+## Number of bits set in every possible byte, used to count the population without unpacking the board
+POPCOUNT8 = np.array([bin(x).count('1') for x in range(256)], dtype=np.uint8)
+
+def pack(grid):
+    """ Returns the (N, ceil(M/64)) uint64 array holding the living cells (value 1) of the (N, M) grid"""
+    N, M = np.shape(grid)
+    nwords = -(-M // WORD)
+
+    bits = np.packbits(np.asarray(grid) == 1, axis=1, bitorder='little')
+    words = np.zeros((N, nwords * 8), dtype=np.uint8)
+    words[:, :bits.shape[1]] = bits
+
+    return words.view('<u8')
+
+def unpack(words, M, dtype=cs.DTYPE):
+    """ Returns the (N, M) array of 0 and 1 stored in words, with the given dtype (state codes by default)"""
+    bits = np.unpackbits(np.ascontiguousarray(words).view(np.uint8), axis=1, bitorder='little')
+
+    return bits[:, :M].astype(dtype)
+
+def full_add(a,b,c):
+    """ Returns the sum and carry bits of a + b + c, bit by bit"""
+    ab = a ^ b
+    return ab ^ c, (a & b) | (c & ab)
+
+""" Stepping """
+
+def step_words(words, M):
+    """ Returns the next generation of a packed board of width M"""
+    last = np.uint64((M - 1) % WORD)
+    one = np.uint64(1)
+    mask = np.uint64((1 << (M % WORD or WORD)) - 1) # valid bits of the last word of each row
+
+    ## West neighbours: every cell receives the value of the cell on its left, carrying bits across words
+    west = (words << one) | (np.roll(words, 1, axis=1) >> np.uint64(WORD - 1))
+    west[:, 0] = (west[:, 0] & ~one) | ((words[:, -1] >> last) & one) # cell 0 wraps to cell M-1
+    west[:, -1] &= mask
+
+    ## East neighbours: every cell receives the value of the cell on its right
+    east = (words >> one) | (np.roll(words, -1, axis=1) << np.uint64(WORD - 1))
+    east[:, -1] = (east[:, -1] & mask & ~(one << last)) | ((words[:, 0] & one) << last) # cell M-1 wraps to cell 0
+
+    ## The 8 neighbours, rows above and below are obtained by rolling the rows
+    neighbors = [west, east,
+                 np.roll(words, 1, axis=0), np.roll(west, 1, axis=0), np.roll(east, 1, axis=0),
+                 np.roll(words, -1, axis=0), np.roll(west, -1, axis=0), np.roll(east, -1, axis=0)]
+
+    ## Add the 8 one-bit values of each cell in parallel, the count is held by the bits (b0, b1, b2)
+    s1, c1 = full_add(*neighbors[0:3])
+    s2, c2 = full_add(*neighbors[3:6])
+    s3, c3 = neighbors[6] ^ neighbors[7], neighbors[6] & neighbors[7]
+    b0, c4 = full_add(s1, s2, s3)
+    t, c5 = full_add(c1, c2, c3)
+    b1 = t ^ c4
+    b2 = c5 ^ (t & c4) # a count of 8 overflows to 0, which is dead anyway
+
+    ## Apply Conway's rules: the count is 3, or the count is 2 and the cell is alive
+    newWords = b1 & ~b2 & (b0 | words)
+    newWords[:, -1] &= mask
+
+    return newWords
+
+def step_dense(grid):
+    """ Returns the next generation of a dense grid, going through the packed representation. Useful to run the
+        bit-packed engine from the Conway class, which keeps a dense array for the figure."""
+    M = np.shape(grid)[1]
+    return unpack(step_words(pack(grid), M), M, dtype=np.asarray(grid).dtype)
+
+""" Classes """
+
+class BitBoard():
+
+    """ Board of N rows and M columns (M = N by default) storing one bit per cell. The dense array needed by imshow
+        is only built on request with to_array, and single cells can be read or toggled in place so the click
+        handlers keep working. """
+
+    def __init__(self,N,M=None):
+        self.N = N
+        self.M = N if M is None else M
+        self.words = np.zeros((self.N, -(-self.M // WORD)), dtype='<u8')
+
+    @classmethod
+    def from_array(cls,grid):
+        """ Returns a BitBoard holding the living cells of grid"""
+        N, M = np.shape(grid)
+        board = cls(N, M)
+        board.words = pack(grid)
+        return board
+
+    def to_array(self,dtype=cs.DTYPE):
+        """ Returns the board as a dense array of 0 and 1"""
+        return unpack(self.words, self.M, dtype)
+
+    def step(self):
+        """ Advances the board by one generation"""
+        self.words = step_words(self.words, self.M)
+
+    def get(self,i,j):
+        """ Returns the state (0 or 1) of cell [i,j]"""
+        return int((self.words[i, j // WORD] >> np.uint64(j % WORD)) & np.uint64(1))
+
+    def toggle(self,i,j):
+        """ Turns cell [i,j] on if it was off, off otherwise"""
+        self.words[i, j // WORD] ^= np.uint64(1) << np.uint64(j % WORD)
+
+    def population(self):
+        """ Returns the number of living cells"""
+        return int(POPCOUNT8[self.words.view(np.uint8)].sum(dtype=np.int64))
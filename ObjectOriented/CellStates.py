@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Wed Oct 21 15:36:08 2026
+
+@author: ChrisZeThird
+
+Storage contract shared by every game mode and engine. A board is an array of uint8 state codes: 0 is a dead (empty)
+cell, 1 a living cell of the classic game or of player 1, 2 a living cell of player 2. Colours are never stored in the
+board, a palette gives the position in the CMRmap colour map of every code and is only applied when the board is drawn.
+"""
+
+import numpy as np
+
+""" State codes """
+
+DTYPE = np.uint8
+
+DEAD = EMPTY = 0
+ALIVE = P1 = 1
+P2 = 2
+
+## Position in CMRmap of the colour of each code (black for dead cells, white for the classic living cells)
+CLASSIC = (0.0, 1.0)
+VERSUS = (0.0, 0.2, 0.5)
+
+def palette(states):
+    """ Returns the positions in CMRmap of the colours of a classic board with the given number of states. Dying
+        states of Generations rules fade from yellow to purple."""
+    return CLASSIC + tuple(np.linspace(0.8, 0.3, states - 2))
+
+def board(N,M=None):
+    """ Returns an empty N x M board"""
+    return np.zeros((N, N if M is None else M), dtype=DTYPE)
+
+def as_states(grid):
+    """ Returns grid as an array of state codes, without copy if it already is one"""
+    return np.asarray(grid, dtype=DTYPE)
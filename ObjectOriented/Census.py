@@ -0,0 +1,293 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Fri Oct 23 14:08:33 2026
+
+@author: ChrisZeThird
+
+Census of the objects left by random soups. A settled board is split into its objects (groups of cells touching each
+other during a few generations, so that the separated parts of an oscillator stay together), and every object is
+named by its apgcode, the name used by the Catagolue census: 'xs4_33' is the block, 'xp2_7' the blinker, 'xq4_153'
+the glider. The prefix gives the kind of object and its population or period (xs still life, xp oscillator, xq
+spaceship), the suffix its cells in the extended Wechsler format, taken in the orientation (and phase) giving the
+shortest string so that rotated or reflected copies get the same name.
+
+Naming an object means simulating it alone, so the names are kept in an ObjectCache, a LRU dict from the canonical key
+of a phase of an object to its apgcode which can be saved to a file and reused from one run to the next. Blocks and
+blinkers are then simulated once, all the other copies costing a dict lookup:
+
+    census = Census(cache_path='objects.json')
+    tally = census.soup(64, 0.375, seed)  # Counter of apgcodes
+    census.cache.save()
+"""
+
+import collections
+import json
+import os
+import re
+
+import numpy as np
+
+import Termination as tm
+import Ensemble as en
+import CellStates as cs
+import Rules as rl
+
+""" Object codes """
+
+ALPHABET = '0123456789abcdefghijklmnopqrstuvwxyz'
+ZEROS = re.compile('0{2,}') # runs of empty columns
+
+## Objects that could not be named
+DIED = 'DIED' # disappears when left alone (it was only alive thanks to its neighbours)
+UNKNOWN = 'UNKNOWN' # did not come back to its initial phase within max_period generations
+
+def crop(cells):
+    """ Returns the smallest sub-array of cells holding all of its non zero cells, and the (top, left) of that
+        sub-array. An empty array is returned as a 0 x 0 array."""
+    rows = np.flatnonzero(cells.any(axis=1))
+    if rows.size == 0:
+        return cells[:0, :0], (0, 0)
+    columns = np.flatnonzero(cells.any(axis=0))
+    return cells[rows[0]:rows[-1]+1, columns[0]:columns[-1]+1], (int(rows[0]), int(columns[0]))
+
+def wechsler(cells):
+    """ Returns the extended Wechsler code of the cropped 0/1 array cells: every strip of 5 rows is written column by
+        column (one character per column, the top row being the lowest bit), the strips are separated by 'z' and the
+        runs of empty columns are shortened ('w' for 2, 'x' for 3, 'y' and a character for 4 to 39)."""
+    cells = np.asarray(cells, dtype=np.uint8)
+    rows = -(-cells.shape[0] // 5) * 5
+    padded = np.zeros((rows, cells.shape[1]), dtype=np.uint8)
+    padded[:cells.shape[0]] = cells
+
+    weights = (1 << np.arange(5)).reshape(5, 1)
+    strips = []
+    for top in range(0, rows, 5):
+        values = (padded[top:top+5] * weights).sum(axis=0)
+        strip = ''.join(ALPHABET[v] for v in values).rstrip('0')
+
+        ## Shorten the runs of empty columns
+        strip = ZEROS.sub(_zeros, strip)
+        strips.append(strip)
+    return 'z'.join(strips).rstrip('z')
+
+def _zeros(match):
+    ## Code of a run of empty columns
+    n = len(match.group())
+    code = ''
+    while n >= 40:
+        code += 'yz' # 39 columns
+        n -= 39
+    if n >= 4:
+        return code + 'y' + ALPHABET[n - 4]
+    return code + ('', '0', 'w', 'x')[n]
+
+def orientations(cells):
+    """ Yields the 8 rotations and reflections of cells"""
+    for k in range(4):
+        rotated = np.rot90(cells, k)
+        yield rotated
+        yield rotated.T
+
+def canonical(cells):
+    """ Returns the code of cells in its canonical orientation: the shortest of the codes of its 8 orientations,
+        the first in alphabetical order among the shortest"""
+    cells, _ = crop(np.asarray(cells))
+    return min((wechsler(o) for o in orientations(cells)), key=lambda code: (len(code), code))
+
+""" Naming objects """
+
+def classify(cells,rule='B3/S23',max_period=60):
+    """ Returns the apgcode of the object cells (a 0/1 array) left alone on an empty plane, DIED if it disappears or
+        UNKNOWN if it does not come back to its initial phase within max_period generations"""
+    cells, _ = crop(np.asarray(cells, dtype=cs.DTYPE))
+    if cells.size == 0:
+        return DIED
+
+    ## Empty margin wide enough for the fastest spaceship (speed c/2) to move without touching itself on the torus
+    margin = max_period // 2 + 2
+    board = np.zeros((cells.shape[0] + 2*margin, cells.shape[1] + 2*margin), dtype=cs.DTYPE)
+    board[margin:-margin, margin:-margin] = cells
+
+    phases = [cells]
+    for period in range(1, max_period + 1):
+        board = rl.step(board, rule)
+        phase, corner = crop(board)
+        if phase.size == 0:
+            return DIED
+
+        if phase.shape == cells.shape and np.array_equal(phase, cells):
+            code = min((canonical(p) for p in phases), key=lambda code: (len(code), code))
+            if corner != (margin, margin):
+                return f'xq{period}_{code}'
+            if period == 1:
+                return f'xs{int(np.count_nonzero(cells))}_{code}'
+            return f'xp{period}_{code}'
+        phases.append(phase)
+    return UNKNOWN
+
+""" Splitting a board """
+
+NEIGHBOURS = [(di, dj) for di in (-1, 0, 1) for dj in (-1, 0, 1) if (di, dj) != (0, 0)]
+
+def components(footprint):
+    """ Returns the groups of touching non zero cells of footprint (8 neighbours, wrapping around the edges). Each
+        group is an array of (i, j) coordinates, unwrapped so that a group crossing an edge stays in one piece: take
+        them modulo the shape of footprint to index it."""
+    N, M = footprint.shape
+    remaining = set(zip(*map(lambda a: a.tolist(), np.nonzero(footprint))))
+    groups = []
+    while remaining:
+        start = remaining.pop()
+        group = [start]
+        stack = [start]
+        while stack:
+            i, j = stack.pop()
+            for di, dj in NEIGHBOURS:
+                cell = ((i + di) % N, (j + dj) % M)
+                if cell in remaining:
+                    remaining.remove(cell)
+                    unwrapped = (i + di, j + dj) # keeps following the group across the edge
+                    group.append(unwrapped)
+                    stack.append(unwrapped)
+        groups.append(np.array(group))
+    return groups
+
+def objects(board,rule='B3/S23',window=4):
+    """ Returns the objects of board, as cropped 0/1 arrays. Cells belong to the same object if they touch during
+        the next window generations, so the parts of an oscillator that are apart in some phase stay together."""
+    board = cs.as_states(board)
+    alive = (board == cs.ALIVE)
+    footprint = alive.copy()
+    grid = board
+    for _ in range(window - 1):
+        grid = rl.step(grid, rule)
+        footprint |= (grid == cs.ALIVE)
+
+    result = []
+    for group in components(footprint):
+        top, left = group.min(axis=0)
+        cells = np.zeros(tuple(group.max(axis=0) - (top, left) + 1), dtype=cs.DTYPE)
+        cells[group[:, 0] - top, group[:, 1] - left] = alive[group[:, 0] % board.shape[0], group[:, 1] % board.shape[1]]
+        cells, _ = crop(cells)
+        if cells.size:
+            result.append(cells)
+    return result
+
+""" Classes """
+
+class ObjectCache():
+
+    """ LRU dict from the canonical key of a phase of an object to its apgcode, holding at most maxsize objects. If
+        path is given, the cache is loaded from it and save writes it back, most recently used objects last. """
+
+    def __init__(self,path=None,maxsize=100000):
+        self.path = None if path is None else os.fspath(path) # a str or a pathlib.Path
+        self.maxsize = maxsize
+        self.codes = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+        if path is not None and os.path.exists(path):
+            with open(path) as file:
+                self.codes.update(json.load(file))
+
+    def get(self,key):
+        """ Returns the apgcode of key, or None if it is not cached"""
+        code = self.codes.get(key)
+        if code is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self.codes.move_to_end(key)
+        return code
+
+    def put(self,key,code):
+        self.codes[key] = code
+        self.codes.move_to_end(key)
+        if len(self.codes) > self.maxsize:
+            self.codes.popitem(last=False) # forget the least recently used object
+
+    def save(self,path=None):
+        """ Writes the cache to path (the path it was loaded from by default)"""
+        path = self.path if path is None else os.fspath(path)
+        if path is None:
+            raise ValueError('the cache has no path, give the path to save it to')
+        with open(path + '.tmp', 'w') as file:
+            json.dump(list(self.codes.items()), file)
+        os.replace(path + '.tmp', path) # a crash while writing leaves the previous cache untouched
+
+    def __len__(self):
+        return len(self.codes)
+
+
+class Census():
+
+    """ Runs soups under rule and counts the objects they leave, by apgcode. The names are cached in an ObjectCache
+        (saved to cache_path if given). A soup runs until its board repeats itself or for at most generations
+        generations, objects that do not come back within max_period generations are counted as UNKNOWN. """
+
+    def __init__(self,rule='B3/S23',cache_path=None,maxsize=100000,generations=2000,max_period=60,window=4):
+        self.rule = rule
+        self.cache = ObjectCache(cache_path, maxsize)
+        self.generations = generations
+        self.max_period = max_period
+        self.window = window
+        self.states = rl.compile_rule(rule).states
+
+        self.totals = collections.Counter() # objects of every soup seen so far
+        self.soups = 0
+
+    def name(self,cells):
+        """ Returns the apgcode of the object cells, simulating it only if this phase of it was never seen"""
+        key = canonical(cells)
+        code = self.cache.get(key)
+        if code is None:
+            code = classify(cells, self.rule, self.max_period)
+            self.cache.put(key, code)
+        return code
+
+    def count(self,board):
+        """ Returns the Counter of the apgcodes of the objects of a settled board"""
+        return collections.Counter(self.name(cells) for cells in objects(board, self.rule, self.window))
+
+    def settle(self,board):
+        """ Returns board after it stopped changing (or cycles), or after generations generations"""
+        board = cs.as_states(board)
+        detector = tm.CycleDetector(board.shape, self.states)
+        detector.reset(board)
+        for _ in range(self.generations):
+            new = rl.step(board, self.rule)
+            period = detector.update(board, new)
+            board = new
+            if period is not None:
+                break
+        return board
+
+    def soup(self,N,density=0.375,seed=None):
+        """ Runs a random N x N soup and returns the Counter of the objects it left. The tallies are also added to
+            totals."""
+        board = (np.random.default_rng(seed).random((N, N)) < density).astype(cs.DTYPE)
+        tally = self.count(self.settle(board))
+
+        self.totals.update(tally)
+        self.soups += 1
+        return tally
+
+    def run(self,seeds,N,density=0.375):
+        """ Yields (seed, tally) for the soup of every seed"""
+        for seed in seeds:
+            yield seed, self.soup(N, density, seed)
+
+    def batch(self,K,N,density=0.375,seeds=None):
+        """ Runs K soups at once as an Ensemble (board k being drawn from seeds[k], k by default) and returns the list
+            of their Counters. Soups that die or settle into still lifes and blinkers stop early, the others run for
+            generations generations."""
+        rule = None if rl.compile_rule(self.rule) is rl.compile_rule('B3/S23') else self.rule
+        soups = en.Ensemble(K, N, density, seeds, rule)
+        soups.run(self.generations)
+
+        tallies = [self.count(board) for board in soups.boards]
+        for tally in tallies:
+            self.totals.update(tally)
+        self.soups += K
+        return tallies
@@ -5,54 +5,61 @@ Created on Mon Oct 24 10:58:42 2022
 @author: ChrisZeThird
 """
 
-import numpy as np
+import time
 
 import matplotlib.pyplot as plt 
 from matplotlib.widgets import Button
 import matplotlib.animation as animation
+from matplotlib.colors import ListedColormap
+import matplotlib.cm as cm
+
+import Display as dp
+import Game as gm
+import CellStates as cs
+import Viewport as vp
+import Producer as pr
 
 """ Classes """
 
-## Initialize Figure
-class initFig():
-    
-    def __init__(self,N):
-        self.N = N
-    
-    def init(self):
-        ## Initialize figure
-        self.fig = plt.figure()
-        self.ax = self.fig.subplots()
-        plt.subplots_adjust(right = 0.25)
-        # plt.subplots_adjust(bottom = 0.2)
-        self.ax.axis('off')
-        plt.tight_layout(pad=4)
-        
-        ## Draw a grid layout to see the cells more clearly
-        for x in range(self.N + 1):
-            self.ax.axhline(x, lw=2, color='w', zorder=5)
-            self.ax.axvline(x, lw=2, color='w', zorder=5)
-        
-        
 # Create board for 0 player mod
-class Conway():
+class Conway(gm.Classic):
     
     """ Conway class setup the classic configuration of the game: 0 player game with initial input configurations. Only
-        requirement is a size of board N (int). """
+        requirement is a size of board N (int). The stepping engine can be chosen by name among ConwayEngine.ENGINES,
+        the vectorized 'numpy' engine is used by default. generations_per_frame sets how many generations are computed
+        between two displayed frames, and interval the delay between frames in ms. A rule string such as 'B36/S23' or
+        'B2/S/C3' (see Rules) replaces the engine by one stepping under that rule. The board and its rules are the ones
+        of Game.Classic, this class adds the figure. Boards larger than screen cells are drawn reduced (lod sets how,
+        see Viewport), the mouse wheel zooms in and out and the arrow keys move the view. With background=True the
+        generations are computed by a thread, up to lookahead frames ahead of the one displayed (see Producer). """
     
-    def __init__(self,N):
-        ## Initialize data set
-        self.N = N
-        self.data = np.zeros((self.N,self.N))
+    def __init__(self,N,engine='numpy',generations_per_frame=1,interval=200,rule=None,screen=1024,lod='max',background=False,lookahead=8):
+        ## Initialize data set and engine
+        super().__init__(N, engine, generations_per_frame, rule)
+        
+        ## Display rate
+        self.interval = interval
+        
+        ## Thread computing the frames ahead, created by the first start
+        self.background = background
+        self.lookahead = lookahead
+        self.producer = None
         
         ## Initialize figure (we call the initFig class to avoid repetition between gamemodes)
-        init_figure = initFig(self.N)
+        init_figure = dp.initFig(self.N)
         init_figure.init()
         self.fig = init_figure.fig
         self.ax = init_figure.ax
         
-        ## Draw initial configuration
-        self.img = self.ax.imshow(self.data, cmap='CMRmap', extent=[0, N, 0, N], vmin=0, vmax=1)
+        ## Draw initial configuration, the colours of the codes being applied by the colour map only. Only the window
+        ## of the viewport is drawn, with at most screen x screen pixels
+        self.viewport = vp.Viewport(self.N, size=screen)
+        self.lod = lod
+        self.cmap = ListedColormap(cm.CMRmap(cs.palette(self.states)))
+        image, extent = self.viewport.render(self.data, self.lod)
+        self.img = self.ax.imshow(image, cmap=self.cmap, extent=extent, vmin=0, vmax=self.states - 1)
+        self.artists = init_figure.artists(self.img)
+        self.show_view()
         
         ## Exit button placement
         self.axes_exit = plt.axes([0.755, 0.2, 0.1, 0.075])
@@ -86,77 +93,141 @@ class Conway():
         ## Create interactivity to click on plot to turn on cells
         self.fig.canvas.mpl_connect('button_press_event', self.turn_on) # connect cells management to figure
         
+        ## Zoom with the mouse wheel, move the view with the arrow keys
+        self.fig.canvas.mpl_connect('scroll_event', self.zoom_view)
+        self.fig.canvas.mpl_connect('key_press_event', self.pan_view)
+        
     """ Rules of the Game of Life """
     
     def update(self,grid):
-     
-        ## Copy grid since we require 8 neighbors for calculation and we go cell by cell
-        newGrid = grid.copy()
-        N = self.N
-        for i in range(N):
-            for j in range(N):
-                total = grid[i%N, (j-1)%N] + grid[i%N, (j+1)%N] + grid[(i-1)%N, j%N] + grid[(i+1)%N, j%N] + grid[(i-1)%N, (j-1)%N] + grid[(i-1)%N, (j+1)%N] + grid[(i+1)%N, (j-1)%N] + grid[(i+1)%N, (j+1)%N]
-                
-                ## Apply Conway's rules
-                # total = np.count_nonzero((grid[(i-1)%N:(i+2)%N,(j-1)%N:(j+2)%N]) == 1)
-                if grid[i, j]  == 1:
-                    if (total < 2) or (total > 3):
-                        newGrid[i, j] = 0
-                else:
-                    if total == 3:
-                        newGrid[i, j] = 1
-     
-        ## Updated data
-        self.data = newGrid
+        
+        ## Compute the next generation with the selected engine
+        super().update(grid)
         ## Updated image
-        self.img.set_data(self.data)
+        self.show()
+    
+    ## Draws the window of the viewport, reduced to the screen if it is larger
+    def show(self):
+        image, extent = self.viewport.render(self.data, self.lod)
+        self.img.set_data(image)
+        self.img.set_extent(extent)
+        
+        ## Densities of living cells go continuously from black (empty) to white (full)
+        if (self.lod == 'mean') and (self.viewport.scale > 1):
+            self.img.set_cmap(cm.CMRmap)
+            self.img.set_clim(0, 1)
+        else:
+            self.img.set_cmap(self.cmap)
+            self.img.set_clim(0, self.states - 1)
     
+    ## Shows the new window of the viewport after a zoom or a move
+    def show_view(self):
+        self.show()
+        xlim, ylim = self.viewport.limits()
+        self.ax.set_xlim(*xlim)
+        self.ax.set_ylim(*ylim)
+        self.fig.canvas.draw_idle()
         
     """ Defining button press events """
 
     ## Allows the user to select cells to setup the initial configuration
     def turn_on(self,event):
-        gx = event.xdata # x coordinate of the mouse
-        gy = event.ydata # y coordinate of the mouse
-        
-        # mouse coordinate (x,y) correspond to array indexes [i,j] with i = N-1 - y and j = x
-        i = self.N - 1 - int(gy) 
-        j = int(gx) 
-        if self.data[i,j] == 0:
-            self.data[i,j] = 1 # on click, turns cell on
-        else:
-            self.data[i,j] = 0 # on click, turns cell off if it was on already
+        if event.inaxes is not self.ax:
+            return # click on a button
         
-        self.img.set_data(self.data) # update the imshow 
+        # mouse coordinate (x,y) correspond to array indexes [i,j] with i = N-1 - y and j = x, at any zoom
+        cell = self.viewport.cell(event.xdata, event.ydata)
+        if cell is None:
+            return
+        self.toggle(*cell) # on click, turns cell on, or off if it was on already
+        self.invalidate()
+        
+        self.show() # update the imshow 
         
         self.fig.canvas.draw_idle()
+    
+    ## Zooms in (wheel up) or out (wheel down) around the cell under the mouse
+    def zoom_view(self,event):
+        if event.inaxes is not self.ax:
+            return
+        cell = self.viewport.cell(event.xdata, event.ydata)
+        self.viewport.zoom(0.5 if event.button == 'up' else 2, *(cell or (None, None)))
+        self.show_view()
+    
+    ## Moves the view by a quarter of the window with the arrow keys, 'home' shows the whole board again
+    def pan_view(self,event):
+        moves = {'up': (-1, 0), 'down': (1, 0), 'left': (0, -1), 'right': (0, 1)}
+        if event.key in moves:
+            di, dj = moves[event.key]
+            self.viewport.pan(di * max(1, self.viewport.rows // 4), dj * max(1, self.viewport.cols // 4))
+        elif event.key == 'home':
+            self.viewport.reset()
+        else:
+            return
+        self.show_view()
       
+    ## The frames computed ahead do not follow an edited board anymore
+    def invalidate(self):
+        if self.producer is not None:
+            self.producer.invalidate()
+    
     ## Lets the user exit the figure
     def escape(self,event):
+        if self.producer is not None:
+            self.producer.stop()
+        self.stop_recording()
         plt.close()
         
     ## On click, reset the plot with all zeros array
     def reset(self,event):
-        self.data = np.zeros((self.N,self.N)) # reset the array to all zeros
+        self.clear() # reset the array to all zeros
+        self.invalidate()
         
-        self.img.set_data(self.data)
+        self.show()
         self.fig.canvas.draw_idle()
 
     ## Starts the animation of the game
+    ## First frame of the blitted animation, the board is drawn as it is
+    def _init_anim(self):
+        return self.artists
+    
     def _update(self,frame):
-        self.update(self.data)
+        if self.producer is None:
+            self.advance_frame()
+        elif self.producer.consume() is None:
+            return self.artists # the next frame is not ready yet, the figure never waits for it
+        
+        if self.metrics is None:
+            self.show() # only the last generation is displayed
+        else:
+            start = time.perf_counter()
+            self.show()
+            self.metrics.record_render('set_data', time.perf_counter() - start)
+        
+        return self.artists
 
     def start_anim(self,event):
-        self.ani = animation.FuncAnimation(self.fig, self._update, interval=200, save_count=60)
+        if self.background:
+            if self.producer is None:
+                self.producer = pr.Producer(self, self.lookahead)
+            self.producer.resume()
+        
+        if self.metrics is None:
+            self.ani = animation.FuncAnimation(self.fig, self._update, init_func=self._init_anim, interval=self.interval, save_count=60, blit=True)
+        else:
+            self.ani = dp.MeasuredAnimation(self.fig, self._update, self.metrics, init_func=self._init_anim, interval=self.interval, save_count=60, blit=True)
         # ani.save('animation_random.gif') # Uncomment if you want to save the animation as a gif
     
     ## Pauses the animation on click
     def pause_anim(self,event):
         self.ani.pause()
+        if self.producer is not None:
+            self.producer.pause() # the board stays at the frame displayed
     
     ## Generate random distribution of cells
     def random_distribution(self,event):
-        self.data = np.random.randint(2, size=(self.N,self.N))
+        self.randomize()
+        self.invalidate()
 
-        self.img.set_data(self.data)
+        self.show()
         self.fig.canvas.draw_idle()
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 09:12:05 2026
+
+@author: ChrisZeThird
+
+Stepping engines for the classic game. An engine is a plain function taking the current grid and returning the next
+generation, so the Conway class (or any other caller) can swap one for another without touching the figure logic.
+The 'active' engine keeps the activity of the tiles of the board it last returned (see ActiveBoard), so it is given as
+a class and every game builds its own with engine.
+"""
+
+import numpy as np
+
+import BitBoard as bb
+import ActiveBoard as ab
+
+""" Neighbour counting """
+
+def count_padded(padded):
+    """ Returns the number of living neighbours of the inner cells of padded, an uint8 array of 0 and 1 surrounded by a
+        border of one cell. Boards are the last two axes, so a stack of boards can be counted at once."""
+    N, M = padded.shape[-2] - 2, padded.shape[-1] - 2
+
+    ## Add up the 8 shifted views of the padded board
+    total = padded[..., :N, :M] + padded[..., :N, 1:M+1]
+    total += padded[..., :N, 2:]
+    total += padded[..., 1:N+1, :M]
+    total += padded[..., 1:N+1, 2:]
+    total += padded[..., 2:, :M]
+    total += padded[..., 2:, 1:M+1]
+    total += padded[..., 2:, 2:]
+
+    return total
+
+def count_neighbors(grid):
+    """ Returns an uint8 array holding, for every cell, the number of living neighbours. The board wraps around its
+        edges (torus), exactly like the modulo indexing of the reference loop."""
+    alive = (grid == 1).astype(np.uint8)
+
+    ## Pad the board with one row/column taken from the opposite side
+    return count_padded(np.pad(alive, 1, mode='wrap'))
+
+""" Stepping engines """
+
+def step(grid):
+    """ Returns the next generation of grid, computed as whole-array operations (default engine)"""
+    total = count_neighbors(grid)
+
+    ## Apply Conway's rules: birth on 3 neighbours, survival on 2 or 3
+    alive = (grid == 1)
+    newGrid = (total == 3) | (alive & (total == 2))
+
+    return newGrid.astype(grid.dtype)
+
+def step_rows(rows):
+    """ Returns the next generation of rows[1:-1], rows[0] and rows[-1] being the halo rows above and below. Columns
+        wrap around like in step, so a board can be stepped band by band and give the same result."""
+    alive = (rows == 1).astype(np.uint8)
+    total = count_padded(np.pad(alive, ((0, 0), (1, 1)), mode='wrap'))
+
+    ## Apply Conway's rules
+    newRows = (total == 3) | ((alive[1:-1] == 1) & (total == 2))
+
+    return newRows.astype(rows.dtype)
+
+def step_reference(grid):
+    """ Returns the next generation of grid, cell by cell. This is the original double loop, slow but easy to read, it
+        is kept to check the other engines against."""
+
+    ## Copy grid since we require 8 neighbors for calculation and we go cell by cell
+    newGrid = grid.copy()
+    N, M = grid.shape
+    for i in range(N):
+        for j in range(M):
+            total = grid[i%N, (j-1)%M] + grid[i%N, (j+1)%M] + grid[(i-1)%N, j%M] + grid[(i+1)%N, j%M] + grid[(i-1)%N, (j-1)%M] + grid[(i-1)%N, (j+1)%M] + grid[(i+1)%N, (j-1)%M] + grid[(i+1)%N, (j+1)%M]
+
+            ## Apply Conway's rules
+            if grid[i, j]  == 1:
+                if (total < 2) or (total > 3):
+                    newGrid[i, j] = 0
+            else:
+                if total == 3:
+                    newGrid[i, j] = 1
+
+    return newGrid
+
+## Engines available to the Conway class, selected by name
+ENGINES = {'numpy': step,
+           'bitpacked': bb.step_dense,
+           'active': ab.ActiveStepper,
+           'reference': step_reference}
+
+def engine(name):
+    """ Returns the engine called name in ENGINES, a new one for the engines keeping a state (given as classes)"""
+    step = ENGINES[name]
+    return step() if isinstance(step, type) else step
@@ -4,62 +4,53 @@ Created on Mon Oct 24 16:44:28 2022
 
 @author: ChrisZeThird
 """
-import numpy as np
+import time
 
 import matplotlib.pyplot as plt 
 from matplotlib.widgets import Button
 import matplotlib.animation as animation
 from matplotlib.artist import Artist
 import matplotlib.cm as cm
+from matplotlib.colors import ListedColormap
 
-import ConwayClassic as cc
-
-""" Useful methods """
-
-def findTrueList(L):
-    """ Returns a list of int values giving the True value
-        positions in L"""
-    return [i for i, x in enumerate(L) if x]
-
-def equalArr(a,b):
-    """ Retruns boolean, test if two arrays are the same"""
-    return (a == b).all()
-
-def findArrList(arr,L):
-    """ Returns of the indexes where an element matches the array arr"""
-    return [equalArr(arr,x) for x in L]
-
+import Display as dp
+import Game as gm
+import CellStates as cs
+import Producer as pr
 
 """ Classes """
 
-class Versus():
+class Versus(gm.Versus):
     
     """ 1v1 gamemode adaptation of Conway's Game of Life. 2 players face each other, with two different colors. The game
         follows the same rules but instead of one type of cell we have two. The game ends when only one type of cell
-        remains on the board. Again the only argument to pass is the size of the board"""
+        remains on the board. Again the only argument to pass is the size of the board. The stepping engine can be
+        chosen by name among VersusEngine.ENGINES, and seed makes the random draws of 3-3 ties reproducible.
+        generations_per_frame sets how many generations are computed between two displayed frames, and interval the
+        delay between frames in ms. The board and its rules are the ones of Game.Versus, this class adds the figure.
+        With background=True the generations are computed by a thread, up to lookahead frames ahead of the one
+        displayed (see Producer)."""
     
-    def __init__(self,N,nbr):
-        ## Initialize data set
-        self.N = N
-        self.data = np.zeros((self.N,self.N))
+    def __init__(self,N,nbr,engine='numpy',seed=None,generations_per_frame=1,interval=100,background=False,lookahead=8):
+        ## Initialize data set, engine, cell counts and cycle detection
+        super().__init__(N, nbr, engine, seed, generations_per_frame)
         
-        ## Set the maximum number of cells a player can place
-        self.nbr = nbr
+        ## Display rate
+        self.interval = interval
         
-        ## Initial count of player 1 and player 2 cells
-        self.count_p1 = 0
-        self.count_p2 = 0
+        ## Thread computing the frames ahead, created when a game starts
+        self.background = background
+        self.lookahead = lookahead
+        self.producer = None
         
-        ## Defines the cmap to use to create two cell colours, 0 and 1 are still black and white
-        self.cmap = 'CMRmap'
-        self.p1 = 0.2 # player 1 colour 
-        self.p2 = 0.5 # player 2 colour
+        ## Colours taken from CMRmap to draw the state codes of the players (see CellStates.VERSUS)
+        self.cmap = ListedColormap(cm.CMRmap(cs.VERSUS))
         
-        self.c1 = cm.CMRmap(self.p1) # retrieve actual color code from decimal value for player 1
-        self.c2 = cm.CMRmap(self.p2) # retrieve actual color code from decimal value for player 2 
+        self.c1 = self.cmap(self.p1) # retrieve actual color code of player 1
+        self.c2 = self.cmap(self.p2) # retrieve actual color code of player 2
         
         ## Initialize figure (we call the initFig class to avoid repetition between gamemodes)
-        init_figure = cc.initFig(self.N)
+        init_figure = dp.initFig(self.N)
         init_figure.init()
         self.fig = init_figure.fig
         self.ax = init_figure.ax
@@ -68,7 +59,8 @@ class Versus():
         self.textvar = self.fig.text(0,0,'') # useful for later, when displaying winner
         
         ## Draw initial configuration
-        self.img = self.ax.imshow(self.data, cmap='CMRmap', extent=[0, self.N, 0, self.N], vmin=0, vmax=1)
+        self.img = self.ax.imshow(self.data, cmap=self.cmap, extent=[0, self.N, 0, self.N], vmin=0, vmax=len(cs.VERSUS) - 1)
+        self.artists = init_figure.artists(self.img)
         
         ## Start animation button placement
         self.axes_start = plt.axes([0.7, 0.6, 0.1, 0.075])
@@ -106,88 +98,16 @@ class Versus():
         self.fig.canvas.mpl_connect('button_press_event', self.turn_on) # connect cells management to figure
     
     """ Rules of the Game """
-    def rule(self,p,q,total1,total2):
-        """ We suppose p and q different. And we look at a cell with value p
-            Returns the new value of the cell for fixed indexes.""" 
-            
-        if ((abs(total1 - total2) == 2) or (abs(total1 - total2) == 3)):
-            return p
-
-        elif ((abs(total1 - total2) == 1) and (total1 > 1)):
-            return p
-        
-        else:
-            return 0
-            
     
-    def get_neighbors(self, grid, i, j):
-        
-        N = self.N
-        
-        North = grid[(i-1), j] if (i > 0) else None
-        S = grid[(i+1), j] if (i < N - 1) else None
-        W = grid[i, (j-1)]  if ((j > 0)) else None
-        E = grid[i, (j+1)] if (j < N - 1) else None
-        
-        NW = grid[(i-1), (j-1)] if (i > 0 and j > 0) else None
-        NE = grid[(i-1), (j+1)] if (i > 0 and j < N - 1) else None
-        SW = grid[(i+1), (j-1)] if (i < N - 1 and j > 0) else None
-        SE = grid[(i+1), (j+1)] if (i < N - 1 and j < N - 1) else None
+    def update(self,grid):
         
-        neighbors = [North, S, W, E, NW, NE, SW, SE]
+        ## Compute the next generation with the selected engine, the cell counts being kept up to date
+        births, deaths, changed = super().update(grid)
         
-        return [x for x in neighbors if x is not None]
-    
-    def update(self,grid):
-     
-        ## Copy grid since we require 8 neighbors for calculation and we go cell by cell
-        newGrid = grid.copy()
-        N = self.N
-        p1 = self.p1
-        p2 = self.p2
-        for i in range(N):
-            for j in range(N):
-                ## Apply adapated Conway's rules
-                # total1 = np.count_nonzero((grid[(i-1)%N:(i+1)%N + 1,(j-1)%N:(j+1)%N + 1]) == p1) # doesn't work as intended
-                # total2 = np.count_nonzero((grid[(i-1)%N:(i+1)%N + 1,(j-1)%N:(j+1)%N + 1]) == p2)
-                
-                #total = grid[i%N, (j-1)%N] + grid[i%N, (j+1)%N] + grid[(i-1)%N, j%N] + grid[(i+1)%N, j%N] + grid[(i-1)%N, (j-1)%N] + grid[(i-1)%N, (j+1)%N] + grid[(i+1)%N, (j-1)%N] + grid[(i+1)%N, (j+1)%N]
-                # idea : list(np.argwhere(arr==p))
-                
-                neighbors = self.get_neighbors(grid,i,j)
-                # print('neighbors: ', neighbors)
-                total1 = sum((x==p1) for x in neighbors)
-                total2 = sum((x==p2) for x in neighbors)
-                
-                if grid[i,j] != 0:
-                    if grid[i,j] == p1:
-                        newGrid[i,j] = self.rule(p1, p2, total1, total2)
-                        
-                    elif grid[i,j] == p2:
-                        newGrid[i,j] = self.rule(p2, p1, total2, total1)
-                    
-                else:
-                    if ((total1 == 3) and (total2 != 3)):
-                        newGrid[i,j] = p1
-                        self.count_p1 += 1
-                    
-                    elif ((total1 != 3) and (total2 == 3)):
-                        newGrid[i,j] = p2
-                        self.count_p2 += 1
-                    
-                    elif ((total1 == 3) and (total2 == 3)):
-                        p = np.random.choice([self.p1,self.p2])
-                        newGrid[i,j] = p
-                        if p == p1:
-                            self.count_p1 += 1
-                        else:
-                            self.count_p2 += 1
-                    
-        ## Updated data
-        self.data = newGrid
         ## Updated image
         (self.img).set_data(self.data)
-        # print('updated')
+        
+        return births, deaths, changed
     
     """ Defining button press events """
     
@@ -196,115 +116,100 @@ class Versus():
         gx = event.xdata # x coordinate of the mouse
         gy = event.ydata # y coordinate of the mouse
         
-        # self.count_p1 = np.count_nonzero(self.data == self.p1)
-        # self.count_p2 = np.count_nonzero(self.data == self.p2)
-        
         # mouse coordinate (x,y) correspond to array indexes [i,j] with i = N-1 - y and j = x
         i = self.N - 1 - int(gy) 
         j = int(gx) 
         
-        if self.data[i,j] == 0:
-            if (self.current_player == 'P1') and (self.count_p1 < (self.nbr + 1)): # checks if player 1 reaches max cell number
-                self.data[i,j] = self.p1 # on click, turns cell on for player 1
-                # print('before: ', self.count_p1)
-                self.count_p1 += 1
-                # print('after: ', self.count_p1)
-            elif (self.current_player == 'P2') and (self.count_p2 < (self.nbr + 1)): # checks if player 2 reaches max cell number
-                self.data[i,j] = self.p2 # on click, turns cell on for player 2
-                # print('before: ', self.count_p2)
-                self.count_p2 += 1
-                # print('after: ', self.count_p2)
-        else:
-            if (self.current_player == 'P1') and (self.data[i,j] == self.p1) and (self.count_p1 > 0):
-                self.data[i,j] = 0 # on click, turns cell off if it was on already, for player 1
-                self.count_p1 -= 1 # substract cell from total cells count of player 1
-            
-            elif (self.current_player == 'P2') and (self.data[i,j] == self.p2) and (self.count_p2 > 0):
-                self.data[i,j] = 0 # on click, turns cell off if it was on already, for player 2
-                self.count_p2 -= 1 # substract cell from total cells count of player 2
-                
+        self.place(i, j, self.current_player) # on click, turns cell on for the current player, or off if it was theirs
+        if self.producer is not None:
+            self.producer.invalidate() # the frames computed ahead do not have the new cell
+        
         self.img.set_data(self.data) # update the imshow 
         self.fig.canvas.draw_idle()
       
+    ## Stops the thread computing the frames of the game, if any
+    def stop_producer(self):
+        if self.producer is not None:
+            self.producer.stop()
+            self.producer = None
+    
     ## Lets the user exit the figure
     def escape(self,event):
+        self.stop_producer()
+        self.stop_recording()
         plt.close()
         
     ## On click, reset the plot with all zeros array
     def reset(self,event):
-        self.data = np.zeros((self.N,self.N)) # reset the array to all zeros
+        self.stop_producer()
+        self.clear() # reset the array to all zeros and the cell counts
         
         (self.img).set_data(self.data)
         
-        self.count_p1 = 0
-        self.count_p2 = 0
-        
         Artist.remove(self.textvar)
         
     ## Starts the animation of the game
 
     def start_game(self,event):
-        self.ani = animation.FuncAnimation(self.fig, self._update, interval=100, save_count=60)
+        self.start() # the history starts from the initial configuration
+        if self.background:
+            self.stop_producer()
+            self.producer = pr.Producer(self, self.lookahead)
+        if self.metrics is None:
+            self.ani = animation.FuncAnimation(self.fig, self._update, init_func=self._init_anim, interval=self.interval, save_count=60, blit=True)
+        else:
+            self.ani = dp.MeasuredAnimation(self.fig, self._update, self.metrics, init_func=self._init_anim, interval=self.interval, save_count=60, blit=True)
         # self.ani.save('animation_versus1.gif') # Uncomment if you want to save the animation as a gif # uncomment to save animation
     
+    ## First frame of the blitted animation, the board is drawn as it is
+    def _init_anim(self):
+        return self.artists
+    
     def _update(self,frame):
         
-        previous_count_p1 = np.count_nonzero(self.data == self.p1)
-        previous_count_p2 = np.count_nonzero(self.data == self.p2)
-        
-        self.update(self.data)
+        if self.producer is None:
+            over = self.advance_frame()
+        else:
+            computed = self.producer.consume()
+            if computed is None:
+                return self.artists # the next frame is not ready yet, the figure never waits for it
+            over = computed.over
+        
+        ## Only the last generation is displayed, its image is timed apart from the computation
+        if self.metrics is None:
+            self.img.set_data(self.data)
+        else:
+            start = time.perf_counter()
+            self.img.set_data(self.data)
+            self.metrics.record_render('set_data', time.perf_counter() - start)
         
-        self.count_p1 = np.count_nonzero(self.data == self.p1)
-        self.count_p2 = np.count_nonzero(self.data == self.p2)
+        if over:
+            self.end_game()
         
-        if (self.count_p1 == 0) and (self.count_p2 != 0):
-            self.ani.event_source.stop()
-            Artist.remove(self.textvar)
-            self.textvar = self.fig.text(0.5, 0.05, 'PLAYER 2 WINS!', color=self.c2, ha='center', fontsize=25, fontweight='bold')
+        return self.artists
+    
+    ## Stops the game and displays the result if it is over, returns True in that case
+    def end_game(self):
         
-        elif (self.count_p1 != 0) and (self.count_p2 == 0):
-            self.ani.event_source.stop()
-            Artist.remove(self.textvar)
-            self.textvar = self.fig.text(0.5, 0.05, 'PLAYER 1 WINS!', color=self.c1, ha='center', fontsize=25, fontweight='bold')
+        result = self.result()
+        if result == 'P2':
+            text, color = 'PLAYER 2 WINS!', self.c2
         
-        elif (self.count_p1 == 0) and (self.count_p2 == 0):
-            self.ani.event_source.stop()
-            Artist.remove(self.textvar)
-            self.textvar = self.fig.text(0.5, 0.05, 'DRAW!', color=cm.CMRmap(0.4), ha='center', fontsize=25, fontweight='bold')
+        elif result == 'P1':
+            text, color = 'PLAYER 1 WINS!', self.c1
         
-        elif (self.count_p1 == previous_count_p1) and (self.count_p2 == previous_count_p2):
-            self.ani.event_source.stop()
-            Artist.remove(self.textvar)
-            self.textvar = self.fig.text(0.5, 0.05, 'DRAW!', color=cm.CMRmap(0.4), ha='center', fontsize=25, fontweight='bold')
+        elif result == 'DRAW':
+            # no cell left, or the board is static or oscillates and both players keep their cells forever
+            text, color = 'DRAW!', cm.CMRmap(0.4)
         
         else:
-            boolList = []
-            temp_grid = self.data
-            self.update(self.data)
-            
-            if equalArr(temp_grid,self.data):
-                # if the previous grid is the same as the new one, the board won't change, the game is static
-                # so it's draw
-                self.ani.event_source.stop()
-                Artist.remove(self.textvar)
-                self.textvar = self.fig.text(0.5, 0.05, 'DRAW!', color=cm.CMRmap(0.4), ha='center', fontsize=25, fontweight='bold')
-            
-            else:
-                # creates a list of the different grid, we look at when will the grid repeats itself
-                # when the grid isn't repeated yet, we add the current grid to the list, until we find a match
-                # the game will end when the periodicity is found.
-                
-                boolList.append(temp_grid)
-                temp_grid = self.data
-                while True:
-                    if len(findArrList(temp_grid,boolList)) != 0:
-                        self.ani.event_source.stop()
-                        Artist.remove(self.textvar)
-                        self.textvar = self.fig.text(0.5, 0.05, 'DRAW!', color=cm.CMRmap(0.4), ha='center', fontsize=25, fontweight='bold')
-                        break
-                    else:
-                        boolList.append(temp_grid)
-                        temp_grid = self.data
+            return False
+        
+        self.ani.event_source.stop()
+        Artist.remove(self.textvar)
+        self.textvar = self.fig.text(0.5, 0.05, text, color=color, ha='center', fontsize=25, fontweight='bold')
+        self.fig.canvas.draw_idle() # the text is outside of the blitted axes, the whole figure is redrawn once
+        return True
                         
     ## Select player turn to set cells
     def select_p1(self,event):
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Thu Oct 22 14:58:03 2026
+
+@author: ChrisZeThird
+
+Matplotlib pieces shared by the figures of both game modes: the figure and its grid lines, and the animation timing
+the drawing of the frames. Only the front-ends (ConwayClassic and ConwayVersus) import this module.
+"""
+
+import time
+
+import matplotlib.pyplot as plt 
+import matplotlib.animation as animation
+from matplotlib.collections import LineCollection
+
+## Above this size the cells are too small on screen for the grid lines to be useful, they are not drawn
+GRID_MAX = 100
+
+""" Classes """
+
+## Initialize Figure
+class initFig():
+    
+    def __init__(self,N):
+        self.N = N
+        self.grid = None
+    
+    def init(self):
+        ## Initialize figure
+        self.fig = plt.figure()
+        self.ax = self.fig.subplots()
+        plt.subplots_adjust(right = 0.25)
+        # plt.subplots_adjust(bottom = 0.2)
+        self.ax.axis('off')
+        plt.tight_layout(pad=4)
+        
+        ## Draw a grid layout to see the cells more clearly, all the lines being a single artist
+        if self.N <= GRID_MAX:
+            ticks = range(self.N + 1)
+            segments = [[(0, x), (self.N, x)] for x in ticks] + [[(x, 0), (x, self.N)] for x in ticks]
+            self.grid = LineCollection(segments, lw=2, color='w', zorder=5)
+            self.ax.add_collection(self.grid, autolim=False)
+    
+    ## Artists redrawn on every frame of a blitted animation: the image, and the grid lines drawn above it
+    def artists(self,img):
+        return [img] if self.grid is None else [img, self.grid]
+
+
+## Blitted animation timing the drawing of every frame, used instead of FuncAnimation when metrics are enabled. The
+## frame function notes when the frame is computed, and a callback added to the timer of the animation once the figure
+## is first drawn, so after the one stepping the animation, records the time taken to draw the frame since.
+class MeasuredAnimation(animation.FuncAnimation):
+    
+    def __init__(self,fig,func,metrics,**kwargs):
+        self.metrics = metrics
+        self.computed = None # time at which the last frame was computed
+        super().__init__(fig, self.measured(func), **kwargs)
+        self.draw_id = fig.canvas.mpl_connect('draw_event', self.start_measures)
+    
+    def measured(self,func):
+        ## Frame function noting when the frame is computed
+        def frame(*args):
+            artists = func(*args)
+            self.computed = time.perf_counter()
+            return artists
+        return frame
+    
+    def start_measures(self,event):
+        event.canvas.mpl_disconnect(self.draw_id)
+        self.event_source.add_callback(self.record_draw)
+    
+    def record_draw(self):
+        if self.computed is not None:
+            self.metrics.record_render('draw', time.perf_counter() - self.computed)
+            self.computed = None
+        
+        
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 16:54:03 2026
+
+@author: ChrisZeThird
+
+Ensembles of independent classic boards. K boards of size N x N are held as one (K, N, N) array and stepped together
+in a single vectorized call, so studying thousands of small random soups costs no Python overhead per board. Boards
+that died out or stopped changing (still life or period 2 oscillator) are frozen and left out of the next steps.
+"""
+
+import numpy as np
+
+import ConwayEngine as ce
+import Rules as rl
+
+""" Useful methods """
+
+## Status of every board of an ensemble
+RUNNING = 0
+DIED = 1
+STILL = 2
+PERIOD2 = 3
+
+def step_batch(boards):
+    """ Returns the next generation of every board of the (K, N, M) uint8 array of 0 and 1, each board wrapping around
+        its own edges like ConwayEngine.step"""
+    total = ce.count_padded(np.pad(boards, ((0, 0), (1, 1), (1, 1)), mode='wrap'))
+
+    ## Apply Conway's rules
+    return ((total == 3) | ((boards == 1) & (total == 2))).astype(np.uint8)
+
+""" Classes """
+
+class Ensemble():
+
+    """ K random soups of size N x N. densities (the probability of a cell to be alive) and seeds can be given for the
+        whole ensemble or as one value per board, board k being drawn from np.random.default_rng(seeds[k]). By default
+        board k uses the seed k. The boards follow Conway's rule unless another rule string is given (see Rules), the
+        population then counting the cells of state 1. """
+
+    def __init__(self,K,N,densities=0.5,seeds=None,rule=None):
+        self.K = K
+        self.N = N
+        self.rule = rule
+        self.densities = np.broadcast_to(np.asarray(densities, dtype=float), (K,))
+        self.seeds = list(range(K)) if seeds is None else list(seeds)
+
+        ## Draw every board with its own generator so that a board only depends on its seed and density
+        self.boards = np.empty((K, N, N), dtype=np.uint8)
+        for k in range(K):
+            self.boards[k] = np.random.default_rng(self.seeds[k]).random((N, N)) < self.densities[k]
+
+        self.previous = np.zeros_like(self.boards) # boards two generations ago are compared for period 2
+        self.generation = 0
+        self.status = np.full(K, RUNNING, dtype=np.uint8)
+        self.stopped_at = np.full(K, -1, dtype=np.int64) # generation at which each board stopped
+        self.population = self.boards.sum(axis=(1, 2), dtype=np.int64)
+
+    @property
+    def active(self):
+        """ Boolean mask of the boards still running"""
+        return self.status == RUNNING
+
+    def step(self):
+        """ Advances every running board by one generation, and stops the boards that died or stabilised"""
+        index = np.flatnonzero(self.active)
+        if len(index) == 0:
+            return
+
+        current = self.boards[index]
+        new = step_batch(current) if self.rule is None else rl.step(current, self.rule)
+        self.generation += 1
+
+        ## Classify the boards from their new state, checks are done board by board on the last two axes
+        population = np.count_nonzero(new == 1, axis=(1, 2))
+        still = (new == current).all(axis=(1, 2))
+        period2 = (new == self.previous[index]).all(axis=(1, 2)) & (self.generation > 1)
+
+        status = np.where(population == 0, DIED, np.where(still, STILL, np.where(period2, PERIOD2, RUNNING)))
+        self.status[index] = status
+        self.stopped_at[index[status != RUNNING]] = self.generation
+
+        self.previous[index] = current
+        self.boards[index] = new
+        self.population[index] = population
+
+    def run(self,max_generations):
+        """ Steps the ensemble until every board stopped or max_generations is reached. Returns the number of boards
+            still running."""
+        while self.generation < max_generations and self.active.any():
+            self.step()
+        return int(self.active.sum())
+
+    def summary(self):
+        """ Returns a dict counting the boards by status, with the mean final population and stopping generation of the
+            boards that stopped"""
+        stopped = ~self.active
+        return {'running': int(np.sum(self.status == RUNNING)),
+                'died': int(np.sum(self.status == DIED)),
+                'still': int(np.sum(self.status == STILL)),
+                'period2': int(np.sum(self.status == PERIOD2)),
+                'mean_population': float(self.population[stopped].mean()) if stopped.any() else 0.0,
+                'mean_stop': float(self.stopped_at[stopped].mean()) if stopped.any() else 0.0}
@@ -0,0 +1,327 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Thu Oct 22 14:27:16 2026
+
+@author: ChrisZeThird
+
+Core of the two game modes: the board, its rules and everything that happens between two frames (stepping, counting
+the cells of the players, detecting the end of a game, recording, metrics), without any display. This module only
+needs numpy, so batch workers can import it without loading matplotlib or needing a display. The figures of
+ConwayClassic and ConwayVersus are built on top of these classes, and are only imported when a window is requested:
+
+    game = Game.Classic(64)        # headless
+    window = Game.gui('classic', 64) # imports matplotlib and opens the figure
+"""
+
+import copy
+import importlib
+import time
+
+import numpy as np
+
+import ConwayEngine as ce
+import VersusEngine as ve
+import Termination as tm
+import Recorder as rc
+import Instrumentation as ins
+import CellStates as cs
+import Rules as rl
+
+""" Classes """
+
+class Classic():
+
+    """ Board of the 0 player game. The stepping engine is chosen by name among ConwayEngine.ENGINES, or replaced by
+        a rule string (see Rules). generations_per_frame sets how many generations advance_frame computes. """
+
+    ## Attributes changed by advance_frame, a frame computed by a copy of the game (see fork) is made of them
+    FRAME = ('data', 'generation')
+
+    def __init__(self,N,engine='numpy',generations_per_frame=1,rule=None):
+        ## Initialize data set, an array of state codes (see CellStates)
+        self.N = N
+        self.data = cs.board(self.N)
+
+        ## Select the function computing the next generation
+        self.step = ce.engine(engine) if rule is None else rl.stepper(rule)
+        self.states = 2 if rule is None else rl.compile_rule(rule).states
+        self.generations_per_frame = generations_per_frame
+        self.generation = 0 # number of generations computed so far
+
+        ## Recorder writing every generation to a file, and Instrumentation.Metrics receiving the timings of every
+        ## generation, see start_recording and enable_metrics
+        self.recorder = None
+        self.metrics = None
+
+    def update(self,grid):
+        """ Computes the next generation of grid with the selected engine"""
+        self.data = self.step(grid)
+        self.generation += 1
+
+    def advance_frame(self):
+        """ Computes the generations shown by the next frame"""
+        if self.metrics is not None:
+            return self._measured_frame()
+
+        for _ in range(self.generations_per_frame):
+            self.data = self.step(self.data)
+            self.generation += 1
+            if self.recorder is not None:
+                self.recorder.record(self.data)
+
+    def _measured_frame(self):
+        ## Same as advance_frame, timing every generation
+        for _ in range(self.generations_per_frame):
+            start = time.perf_counter()
+            previous, self.data = self.data, self.step(self.data)
+            self.generation += 1
+            self.metrics.measure_step(previous, self.data, time.perf_counter() - start)
+            if self.recorder is not None:
+                self.recorder.record(self.data)
+
+    def toggle(self,i,j):
+        """ Turns cell [i,j] on if it was off, off otherwise"""
+        state = cs.ALIVE if self.data[i,j] == cs.DEAD else cs.DEAD
+
+        ## Engines tracking the activity of the board hold the board they returned, and must know about the edited cell
+        if hasattr(self.step, 'touch'):
+            self.step.touch(self.data, i, j, state)
+        else:
+            self.data[i,j] = state
+        self._edited()
+
+    def clear(self):
+        """ Kills every cell"""
+        self.data = cs.board(self.N)
+        self._edited()
+
+    def randomize(self):
+        """ Fills the board with random cells, each one being alive with probability 1/2"""
+        self.data = np.random.randint(2, size=(self.N,self.N), dtype=cs.DTYPE)
+        self._edited()
+
+    def _edited(self):
+        ## The board was edited between two generations, the recording keeps the edits
+        if self.recorder is not None:
+            self.recorder.edit(self.data)
+
+    def start_recording(self,path,keyframe_interval=100):
+        """ Records the current board and every following generation to path, see Recorder.Replay to read it back"""
+        self.stop_recording()
+        self.recorder = rc.Recorder(path, self.data.shape, keyframe_interval)
+        self.recorder.record(self.data)
+
+    def stop_recording(self):
+        if self.recorder is not None:
+            self.recorder.close()
+            self.recorder = None
+
+    def enable_metrics(self,metrics=None):
+        """ Measures every following generation, and returns the Metrics object receiving the measures"""
+        self.metrics = ins.Metrics() if metrics is None else metrics
+        return self.metrics
+
+    def disable_metrics(self):
+        self.metrics = None
+
+    def fork(self):
+        """ Returns a headless Classic in the same state, with its own copy of the board and engine, so it can be
+            advanced in another thread (see Producer). It sends its measures to the same metrics, and records
+            nothing."""
+        other = Classic.__new__(Classic)
+        other.N = self.N
+        other.data = self.data.copy()
+        other.step = copy.copy(self.step) # engines keeping a state get their own
+        other.states = self.states
+        other.generations_per_frame = self.generations_per_frame
+        other.generation = self.generation
+        other.recorder = None
+        other.metrics = self.metrics
+        return other
+
+
+class Versus():
+
+    """ Board of the 1v1 mode, each player placing at most nbr cells. The stepping engine is chosen by name among
+        VersusEngine.ENGINES, and seed makes the random draws of 3-3 ties reproducible. The game ends when a player has
+        no cell left, or when the board repeats itself (a draw). """
+
+    ## Attributes changed by advance_frame, a frame computed by a copy of the game (see fork) is made of them. The
+    ## detector comes with its hash and history, so the displayed game can be edited and forked again at any frame.
+    FRAME = ('data', 'generation', 'count_p1', 'count_p2', 'period', 'rng', 'detector')
+
+    def __init__(self,N,nbr,engine='numpy',seed=None,generations_per_frame=1):
+        ## Initialize data set, the cells of the players are stored as the state codes P1 and P2
+        self.N = N
+        self.data = cs.board(self.N)
+        self.p1 = cs.P1
+        self.p2 = cs.P2
+
+        ## Select the function computing the next generation, and the random generator breaking ties
+        self.step = ve.ENGINES[engine]
+        self.rng = np.random.default_rng(seed)
+        self.generations_per_frame = generations_per_frame
+        self.generation = 0 # number of generations computed so far
+
+        ## Set the maximum number of cells a player can place, and count the cells of each player
+        self.nbr = nbr
+        self.count_p1 = 0
+        self.count_p2 = 0
+
+        ## Detects when the board repeats itself, period stores the length of the cycle once found
+        self.detector = tm.CycleDetector((self.N,self.N))
+        self.period = None
+
+        self.recorder = None
+        self.metrics = None
+
+    def update(self,grid):
+        """ Computes the next generation of grid and returns the (player 1, player 2) births and deaths, and the flat
+            positions of the cells that changed"""
+        return self._generation(grid)
+
+    def _generation(self,grid):
+        ## Same as update, without what the figures add to it, so advance_frame only times the computation
+        self.data, births, deaths, changed = self.step(grid, self.rng)
+        self.generation += 1
+
+        ## Keep the cell count of each player up to date without scanning the board
+        self.count_p1 += births[0] - deaths[0]
+        self.count_p2 += births[1] - deaths[1]
+
+        return births, deaths, changed
+
+    def place(self,i,j,player):
+        """ Puts a cell of player ('P1' or 'P2') on the empty cell [i,j], or removes it if it is already one of
+            theirs. A player can not go over nbr cells nor remove the cells of the other."""
+        old = self.data[i,j]
+        if self.data[i,j] == cs.EMPTY:
+            if (player == 'P1') and (self.count_p1 < (self.nbr + 1)): # checks if player 1 reaches max cell number
+                self.data[i,j] = self.p1
+                self.count_p1 += 1
+            elif (player == 'P2') and (self.count_p2 < (self.nbr + 1)): # checks if player 2 reaches max cell number
+                self.data[i,j] = self.p2
+                self.count_p2 += 1
+        else:
+            if (player == 'P1') and (self.data[i,j] == self.p1) and (self.count_p1 > 0):
+                self.data[i,j] = cs.EMPTY
+                self.count_p1 -= 1
+            elif (player == 'P2') and (self.data[i,j] == self.p2) and (self.count_p2 > 0):
+                self.data[i,j] = cs.EMPTY
+                self.count_p2 -= 1
+
+        ## Keep the hash of the board up to date, a board that was in a cycle may leave it
+        if self.data[i,j] != old:
+            self.detector.edit(i*self.N + j, old, self.data[i,j])
+            self.period = None
+            self._edited()
+
+    def recount(self):
+        """ Counts the cells of each player on the board, after it was written directly (a pattern loaded into data)"""
+        self.count_p1 = int(np.count_nonzero(self.data == self.p1))
+        self.count_p2 = int(np.count_nonzero(self.data == self.p2))
+
+    def clear(self):
+        """ Empties the board, and starts the history of the game again"""
+        self.data = cs.board(self.N)
+        self.start()
+        self._edited()
+
+    def _edited(self):
+        ## The board was edited between two generations, the recording keeps the edits
+        if self.recorder is not None:
+            self.recorder.edit(self.data)
+
+    def start(self):
+        """ Starts the history of the game from the current board, whose cells are counted again"""
+        self.recount()
+        self.detector.reset(self.data)
+        self.period = None
+
+    def advance_frame(self):
+        """ Computes the generations shown by the next frame, stopping early if the game ends. Returns True if the
+            game is over."""
+        for _ in range(self.generations_per_frame):
+            previous = self.data # the engines return a new board, the previous one is left untouched
+            if self.metrics is None:
+                births, deaths, changed = self._generation(self.data)
+            else:
+                start = time.perf_counter()
+                births, deaths, changed = self._generation(self.data)
+                self.metrics.record_generation(time.perf_counter() - start, self.data.size,
+                                               self.count_p1 + self.count_p2, sum(births), sum(deaths))
+
+            ## Record the new board, the period is not None once a board comes back (1 for a still life). The hash is
+            ## updated from the cells the engine changed, the boards are not compared.
+            self.period = self.detector.update(previous, self.data, changed)
+            if self.recorder is not None:
+                self.recorder.record(self.data)
+
+            if self.result() is not None:
+                return True
+        return False
+
+    def result(self):
+        """ Returns the winner ('P1' or 'P2'), 'DRAW' if no player can win anymore, or None while the game goes on"""
+        if (self.count_p1 == 0) and (self.count_p2 != 0):
+            return 'P2'
+        elif (self.count_p1 != 0) and (self.count_p2 == 0):
+            return 'P1'
+        elif (self.count_p1 == 0) and (self.count_p2 == 0):
+            return 'DRAW'
+        elif self.period is not None:
+            return 'DRAW' # the board is static or oscillates, both players keep their cells forever
+        return None
+
+    def start_recording(self,path,keyframe_interval=100):
+        """ Records the current board and every following generation to path, see Recorder.Replay to read it back"""
+        self.stop_recording()
+        self.recorder = rc.Recorder(path, self.data.shape, keyframe_interval)
+        self.recorder.record(self.data)
+
+    def stop_recording(self):
+        if self.recorder is not None:
+            self.recorder.close()
+            self.recorder = None
+
+    def enable_metrics(self,metrics=None):
+        """ Measures every following generation, and returns the Metrics object receiving the measures"""
+        self.metrics = ins.Metrics() if metrics is None else metrics
+        return self.metrics
+
+    def disable_metrics(self):
+        self.metrics = None
+
+    def fork(self):
+        """ Returns a headless Versus in the same state, with its own copy of the board, random generator and history,
+            so it can be advanced in another thread (see Producer). It sends its measures to the same metrics, and
+            records nothing."""
+        other = Versus.__new__(Versus)
+        other.N = self.N
+        other.data = self.data.copy()
+        other.p1 = self.p1
+        other.p2 = self.p2
+        other.step = self.step
+        other.rng = copy.deepcopy(self.rng)
+        other.generations_per_frame = self.generations_per_frame
+        other.generation = self.generation
+        other.nbr = self.nbr
+        other.count_p1 = self.count_p1
+        other.count_p2 = self.count_p2
+        other.detector = copy.deepcopy(self.detector) # the Zobrist keys are shared, not the boards seen
+        other.period = self.period
+        other.recorder = None
+        other.metrics = self.metrics
+        return other
+
+""" Display """
+
+## Module and class of the figure of each mode, imported only when a window is requested
+GUIS = {'classic': ('ConwayClassic', 'Conway'),
+        'versus': ('ConwayVersus', 'Versus')}
+
+def gui(mode,*args,**kwargs):
+    """ Imports the matplotlib front-end of mode ('classic' or 'versus') and returns its game window, built with the
+        given arguments"""
+    module, name = GUIS[mode]
+    return getattr(importlib.import_module(module), name)(*args, **kwargs)
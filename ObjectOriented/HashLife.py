@@ -0,0 +1,269 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 13:26:10 2026
+
+@author: ChrisZeThird
+
+Hashlife engine for the classic game. The board is a quadtree whose nodes are canonicalised (two identical squares are
+the same object) and the result of advancing every node is memoised, so repeated structures are only ever computed
+once and the board can jump 2^j generations at a time. Unlike the Conway class the plane is unbounded: patterns never
+wrap around, they just make the tree grow.
+"""
+
+import numpy as np
+
+import CellStates as cs
+
+""" Classes """
+
+class Node():
+
+    """ Square of 2^k x 2^k cells. a, b, c, d are the north-west, north-east, south-west and south-east quadrants (level
+        k-1), n is the number of living cells. Leaves (k = 0) have no quadrants. Nodes are never modified, and they
+        must only be created through HashLife.join so that equal squares share the same object. """
+
+    __slots__ = ('k', 'a', 'b', 'c', 'd', 'n')
+
+    def __init__(self,k,a,b,c,d,n):
+        self.k = k
+        self.a = a
+        self.b = b
+        self.c = c
+        self.d = d
+        self.n = n
+
+
+## The two leaves, shared by every HashLife instance
+OFF = Node(0, None, None, None, None, 0)
+ON = Node(0, None, None, None, None, 1)
+
+
+class HashLife():
+
+    """ Hashlife board. Cells are addressed with array-like coordinates (i, j), row i going down and column j going
+        right, and the root square is always centered on (0, 0). max_nodes bounds the number of canonical nodes kept
+        in memory: when it is exceeded between two jumps, every node unreachable from the root is forgotten along with
+        the memoised results. """
+
+    def __init__(self,max_nodes=1000000):
+        self.max_nodes = max_nodes
+        self.nodes = {} # canonical table, (a, b, c, d) -> node
+        self.results = {} # memoised successors, (node, j) -> node
+        self.empties = [OFF] # empties[k] is the empty node of level k
+
+        self.root = self.empty(3)
+        self.generation = 0
+
+    """ Building nodes """
+
+    def join(self,a,b,c,d):
+        """ Returns the canonical node made of the quadrants a, b, c, d"""
+        key = (a, b, c, d)
+        node = self.nodes.get(key)
+        if node is None:
+            node = Node(a.k + 1, a, b, c, d, a.n + b.n + c.n + d.n)
+            self.nodes[key] = node
+        return node
+
+    def empty(self,k):
+        """ Returns the empty node of level k"""
+        while len(self.empties) <= k:
+            e = self.empties[-1]
+            self.empties.append(self.join(e, e, e, e))
+        return self.empties[k]
+
+    def centre(self,node):
+        """ Returns the node of level k+1 with node in its centre and empty borders"""
+        e = self.empty(node.k - 1)
+        return self.join(self.join(e, e, e, node.a), self.join(e, e, node.b, e),
+                         self.join(e, node.c, e, e), self.join(node.d, e, e, e))
+
+    def is_padded(self,node):
+        """ Returns True if all the living cells of node lie in its central square of half size"""
+        return (node.a.n == node.a.d.n and node.b.n == node.b.c.n
+                and node.c.n == node.c.b.n and node.d.n == node.d.a.n)
+
+    """ Rules of the Game of Life """
+
+    def life_4x4(self,node):
+        """ Returns the central 2x2 node of the 4x4 node after one generation"""
+        cells = [[node.a.a, node.a.b, node.b.a, node.b.b],
+                 [node.a.c, node.a.d, node.b.c, node.b.d],
+                 [node.c.a, node.c.b, node.d.a, node.d.b],
+                 [node.c.c, node.c.d, node.d.c, node.d.d]]
+
+        new = []
+        for i in (1, 2):
+            for j in (1, 2):
+                total = sum(cells[x][y].n for x in (i-1, i, i+1) for y in (j-1, j, j+1)) - cells[i][j].n
+                alive = (total == 3) or (total == 2 and cells[i][j].n == 1)
+                new.append(ON if alive else OFF)
+
+        return self.join(*new)
+
+    def successor(self,node,j):
+        """ Returns the central node of level k-1 of node (level k >= 2) advanced by 2^min(j, k-2) generations"""
+        j = min(j, node.k - 2)
+        key = (node, j)
+        result = self.results.get(key)
+        if result is not None:
+            return result
+
+        if node.n == 0:
+            result = node.a
+        elif node.k == 2:
+            result = self.life_4x4(node)
+        else:
+            a, b, c, d = node.a, node.b, node.c, node.d
+            join = self.join
+
+            ## The 9 overlapping sub-squares of level k-1, each advanced by 2^j generations (at most 2^(k-3))
+            c1 = self.successor(a, j)
+            c2 = self.successor(join(a.b, b.a, a.d, b.c), j)
+            c3 = self.successor(b, j)
+            c4 = self.successor(join(a.c, a.d, c.a, c.b), j)
+            c5 = self.successor(join(a.d, b.c, c.b, d.a), j)
+            c6 = self.successor(join(b.c, b.d, d.a, d.b), j)
+            c7 = self.successor(c, j)
+            c8 = self.successor(join(c.b, d.a, c.d, d.c), j)
+            c9 = self.successor(d, j)
+
+            if j < node.k - 2:
+                ## The sub-squares already went the whole way, only keep their centres
+                result = join(join(c1.d, c2.c, c4.b, c5.a), join(c2.d, c3.c, c5.b, c6.a),
+                              join(c4.d, c5.c, c7.b, c8.a), join(c5.d, c6.c, c8.b, c9.a))
+            else:
+                ## Second half of the jump, done on the 4 squares assembled from the intermediate results
+                result = join(self.successor(join(c1, c2, c4, c5), j), self.successor(join(c2, c3, c5, c6), j),
+                              self.successor(join(c4, c5, c7, c8), j), self.successor(join(c5, c6, c8, c9), j))
+
+        self.results[key] = result
+        return result
+
+    """ Advancing the board """
+
+    def jump(self,j):
+        """ Advances the board by 2^j generations at once"""
+        ## Grow the root until the pattern can't reach its borders during the jump
+        while self.root.k < j + 2 or not self.is_padded(self.root):
+            self.root = self.centre(self.root)
+        self.root = self.successor(self.centre(self.root), j)
+        self.generation += 2**j
+
+        if len(self.nodes) > self.max_nodes:
+            self.collect()
+
+    def advance(self,generations):
+        """ Advances the board by any number of generations, as a sequence of power of two jumps"""
+        j = 0
+        while generations:
+            if generations & 1:
+                self.jump(j)
+            generations >>= 1
+            j += 1
+
+    def collect(self):
+        """ Forgets every node unreachable from the root, and all the memoised results"""
+        self.results = {}
+        self.empties = [OFF]
+        keep = {}
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if node.k == 0:
+                continue
+            key = (node.a, node.b, node.c, node.d)
+            if key not in keep:
+                keep[key] = node
+                stack.extend(key)
+        self.nodes = keep
+
+    """ Reading and writing cells """
+
+    def build(self,grid,k):
+        """ Returns the node of level k holding the 0/1 array grid (2^k x 2^k)"""
+        if not grid.any():
+            return self.empty(k)
+        if k == 0:
+            return ON
+        h = 2**(k - 1)
+        return self.join(self.build(grid[:h, :h], k - 1), self.build(grid[:h, h:], k - 1),
+                         self.build(grid[h:, :h], k - 1), self.build(grid[h:, h:], k - 1))
+
+    @classmethod
+    def from_array(cls,grid,top=0,left=0,max_nodes=1000000):
+        """ Returns a HashLife board holding the living cells (value 1) of grid, cell grid[i,j] being placed at
+            (top + i, left + j)"""
+        board = cls(max_nodes)
+        grid = np.asarray(grid) == 1
+        N, M = grid.shape
+
+        ## The root square, centered on (0, 0), must cover the array
+        extent = max(abs(top), abs(left), abs(top + N), abs(left + M), 4)
+        k = int(extent - 1).bit_length() + 1
+        half = 2**(k - 1)
+
+        square = np.zeros((2**k, 2**k), dtype=bool)
+        square[top + half:top + half + N, left + half:left + half + M] = grid
+        board.root = board.build(square, k)
+
+        return board
+
+    def cells(self,top=None,left=None,N=None,M=None):
+        """ Yields the (i, j) coordinates of every living cell, or only of those in the N x M window whose top-left
+            cell is (top, left) when it is given"""
+        half = 2**(self.root.k - 1)
+        stack = [(self.root, -half, -half)]
+        while stack:
+            node, i, j = stack.pop()
+            size = 2**node.k
+            if node.n == 0:
+                continue
+            if top is not None and (i >= top + N or j >= left + M or i + size <= top or j + size <= left):
+                continue # the node lies outside the window
+            if node.k == 0:
+                yield i, j
+                continue
+            h = size // 2
+            stack.extend(((node.a, i, j), (node.b, i, j + h), (node.c, i + h, j), (node.d, i + h, j + h)))
+
+    def to_array(self,top,left,N,M=None,dtype=cs.DTYPE):
+        """ Returns the N x M window of the board whose top-left cell is (top, left), as a dense array of 0 and 1"""
+        M = N if M is None else M
+        grid = np.zeros((N, M), dtype=dtype)
+        for i, j in self.cells(top, left, N, M):
+            grid[i - top, j - left] = 1
+        return grid
+
+    def bounding_box(self):
+        """ Returns (top, left, bottom, right) of the living cells, bounds included, or None if the board is empty. The
+            box of every distinct node is found once from the boxes of its children, the cells are never listed."""
+        box = self.node_box(self.root, {})
+        if box is None:
+            return None
+        half = 2**(self.root.k - 1)
+        return tuple(x - half for x in box)
+
+    def node_box(self,node,boxes):
+        """ Returns the (top, left, bottom, right) box of the living cells of node relative to its top-left cell, or
+            None if it is empty. boxes keeps the box of the nodes already seen."""
+        if node.n == 0:
+            return None
+        if node.k == 0:
+            return (0, 0, 0, 0)
+        if node in boxes:
+            return boxes[node]
+
+        h = 2**(node.k - 1)
+        parts = []
+        for child, di, dj in ((node.a, 0, 0), (node.b, 0, h), (node.c, h, 0), (node.d, h, h)):
+            box = self.node_box(child, boxes)
+            if box is not None:
+                parts.append((box[0] + di, box[1] + dj, box[2] + di, box[3] + dj))
+        box = (min(p[0] for p in parts), min(p[1] for p in parts), max(p[2] for p in parts), max(p[3] for p in parts))
+        boxes[node] = box
+        return box
+
+    def population(self):
+        """ Returns the number of living cells"""
+        return self.root.n
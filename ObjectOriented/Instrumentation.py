@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Wed Oct 21 10:12:40 2026
+
+@author: ChrisZeThird
+
+Instrumentation of the simulations. A Metrics object receives one record per generation (compute time, population,
+births and deaths) and per rendering stage (time spent in img.set_data and in drawing the canvas), keeps the latest
+ones in a rolling window and forwards every record to pluggable sinks. The games only measure anything when a Metrics
+object is attached to them (see Conway.enable_metrics), so instrumentation costs nothing when it is disabled.
+
+SamplingProfiler periodically samples the stack of a thread to show where the time goes without slowing it down much.
+"""
+
+import json
+import sys
+import threading
+import time
+from collections import Counter, deque
+
+import numpy as np
+
+""" Metrics """
+
+class Metrics():
+
+    """ Rolling metrics over the last window generations and frames. Every sink is called with the kind of record
+        ('generation' or 'render') and the record itself, a dict. """
+
+    def __init__(self,window=100,sinks=()):
+        self.generations = deque(maxlen=window)
+        self.renders = deque(maxlen=window)
+        self.sinks = list(sinks)
+        self.total = 0 # number of generations measured since the creation
+
+    def publish(self,kind,record):
+        for sink in self.sinks:
+            sink(kind, record)
+
+    def record_generation(self,duration,cells,population,births,deaths):
+        """ Records a generation that took duration seconds to compute over cells cells"""
+        record = {'time': time.perf_counter(), 'duration': duration, 'cells': cells,
+                  'population': population, 'births': births, 'deaths': deaths}
+        self.generations.append(record)
+        self.total += 1
+        self.publish('generation', record)
+
+    def measure_step(self,old,new,duration):
+        """ Records a generation of the classic game from the boards before and after it"""
+        alive_old = (old == 1)
+        alive_new = (new == 1)
+        births = int(np.count_nonzero(alive_new & ~alive_old))
+        deaths = int(np.count_nonzero(alive_old & ~alive_new))
+        self.record_generation(duration, new.size, int(np.count_nonzero(alive_new)), births, deaths)
+
+    def record_render(self,stage,duration):
+        """ Records the time spent in a rendering stage ('set_data' or 'draw')"""
+        record = {'time': time.perf_counter(), 'stage': stage, 'duration': duration}
+        self.renders.append(record)
+        self.publish('render', record)
+
+    def summary(self):
+        """ Returns a dict of the rolling metrics: generations and cells computed per second of compute time, the
+            generations per second of wall time, the last population, the mean births and deaths, the mean time of
+            each rendering stage in ms, and whether the run is bound by compute or render"""
+        summary = {'generations': self.total}
+        if self.generations:
+            gens = list(self.generations)
+            compute = sum(g['duration'] for g in gens)
+            elapsed = gens[-1]['time'] - gens[0]['time']
+            summary.update({
+                'generations_per_s': len(gens) / compute if compute else float('inf'),
+                'wall_generations_per_s': (len(gens) - 1) / elapsed if elapsed else None,
+                'cells_per_s': sum(g['cells'] for g in gens) / compute if compute else float('inf'),
+                'population': gens[-1]['population'],
+                'births': float(np.mean([g['births'] for g in gens])),
+                'deaths': float(np.mean([g['deaths'] for g in gens])),
+                'compute_ms': 1000 * compute / len(gens)})
+
+        stages = {}
+        for r in self.renders:
+            stages.setdefault(r['stage'], []).append(r['duration'])
+        for stage, durations in stages.items():
+            summary[f'{stage}_ms'] = 1000 * float(np.mean(durations))
+
+        ## Compare the compute and render time of a generation, a frame showing several generations
+        if self.generations and stages:
+            gens_per_frame = max(1, len(self.generations) / max(1, len(stages.get('draw', stages.get('set_data')))))
+            render = sum(summary[f'{stage}_ms'] for stage in stages)
+            summary['bound'] = 'compute' if summary['compute_ms'] * gens_per_frame > render else 'render'
+
+        return summary
+
+""" Sinks """
+
+class JsonlSink():
+
+    """ Sink appending every record to a JSONL file, with its kind. Close it (or use it as a context manager) once
+        the metrics are no longer fed. """
+
+    def __init__(self,path):
+        self.file = open(path, 'a')
+
+    def __call__(self,kind,record):
+        self.file.write(json.dumps({'kind': kind, **record}) + '\n')
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self,*exc):
+        self.close()
+
+def jsonl_sink(path):
+    """ Returns a JsonlSink appending every record to path"""
+    return JsonlSink(path)
+
+def print_sink(metrics,every=100):
+    """ Returns a sink printing the summary of metrics every given number of generations"""
+    def sink(kind, record):
+        if kind == 'generation' and metrics.total % every == 0:
+            print(', '.join(f'{k}={v:.4g}' if isinstance(v, float) else f'{k}={v}'
+                            for k, v in metrics.summary().items()))
+    return sink
+
+""" Profiling """
+
+class SamplingProfiler():
+
+    """ Samples the stack of a thread (the calling thread by default) every interval seconds from a background thread.
+        Counts how often each function is on top of the stack (self time) and anywhere in it (total time). """
+
+    def __init__(self,interval=0.005,thread_id=None):
+        self.interval = interval
+        self.thread_id = threading.get_ident() if thread_id is None else thread_id
+        self.own = Counter()
+        self.inclusive = Counter()
+        self.samples = 0
+        self.running = False
+        self.thread = None
+
+    def start(self):
+        self.running = True
+        self.thread = threading.Thread(target=self.sample, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.running = False
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    def sample(self):
+        while self.running:
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.samples += 1
+                self.own[self.location(frame)] += 1
+                seen = set()
+                while frame is not None:
+                    location = self.location(frame)
+                    if location not in seen:
+                        seen.add(location)
+                        self.inclusive[location] += 1
+                    frame = frame.f_back
+            time.sleep(self.interval)
+
+    @staticmethod
+    def location(frame):
+        code = frame.f_code
+        return f'{code.co_filename}:{code.co_firstlineno}({code.co_name})'
+
+    def report(self,top=15):
+        """ Returns the top functions as text, with their share of the samples"""
+        lines = [f'{self.samples} samples', f'{"self":>6} {"total":>6}  function']
+        for location, count in self.own.most_common(top):
+            lines.append(f'{100*count/self.samples:5.1f}% {100*self.inclusive[location]/self.samples:5.1f}%  {location}')
+        return '\n'.join(lines)
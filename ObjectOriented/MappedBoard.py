@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 24 15:37:02 2026
+
+@author: ChrisZeThird
+
+Classic boards too large for the memory, stored in memory-mapped files on disk. The board is stepped band of rows by
+band of rows: a band is read with the halo rows just above and below it (wrapping around the board like
+ConwayEngine.step), its next generation is computed in memory with ConwayEngine.step_rows and written into another
+file, so only a band is ever held in memory whatever the size of the board.
+
+A board is a directory holding three files of N x M state codes and a small header (board.json) giving the shape, the
+generation and the file holding it. A generation is always written into a file that is neither the current one nor
+the last checkpoint, so a checkpoint is only flushing the current file to disk and replacing the header, and a run
+that stops (or crashes) in the middle of a step resumes from the last checkpoint by opening the directory again:
+
+    board = MappedBoard('soup', shape=(100000, 100000))   # 3 x 10 GB files
+    board.randomize(0.3, seed=1)
+    for _ in range(100):
+        board.advance(10)
+        board.checkpoint()
+"""
+
+import json
+import os
+
+import numpy as np
+
+import ConwayEngine as ce
+import CellStates as cs
+
+HEADER = 'board.json'
+FILES = ('a.u8', 'b.u8', 'c.u8')
+
+## Memory given to a band by default, the band and the temporary arrays of its step taking about 16 bytes per cell
+BAND_MEMORY = 256 * 2**20
+
+""" Classes """
+
+class MappedBoard():
+
+    """ Board stored in the directory path. An existing board is opened where its last checkpoint left it, otherwise
+        an empty board of the given shape (N, M) is created. band is the number of rows stepped at once, chosen to use
+        about BAND_MEMORY bytes by default. randomize and load edit the current generation, never the last checkpoint:
+        call checkpoint after them to keep them. """
+
+    def __init__(self,path,shape=None,band=None):
+        self.path = path
+        header = os.path.join(path, HEADER)
+
+        if os.path.exists(header):
+            with open(header) as file:
+                state = json.load(file)
+            self.shape = tuple(state['shape'])
+            self.generation = state['generation']
+            self.current = state['current']
+            mode = 'r+'
+        else:
+            if shape is None:
+                raise ValueError(f'{path} holds no board, give the shape of a new one')
+            os.makedirs(path, exist_ok=True)
+            self.shape = (shape, shape) if np.isscalar(shape) else tuple(shape)
+            self.generation = 0
+            self.current = 0
+            mode = 'w+' # sparse files of dead cells, nothing is written yet
+
+        self.boards = [np.memmap(os.path.join(path, name), dtype=cs.DTYPE, mode=mode, shape=self.shape)
+                       for name in FILES]
+        self.saved = self.current # file of the last checkpoint, never written over
+        if mode == 'w+':
+            self.checkpoint()
+
+        N, M = self.shape
+        self.band = band or int(min(N, max(1, BAND_MEMORY // (16 * M))))
+
+    @property
+    def data(self):
+        """ Returns the current generation, as a memory-mapped array (reading it only loads the rows read)"""
+        return self.boards[self.current]
+
+    def bands(self):
+        """ Yields the (first, last excluded) rows of every band"""
+        N = self.shape[0]
+        for r0 in range(0, N, self.band):
+            yield r0, min(r0 + self.band, N)
+
+    def spare(self):
+        """ Returns the index of the file that is neither the current one nor the last checkpoint"""
+        return next(k for k in range(len(FILES)) if k not in (self.current, self.saved))
+
+    def step(self):
+        """ Advances the board by one generation, band by band"""
+        target = self.spare()
+        grid, out = self.boards[self.current], self.boards[target]
+        N = self.shape[0]
+
+        for r0, r1 in self.bands():
+            ## The band and its halo rows, the rows above the first one and below the last one wrapping around
+            rows = np.empty((r1 - r0 + 2, self.shape[1]), dtype=cs.DTYPE)
+            rows[0] = grid[(r0 - 1) % N]
+            rows[1:-1] = grid[r0:r1]
+            rows[-1] = grid[r1 % N]
+            out[r0:r1] = ce.step_rows(rows)
+
+        self.current = target
+        self.generation += 1
+
+    def advance(self,generations):
+        """ Advances the board by the given number of generations"""
+        for _ in range(generations):
+            self.step()
+
+    def checkpoint(self):
+        """ Makes the current generation the one the board is opened at, once it is safely on disk"""
+        self.boards[self.current].flush()
+        with open(os.path.join(self.path, FILES[self.current]), 'rb+') as file:
+            os.fsync(file.fileno())
+
+        ## The header is replaced in one go, a crash leaves either the old or the new one
+        state = {'shape': list(self.shape), 'generation': self.generation, 'current': self.current}
+        header = os.path.join(self.path, HEADER)
+        with open(header + '.tmp', 'w') as file:
+            json.dump(state, file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(header + '.tmp', header)
+        self.saved = self.current
+
+    def editable(self,copy=True):
+        """ Returns the current generation, ready to be edited. While it is the last checkpoint, the spare file becomes
+            the current one, the current generation being copied into it band by band if copy is True."""
+        if self.current == self.saved:
+            target = self.spare()
+            if copy:
+                for r0, r1 in self.bands():
+                    self.boards[target][r0:r1] = self.boards[self.current][r0:r1]
+            self.current = target
+        return self.boards[self.current]
+
+    def randomize(self,density=0.5,seed=None):
+        """ Fills the current generation with a random soup, band by band"""
+        rng = np.random.default_rng(seed)
+        grid = self.editable(copy=False) # every cell is written over
+        for r0, r1 in self.bands():
+            grid[r0:r1] = rng.random((r1 - r0, self.shape[1]), dtype=np.float32) < density
+
+    def load(self,pattern,top=0,left=0):
+        """ Writes the array pattern into the current generation, its top left cell at [top, left]"""
+        pattern = cs.as_states(pattern)
+        self.editable()[top:top + pattern.shape[0], left:left + pattern.shape[1]] = pattern
+
+    def population(self):
+        """ Returns the number of living cells, counted band by band"""
+        grid = self.boards[self.current]
+        return sum(int(np.count_nonzero(grid[r0:r1] == cs.ALIVE)) for r0, r1 in self.bands())
+
+    def to_array(self,top=0,left=0,rows=None,cols=None):
+        """ Returns a copy of the rows x cols window whose top left cell is [top, left] (the whole board by default)"""
+        rows = self.shape[0] - top if rows is None else rows
+        cols = self.shape[1] - left if cols is None else cols
+        return np.array(self.boards[self.current][top:top + rows, left:left + cols])
+
+    def close(self):
+        """ Releases the files (they are unmapped once no array refers to them), the board can be opened again at its
+            last checkpoint"""
+        self.boards = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self,*exc):
+        self.close()
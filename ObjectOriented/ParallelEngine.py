@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 17:05:31 2026
+
+@author: ChrisZeThird
+
+Multi-core stepping for the classic game. The board lives in two shared memory buffers (current and next generation)
+that every worker of a process pool maps once, so nothing but a few integers is pickled per generation. The board is
+split in bands of rows (tiles spanning the whole width), each worker reads its band plus the halo row above and below
+from the current buffer and writes the next generation of its band into the other buffer, then the buffers are
+swapped. The result is exactly the torus of ConwayEngine.step.
+"""
+
+import os
+import sys
+import time
+from multiprocessing import Pool
+from multiprocessing import resource_tracker
+from multiprocessing import shared_memory
+
+import numpy as np
+
+import ConwayEngine as ce
+import CellStates as cs
+
+""" Worker side """
+
+## Boards mapped by the worker process, set by _attach
+_boards = None
+_shm = None
+
+def _attach(names, shape):
+    """ Pool initializer, maps the two shared buffers in the worker. The buffers belong to the ParallelBoard which
+        unlinks them, so the worker keeps them out of the resource tracker: it would unlink them a second time and
+        warn about leaked memory when the pool stops."""
+    global _boards, _shm
+    if sys.version_info >= (3, 13):
+        _shm = [shared_memory.SharedMemory(name=name, track=False) for name in names]
+    else:
+        _shm = [shared_memory.SharedMemory(name=name) for name in names]
+        for shm in _shm:
+            resource_tracker.unregister(shm._name, 'shared_memory') # registered by the constructor
+    _boards = [np.ndarray(shape, dtype=np.uint8, buffer=shm.buf) for shm in _shm]
+
+def _step_tile(args):
+    """ Computes the next generation of rows [r0, r1) of board src into board 1 - src"""
+    r0, r1, src = args
+    grid = _boards[src]
+    N = grid.shape[0]
+
+    ## The band with the halo rows just above and below it: a view of the shared buffer inside the board, only the
+    ## bands on the top and bottom edges copy their rows to wrap around
+    if 0 < r0 and r1 < N:
+        rows = grid[r0 - 1:r1 + 1]
+    else:
+        rows = np.empty((r1 - r0 + 2, grid.shape[1]), dtype=grid.dtype)
+        rows[0] = grid[(r0 - 1) % N]
+        rows[1:-1] = grid[r0:r1]
+        rows[-1] = grid[r1 % N]
+    _boards[1 - src][r0:r1] = ce.step_rows(rows)
+
+""" Classes """
+
+class ParallelBoard():
+
+    """ Board of the classic game stepped by a pool of worker processes. grid is the initial configuration, workers
+        the number of processes (os.cpu_count() by default) and tiles the number of row bands (one per worker by
+        default). Use it as a context manager, or call close, to release the processes and the shared memory. """
+
+    def __init__(self,grid,workers=None,tiles=None):
+        grid = np.asarray(grid)
+        self.shape = grid.shape
+        self.generation = 0
+
+        ## Two shared buffers, the current generation is self.boards[self.src]
+        size = max(grid.size, 1)
+        self.shm = [shared_memory.SharedMemory(create=True, size=size) for _ in range(2)]
+        self.boards = [np.ndarray(self.shape, dtype=np.uint8, buffer=shm.buf) for shm in self.shm]
+        self.boards[0][:] = (grid == 1)
+        self.src = 0
+
+        workers = workers or os.cpu_count()
+        self.pool = Pool(workers, initializer=_attach, initargs=([shm.name for shm in self.shm], self.shape))
+
+        ## Split the rows in bands of (almost) equal size
+        tiles = tiles or workers
+        bounds = np.linspace(0, self.shape[0], min(tiles, self.shape[0]) + 1).astype(int)
+        self.tiles = list(zip(bounds[:-1].tolist(), bounds[1:].tolist()))
+
+    def step(self):
+        """ Advances the board by one generation"""
+        self.pool.map(_step_tile, [(r0, r1, self.src) for r0, r1 in self.tiles])
+        self.src = 1 - self.src
+        self.generation += 1
+
+    def advance(self,generations):
+        """ Advances the board by the given number of generations"""
+        for _ in range(generations):
+            self.step()
+
+    def to_array(self,dtype=cs.DTYPE):
+        """ Returns a copy of the current generation as a dense array of 0 and 1"""
+        return self.boards[self.src].astype(dtype)
+
+    def close(self):
+        """ Stops the workers and releases the shared memory"""
+        if self.pool is None:
+            return
+        self.pool.terminate()
+        self.pool.join()
+        self.pool = None
+        self.boards = None
+        for shm in self.shm:
+            shm.close()
+            if sys.version_info < (3, 13):
+                ## Workers sharing the resource tracker of this process took the buffers out of it when they mapped
+                ## them, they are registered again (at most once) so that unlink finds them
+                resource_tracker.register(shm._name, 'shared_memory')
+            shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self,*exc):
+        self.close()
+
+""" Measuring the speedup """
+
+def speedup(N=4096,workers=(1, 2, 4, 8),generations=20,density=0.5,seed=0):
+    """ Returns a list of (workers, generations per second, speedup over one worker) for an N x N random soup"""
+    grid = (np.random.default_rng(seed).random((N, N)) < density).astype(np.uint8)
+
+    results = []
+    for n in workers:
+        with ParallelBoard(grid, workers=n) as board:
+            board.step() # warm up, the workers map the buffers on their first task
+            start = time.perf_counter()
+            board.advance(generations)
+            rate = generations / (time.perf_counter() - start)
+        results.append((n, rate, rate / results[0][1] if results else 1.0))
+
+    return results
+
+if __name__ == '__main__':
+    for n, rate, gain in speedup():
+        print(f'{n} workers: {rate:.2f} generations/s, speedup x{gain:.2f}')
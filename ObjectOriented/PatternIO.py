@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Tue Oct 20 09:41:26 2026
+
+@author: ChrisZeThird
+
+Reading and writing patterns in the standard formats: RLE (.rle), plaintext (.cells) and Macrocell (.mc). Files are
+read line by line, and RLE and plaintext patterns are turned into runs of living cells (row, column, length) that are
+written straight into a board array as slices, so even multi-megabyte patterns never become a Python list of cells.
+Macrocell files describe a quadtree and are loaded as a HashLife board.
+
+Any array can receive a pattern, such as Conway.data or Versus.data (with value=CellStates.P1 or P2 to place the cells
+of a player):
+
+    load('gosper.rle', game.data, top=5, left=5)
+"""
+
+import re
+
+import numpy as np
+
+import HashLife as hl
+import CellStates as cs
+
+""" Reading runs of living cells """
+
+RLE_TOKEN = re.compile(r'(\d*)([p-y]?[A-X]|[^\d\s])') # the states past X of multi-state files take two characters
+RLE_HEADER = re.compile(r'\s*x\s*=\s*(\d+)\s*,\s*y\s*=\s*(\d+)')
+
+def rle_header(path):
+    """ Returns the (width, height) given by the header line of an RLE file, the first line that is neither a comment
+        nor blank, or None if that line is not a header"""
+    with open(path) as f:
+        for line in f:
+            if line.startswith('#') or not line.strip():
+                continue
+            match = RLE_HEADER.match(line)
+            return (int(match.group(1)), int(match.group(2))) if match else None
+    return None
+
+def rle_runs(path):
+    """ Yields the (row, column, length) runs of living cells of an RLE file. Every state other than dead ('b' or '.')
+        counts as living, so multi-state patterns ('A' to 'X', then 'pA' to 'yO') are read as their living cells."""
+    i = j = 0
+    with open(path) as f:
+        for line in f:
+            if line.startswith('#') or RLE_HEADER.match(line):
+                continue
+            for count, tag in RLE_TOKEN.findall(line):
+                n = int(count) if count else 1
+                if tag == '!':
+                    return
+                elif tag == '$':
+                    i += n
+                    j = 0
+                elif tag in 'b.':
+                    j += n
+                else:
+                    yield i, j, n
+                    j += n
+
+def plaintext_runs(path):
+    """ Yields the (row, column, length) runs of living cells ('O' or '*') of a plaintext file"""
+    i = 0
+    with open(path) as f:
+        for line in f:
+            if line.startswith('!'):
+                continue
+            for match in re.finditer(r'[O*]+', line):
+                yield i, match.start(), match.end() - match.start()
+            i += 1
+
+def plaintext_size(path):
+    """ Returns the (width, height) of a plaintext pattern"""
+    width = height = 0
+    with open(path) as f:
+        for line in f:
+            if not line.startswith('!'):
+                width = max(width, len(line.rstrip()))
+                height += 1
+    return width, height
+
+""" Loading into a board """
+
+def fill(grid,runs,value=1,top=0,left=0):
+    """ Writes value in grid for every run of living cells, shifted by (top, left). Raises a ValueError if a run goes
+        outside of grid."""
+    N, M = grid.shape
+    for i, j, n in runs:
+        i, j = i + top, j + left
+        if not (0 <= i < N and 0 <= j and j + n <= M):
+            raise ValueError(f'the pattern does not fit in the {N}x{M} board at ({top}, {left})')
+        grid[i, j:j + n] = value
+    return grid
+
+def load(path,grid=None,value=1,top=0,left=0,dtype=cs.DTYPE):
+    """ Loads the pattern of an .rle, .cells or .mc file into grid, its top-left corner at [top, left], and returns
+        grid. If grid is None, a new array just large enough for the pattern is created."""
+    path = str(path)
+    if path.endswith('.mc'):
+        board = read_macrocell(path)
+        box = board.bounding_box() # found from the quadtree, the cells are then streamed into grid
+        if box is None:
+            return np.zeros((0, 0), dtype=dtype) if grid is None else grid
+        if grid is None:
+            grid = np.zeros((box[2] - box[0] + 1, box[3] - box[1] + 1), dtype=dtype)
+        runs = ((i - box[0], j - box[1], 1) for i, j in board.cells())
+        return fill(grid, runs, value, top, left)
+
+    if path.endswith('.cells'):
+        size, runs = plaintext_size, plaintext_runs
+    else:
+        size, runs = rle_header, rle_runs
+
+    if grid is None:
+        shape = size(path)
+        if shape is None:
+            raise ValueError(f'{path} has no RLE header line (x = width, y = height), give the grid to load it into')
+        width, height = shape
+        grid = np.zeros((height, width), dtype=dtype)
+    return fill(grid, runs(path), value, top, left)
+
+""" Macrocell """
+
+def read_macrocell(path,max_nodes=1000000):
+    """ Returns a HashLife board holding the pattern of a Macrocell file. Each line of the file is a node referring to
+        the nodes of the previous lines, only the list of nodes read so far is kept in memory."""
+    board = hl.HashLife(max_nodes)
+    nodes = [None] # nodes[n] is the node of the n-th line, 0 stands for an empty node
+
+    with open(path) as f:
+        for line in f:
+            if line.startswith('[') or line.startswith('#') or not line.strip():
+                continue
+            if line[0] in '.*$':
+                ## Leaf of 8x8 cells, rows separated by '$', '.' dead and '*' alive
+                leaf = np.zeros((8, 8), dtype=bool)
+                for i, row in enumerate(line.strip().split('$')[:8]):
+                    leaf[i, :len(row)] = [c == '*' for c in row[:8]]
+                nodes.append(board.build(leaf, 3))
+            else:
+                k, *children = (int(x) for x in line.split())
+                quads = [nodes[n] if n else board.empty(k - 1) for n in children]
+                nodes.append(board.join(*quads))
+
+    if len(nodes) > 1:
+        board.root = nodes[-1]
+    while board.root.k < 3:
+        board.root = board.centre(board.root)
+    return board
+
+def write_macrocell(path,board):
+    """ Writes a HashLife board to a Macrocell file, every distinct node being written once"""
+    index = {} # node -> line number
+    with open(path, 'w') as f:
+        f.write('[M2] (Game-Of-Life)\n#R B3/S23\n')
+
+        ## Children are written before their parents, with an explicit stack to avoid deep recursion
+        stack = [(board.root, False)]
+        while stack:
+            node, ready = stack.pop()
+            if node in index or node.n == 0:
+                continue
+            if node.k == 3:
+                cells = np.zeros((8, 8), dtype=bool)
+                for i, j in _leaf_cells(node):
+                    cells[i, j] = True
+                rows = [''.join('*' if c else '.' for c in row).rstrip('.') for row in cells]
+                f.write('$'.join(rows).rstrip('$') + '$\n')
+            elif not ready:
+                stack.append((node, True))
+                stack.extend((child, False) for child in (node.d, node.c, node.b, node.a))
+                continue
+            else:
+                f.write(' '.join([str(node.k)] + [str(index.get(c, 0)) for c in (node.a, node.b, node.c, node.d)])
+                        + '\n')
+            index[node] = len(index) + 1
+
+def _leaf_cells(node,i=0,j=0):
+    """ Yields the (i, j) coordinates of the living cells of node relative to its top-left corner"""
+    if node.n == 0:
+        return
+    if node.k == 0:
+        yield i, j
+        return
+    h = 2**(node.k - 1)
+    for child, di, dj in ((node.a, 0, 0), (node.b, 0, h), (node.c, h, 0), (node.d, h, h)):
+        yield from _leaf_cells(child, i + di, j + dj)
+
+""" Writing """
+
+def write_rle(path,grid,value=1,rule='B3/S23'):
+    """ Writes the cells of grid equal to value to an RLE file, row by row, lines being kept under 70 characters"""
+    grid = np.asarray(grid)
+    N, M = grid.shape
+    with open(path, 'w') as f:
+        f.write(f'x = {M}, y = {N}, rule = {rule}\n')
+        line = ''
+        row = 0 # row reached by the runs written so far
+
+        def put(token):
+            nonlocal line
+            if len(line) + len(token) > 70:
+                f.write(line + '\n')
+                line = ''
+            line += token
+
+        for i in range(N):
+            ## Boundaries of the runs of living cells of the row
+            alive = np.concatenate(([False], grid[i] == value, [False]))
+            edges = np.flatnonzero(alive[1:] != alive[:-1])
+            if len(edges) == 0:
+                continue
+            if i > row:
+                put(f'{i - row if i - row > 1 else ""}$') # empty rows are skipped by a single '$' run
+            row = i
+            j = 0
+            for start, end in zip(edges[::2], edges[1::2]):
+                if start > j:
+                    put(f'{start - j if start - j > 1 else ""}b')
+                put(f'{end - start if end - start > 1 else ""}o')
+                j = end
+        put('!')
+        f.write(line + '\n')
+
+def write_plaintext(path,grid,value=1,name=None):
+    """ Writes the cells of grid equal to value to a plaintext file"""
+    with open(path, 'w') as f:
+        if name:
+            f.write(f'!Name: {name}\n')
+        for row in np.asarray(grid) == value:
+            f.write(''.join('O' if c else '.' for c in row).rstrip('.') + '\n')
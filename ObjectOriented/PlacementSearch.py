@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Fri Oct 23 17:45:12 2026
+
+@author: ChrisZeThird
+
+Search of the best placement of a player of the 1v1 mod. Every candidate placement (a list of [i, j] cells) is scored
+by playing it against placements drawn from an opponent distribution, each match being played to the end with the
+Versus rules (see Tournament.play) over a pool of processes. A win counts 1, a draw 1/2 and a loss 0.
+
+Candidates are played in rounds, and a candidate is dropped as soon as its Hoeffding confidence interval is entirely
+below the one of the best candidate, so the search stops early when the scores are clearly apart. A match only depends
+on the board and the seed breaking the 3-3 ties, so the seeds are drawn among a fixed set and the result of every
+match is kept in a transposition table: a match that was already played (in this search or a previous one) is never
+played again, as long as it is among the table_size matches used most recently.
+
+    with PlacementSearch(20, 10, RandomPlacement(20, 10, rows=(0, 10)), player='P2') as search:
+        results = search.evaluate(candidates)
+"""
+
+import collections
+import functools
+import math
+from multiprocessing import Pool
+
+import numpy as np
+
+import Tournament as tn
+
+""" Opponent distributions """
+
+class RandomPlacement():
+
+    """ Distribution of the placements of nbr random cells on an N x N board, taken between the rows
+        rows[0] (included) and rows[1] (excluded) if given, like a player filling their half of the board. """
+
+    def __init__(self,N,nbr,rows=None):
+        self.N = N
+        self.nbr = nbr
+        self.rows = (0, N) if rows is None else rows
+
+    def __call__(self,rng):
+        """ Returns a placement drawn with the numpy Generator rng"""
+        top, bottom = self.rows
+        cells = rng.choice((bottom - top) * self.N, size=self.nbr, replace=False)
+        return [[top + int(c) // self.N, int(c) % self.N] for c in cells]
+
+
+class Choice():
+
+    """ Distribution picking one of the given placements uniformly. """
+
+    def __init__(self,placements):
+        self.placements = list(placements)
+
+    def __call__(self,rng):
+        return self.placements[rng.integers(len(self.placements))]
+
+""" Classes """
+
+## Points won by the searching player for every winner of a match
+POINTS = {'P1': {'P1': 1.0, 'P2': 0.0, 'DRAW': 0.5},
+          'P2': {'P1': 0.0, 'P2': 1.0, 'DRAW': 0.5}}
+
+class PlacementSearch():
+
+    """ Scores the placements of player ('P1' or 'P2') on an N x N board with nbr cells per player, against the
+        placements returned by opponents (a function of a numpy Generator, such as RandomPlacement). The seeds of the
+        matches are drawn among range(seeds). Matches are played by a pool of workers processes (all cores by default,
+        1 plays them in this process), and are drawn at max_generations. The transposition table keeps the winners of
+        the table_size matches used most recently. """
+
+    def __init__(self,N,nbr,opponents,player='P1',workers=None,seeds=64,max_generations=1000,seed=None,chunksize=16,
+                 table_size=1000000):
+        self.N = N
+        self.nbr = nbr
+        self.opponents = opponents
+        self.player = player
+        self.seeds = seeds
+        self.max_generations = max_generations
+        self.chunksize = chunksize
+        self.rng = np.random.default_rng(seed)
+
+        self.pool = None if workers == 1 else Pool(workers)
+        self.table = collections.OrderedDict() # (board, seed) -> winner, least recently used match first
+        self.table_size = table_size
+        self.played = 0 # matches actually played, the others were found in the table
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self,*exc):
+        self.close()
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.close()
+            self.pool.join()
+            self.pool = None
+
+    def match(self,cells):
+        """ Returns the board of a match of the placement cells against a drawn opponent, and its seed. Opponent cells
+            falling on the cells of the candidate are left out."""
+        taken = set(map(tuple, cells))
+        opponent = [c for c in self.opponents(self.rng) if tuple(c) not in taken]
+        p1, p2 = (cells, opponent) if self.player == 'P1' else (opponent, cells)
+        grid = tn.place(self.N, self.nbr, p1, p2)
+        return grid, int(self.rng.integers(self.seeds))
+
+    def play(self,matches):
+        """ Returns the winners of matches, a list of (board, seed), playing only the ones missing from the table"""
+        keys = [(grid.tobytes(), seed) for grid, seed in matches]
+        winners = {} # winners of the matches of this call, the table may forget some of them meanwhile
+        missing = {}
+        for key, (grid, seed) in zip(keys, matches):
+            if key in self.table:
+                self.table.move_to_end(key)
+                winners[key] = self.table[key]
+            elif key not in missing:
+                missing[key] = grid, seed
+
+        ## Matches are played as in a tournament, the id being the key in the table
+        tasks = [{'id': key, 'seed': seed, 'p1': np.argwhere(grid == 1).tolist(), 'p2': np.argwhere(grid == 2).tolist()}
+                 for key, (grid, seed) in missing.items()]
+        play = functools.partial(tn.play_match, N=self.N, nbr=self.nbr, max_generations=self.max_generations)
+        if self.pool is None:
+            rows = map(play, tasks)
+        else:
+            rows = self.pool.imap_unordered(play, tasks, self.chunksize)
+        for row in rows:
+            winners[row['id']] = row['winner']
+            self.table[row['id']] = row['winner']
+            if len(self.table) > self.table_size:
+                self.table.popitem(last=False) # forget the least recently used match
+        self.played += len(tasks)
+
+        return [winners[key] for key in keys]
+
+    def evaluate(self,candidates,batch=64,max_matches=4096,delta=0.05):
+        """ Scores every placement of candidates and returns one dict per candidate, best score first, with its
+            'index' in candidates, its 'cells', the number of 'matches' played, its mean 'score' and the 'low' and
+            'high' bounds of its confidence interval. Every round plays batch matches per remaining candidate, and a
+            candidate stops at max_matches. The best candidate is kept with probability 1 - delta."""
+        K = len(candidates)
+        points = POINTS[self.player]
+        total = np.zeros(K)
+        count = np.zeros(K, dtype=np.int64)
+        alive = np.ones(K, dtype=bool)
+        rounds = math.ceil(max_matches / batch)
+
+        ## Hoeffding bound for scores in [0, 1], holding for every candidate and every round at once
+        def radius(n):
+            return np.sqrt(math.log(2 * K * rounds / delta) / (2 * np.maximum(n, 1)))
+
+        for _ in range(rounds):
+            index = np.flatnonzero(alive)
+            if len(index) == 1 and count[index[0]] > 0:
+                break # the best candidate is found
+
+            matches = [self.match(candidates[k]) for k in index for _ in range(batch)]
+            winners = self.play(matches)
+            for n, k in enumerate(index):
+                total[k] += sum(points[w] for w in winners[n*batch:(n+1)*batch])
+                count[k] += batch
+
+            ## Drop the candidates that are surely worse than the best one
+            mean = total / np.maximum(count, 1)
+            low, high = mean - radius(count), mean + radius(count)
+            alive &= high >= low[alive].max()
+
+        mean = total / np.maximum(count, 1)
+        results = [{'index': k, 'cells': candidates[k], 'matches': int(count[k]), 'score': float(mean[k]),
+                    'low': float(max(0.0, mean[k] - radius(count[k]))), 'high': float(min(1.0, mean[k] + radius(count[k])))}
+                   for k in range(K)]
+        return sorted(results, key=lambda r: r['score'], reverse=True)
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 25 10:21:48 2026
+
+@author: ChrisZeThird
+
+Computation of the generations in a background thread, so that a slow generation never freezes the figure. The
+producer advances a copy of the game (see Game.Classic.fork) and puts every frame into a bounded buffer, a few frames
+ahead of the one displayed. The figure takes the frames at its own pace with consume, which never waits: when no frame
+is ready the figure simply keeps the current one. The numpy operations of the engines release the GIL on large boards,
+so the computation goes on while matplotlib draws.
+
+The displayed game always has the last word: after an edit, a reset or a pause, invalidate (or pause) throws the
+buffered frames away along with the frame being computed, and the producer starts again from a new copy of the game.
+"""
+
+import collections
+import copy
+import threading
+
+""" Classes """
+
+class Frame():
+
+    """ A frame computed ahead: the values of the FRAME attributes of the game, the boards of every generation of
+        the frame if the game is recording, and whether the game is over. """
+
+    __slots__ = ('state', 'boards', 'over')
+
+    def __init__(self,state,boards,over):
+        self.state = state
+        self.boards = boards
+        self.over = over
+
+
+class Collector():
+
+    """ Stands for the recorder of the copy of a recording game, keeping the generations of a frame until it is
+        displayed and recorded for real. """
+
+    def __init__(self):
+        self.boards = []
+
+    def record(self,codes):
+        self.boards.append(codes.copy())
+
+
+class Producer():
+
+    """ Thread computing the frames of game (a Game.Classic or Game.Versus, or a figure built on them) up to capacity
+        frames ahead. It starts paused if paused is True. Call stop once the game is closed. """
+
+    def __init__(self,game,capacity=8,paused=False):
+        self.game = game
+        self.capacity = capacity
+        self.frames = collections.deque()
+        self.condition = threading.Condition()
+
+        self.epoch = 0 # changed by every invalidation, frames of an older epoch are thrown away
+        self.worker = game.fork()
+        self.paused = paused
+        self.over = False
+        self.stopped = False
+        self.produced = 0
+        self.dropped = 0 # frames computed and then invalidated
+
+        self.thread = threading.Thread(target=self.run, name='GameProducer', daemon=True)
+        self.thread.start()
+
+    def run(self):
+        while True:
+            with self.condition:
+                while not self.stopped and (self.paused or self.over or len(self.frames) >= self.capacity):
+                    self.condition.wait()
+                if self.stopped:
+                    return
+                worker, epoch = self.worker, self.epoch
+
+            ## The frame is computed without the lock, the figure can take frames or invalidate meanwhile
+            worker.recorder = Collector() if self.game.recorder is not None else None
+            over = bool(worker.advance_frame())
+
+            ## Deep copies, a shallow copy of a random generator would share its bit generator with the worker, and a
+            ## shallow copy of a cycle detector its boards seen
+            frame = Frame({name: copy.deepcopy(getattr(worker, name)) for name in worker.FRAME},
+                          None if worker.recorder is None else worker.recorder.boards, over)
+
+            with self.condition:
+                if epoch != self.epoch:
+                    self.dropped += 1
+                    continue
+                self.frames.append(frame)
+                self.produced += 1
+                self.over = over
+
+    def consume(self):
+        """ Puts the next frame into the game and returns it, or returns None at once if no frame is ready. The boards
+            of the frame are recorded if the game is recording."""
+        with self.condition:
+            if not self.frames:
+                return None
+            frame = self.frames.popleft()
+            self.condition.notify()
+
+        for name, value in frame.state.items():
+            setattr(self.game, name, value)
+        if frame.boards is not None and self.game.recorder is not None:
+            for board in frame.boards:
+                self.game.recorder.record(board)
+        return frame
+
+    def invalidate(self):
+        """ Throws the frames computed ahead away, the next ones following the game as it is now. To call after every
+            change of the game made outside of the producer (edits, reset)."""
+        with self.condition:
+            self.epoch += 1
+            self.dropped += len(self.frames)
+            self.frames.clear()
+            self.worker = self.game.fork()
+            self.over = False
+            self.condition.notify()
+
+    def pause(self):
+        """ Stops computing frames and throws the buffered ones away, the game staying at the frame displayed"""
+        with self.condition:
+            self.paused = True
+        self.invalidate()
+
+    def resume(self):
+        with self.condition:
+            self.paused = False
+            self.condition.notify()
+
+    def stop(self):
+        """ Stops the thread without waiting for it, it ends once the frame being computed (thrown away) is done"""
+        with self.condition:
+            self.stopped = True
+            self.condition.notify()
+
+    def __len__(self):
+        return len(self.frames)
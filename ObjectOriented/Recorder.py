@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Tue Oct 20 14:18:37 2026
+
+@author: ChrisZeThird
+
+Recording and replay of simulations. Every generation is appended to a single file as a compressed record: a keyframe
+(the whole board) every keyframe_interval generations, and in between a delta holding only the cells that changed
+since the previous generation. Closing the recorder appends an index of the keyframes, so a replay can jump to any
+generation by reading one keyframe and at most keyframe_interval - 1 deltas. A file whose recording was interrupted
+before the index was written is still readable, the keyframes are then found by skipping from record to record.
+
+Cells edited between two generations (toggled or placed by a player) are appended as an edit record, a delta
+carrying the generation they were made at. The board of a generation in a replay is the one the next generation was
+computed from, with its edits.
+
+Boards are recorded as arrays of integer state codes (0 empty, 1 alive or player 1, 2 player 2).
+"""
+
+import bisect
+import struct
+import zlib
+
+import numpy as np
+
+""" File layout """
+
+MAGIC = b'GLR1'
+HEADER = struct.Struct('<4sQQI') # magic, N, M, keyframe interval
+RECORD = struct.Struct('<cQQ') # kind, generation, payload length
+TRAILER = struct.Struct('<Q4s') # offset of the index record, magic
+
+KEYFRAME = b'K'
+DELTA = b'D'
+EDIT = b'E'
+INDEX = b'I'
+
+""" Deltas """
+
+def index_dtype(shape):
+    """ Returns the dtype of the positions of the changed cells, 32 bits when the board is small enough"""
+    return '<u4' if np.prod(shape) < 2**32 else '<u8'
+
+def encode_delta(previous,codes,dtype):
+    """ Returns the positions (of the given dtype) and new states of the cells of codes that differ from previous"""
+    changed = np.flatnonzero(codes.ravel() != previous.ravel())
+    return changed.astype(dtype).tobytes() + codes.ravel()[changed].tobytes()
+
+def apply_delta(codes,payload,dtype):
+    """ Applies a delta made by encode_delta to codes, in place"""
+    n = len(payload) // (np.dtype(dtype).itemsize + 1)
+    changed = np.frombuffer(payload, dtype=dtype, count=n)
+    codes.ravel()[changed] = np.frombuffer(payload, dtype=np.uint8, offset=changed.nbytes)
+
+""" Classes """
+
+class Recorder():
+
+    """ Writes the generations of an N x M board to path. Call record with every generation in order, the first one
+        being generation 0, then close (or use the recorder as a context manager) to write the index. """
+
+    def __init__(self,path,shape,keyframe_interval=100,level=1):
+        self.shape = tuple(shape)
+        self.keyframe_interval = keyframe_interval
+        self.level = level # zlib compression level, low levels keep recording cheap
+
+        self.file = open(path, 'wb')
+        self.file.write(HEADER.pack(MAGIC, self.shape[0], self.shape[1], keyframe_interval))
+        self.keyframes = [] # (generation, offset) of every keyframe
+        self.generation = 0 # generation of the next record, that is the number of generations recorded
+        self.previous = None # copy of the last board recorded, the game goes on editing its own
+
+        ## Positions of the changed cells are stored on 32 bits when the board is small enough
+        self.index_dtype = index_dtype(self.shape)
+
+    def write(self,kind,generation,payload):
+        """ Appends a record of the given generation"""
+        data = zlib.compress(payload, self.level)
+        self.file.write(RECORD.pack(kind, generation, len(data)))
+        self.file.write(data)
+
+    def record(self,codes):
+        """ Appends the next generation, given as an array of state codes"""
+        codes = np.ascontiguousarray(codes, dtype=np.uint8)
+
+        if self.generation % self.keyframe_interval == 0:
+            self.keyframes.append((self.generation, self.file.tell()))
+            self.write(KEYFRAME, self.generation, codes.tobytes())
+        else:
+            ## Only the positions and new states of the cells that changed
+            self.write(DELTA, self.generation, encode_delta(self.previous, codes, self.index_dtype))
+
+        self.previous = codes.copy()
+        self.generation += 1
+
+    def edit(self,codes):
+        """ Appends the cells of the last generation recorded that were edited since, codes being the board as it is
+            now. Nothing is written if no cell changed or no generation was recorded yet."""
+        if self.previous is None:
+            return
+        codes = np.ascontiguousarray(codes, dtype=np.uint8)
+        payload = encode_delta(self.previous, codes, self.index_dtype)
+        if payload:
+            self.write(EDIT, self.generation - 1, payload)
+            self.previous = codes.copy()
+
+    def close(self):
+        """ Appends the index of the keyframes and closes the file. The index record holds the number of generations
+            recorded, possibly none."""
+        if self.file.closed:
+            return
+        offset = self.file.tell()
+        index = np.array(self.keyframes, dtype='<u8').reshape(-1, 2)
+        self.write(INDEX, self.generation, index.tobytes())
+        self.file.write(TRAILER.pack(offset, MAGIC))
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self,*exc):
+        self.close()
+
+
+class Replay():
+
+    """ Reads a recording made by Recorder. replay[g] (or seek(g)) returns the board of generation g, and iterating
+        yields every generation in order. """
+
+    def __init__(self,path):
+        self.file = open(path, 'rb')
+        magic, N, M, self.keyframe_interval = HEADER.unpack(self.file.read(HEADER.size))
+        if magic != MAGIC:
+            raise ValueError(f'{path} is not a recording')
+        self.shape = (N, M)
+        self.index_dtype = index_dtype(self.shape)
+
+        self.keyframes, self.generations = self.read_index()
+        self.starts = [g for g, _ in self.keyframes]
+
+    def read_record(self):
+        """ Returns (kind, generation, payload) of the record at the current position, or None at the end of a file
+            without index"""
+        head = self.file.read(RECORD.size)
+        if len(head) < RECORD.size:
+            return None
+        kind, generation, length = RECORD.unpack(head)
+        data = self.file.read(length)
+        if len(data) < length:
+            return None # record cut short by an interrupted recording
+        return kind, generation, zlib.decompress(data)
+
+    def read_index(self):
+        """ Returns the list of (generation, offset) of the keyframes and the number of generations recorded"""
+        self.file.seek(0, 2)
+        end = self.file.tell()
+        if end >= HEADER.size + TRAILER.size:
+            self.file.seek(end - TRAILER.size)
+            offset, magic = TRAILER.unpack(self.file.read(TRAILER.size))
+            if magic == MAGIC:
+                self.file.seek(offset)
+                kind, generations, payload = self.read_record()
+                index = np.frombuffer(payload, dtype='<u8').reshape(-1, 2)
+                return [tuple(map(int, row)) for row in index], generations
+
+        ## No index, the recording was interrupted: skip from record to record
+        self.file.seek(HEADER.size)
+        keyframes, generation = [], -1
+        while True:
+            offset = self.file.tell()
+            head = self.file.read(RECORD.size)
+            if len(head) < RECORD.size:
+                break
+            kind, g, length = RECORD.unpack(head)
+            if self.file.seek(length, 1) > end:
+                break
+            if kind == KEYFRAME:
+                keyframes.append((g, offset))
+            generation = g
+        return keyframes, generation + 1
+
+    def __len__(self):
+        return self.generations
+
+    def apply(self,codes,payload):
+        """ Applies the payload of a delta record to codes, in place"""
+        apply_delta(codes, payload, self.index_dtype)
+
+    def seek(self,generation):
+        """ Returns the board of the given generation as an array of state codes"""
+        if not (0 <= generation < self.generations):
+            raise IndexError(f'generation {generation} is not in the recording')
+
+        ## Closest keyframe before the generation, then the deltas up to it
+        start, offset = self.keyframes[bisect.bisect_right(self.starts, generation) - 1]
+        self.file.seek(offset)
+        kind, g, payload = self.read_record()
+        codes = np.frombuffer(payload, dtype=np.uint8).reshape(self.shape).copy()
+        while g < generation:
+            kind, g, payload = self.read_record()
+            self.apply(codes, payload) # deltas and the edits of the previous generations alike
+        self.read_edits(codes)
+        return codes
+
+    def read_edits(self,codes):
+        """ Applies to codes the edit records following the current position, in place, and stops before the next
+            record of another kind"""
+        while True:
+            offset = self.file.tell()
+            record = self.read_record()
+            if record is None or record[0] != EDIT:
+                self.file.seek(offset)
+                return
+            self.apply(codes, record[2])
+
+    def __getitem__(self,generation):
+        return self.seek(generation)
+
+    def __iter__(self):
+        """ Yields the board of every generation, reading the file once"""
+        self.file.seek(HEADER.size)
+        codes = None
+        for _ in range(self.generations):
+            kind, g, payload = self.read_record()
+            if kind == KEYFRAME:
+                codes = np.frombuffer(payload, dtype=np.uint8).reshape(self.shape).copy()
+            else:
+                self.apply(codes, payload)
+            self.read_edits(codes)
+            yield codes.copy()
+
+    def close(self):
+        self.file.close()
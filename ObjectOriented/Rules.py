@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Thu Oct 22 09:05:37 2026
+
+@author: ChrisZeThird
+
+Rules given as strings and compiled into lookup tables. A Life-like rule lists the numbers of living neighbours
+giving birth to a dead cell and letting a living cell survive, like 'B3/S23' (Conway's rule), 'B36/S23' (HighLife) or
+'B2/S' (Seeds). The older 'S/B' notation ('23/3') is read as well. A Generations rule adds a number of states C
+('B2/S/C3' or '/2/3' for Brian's Brain): a living cell that does not survive goes through the dying states 2 to C-1
+before being dead again, and only the cells of state 1 count as living neighbours.
+
+A compiled rule is a table of shape (C, 9) giving the next state of a cell from its state and its number of living
+neighbours, so a whole board is stepped with a single indexing. Tables are cached by rule string.
+"""
+
+import functools
+import re
+
+import numpy as np
+
+import ConwayEngine as ce
+import CellStates as cs
+
+""" Parsing """
+
+## Usual names of some rules
+NAMES = {'life': 'B3/S23',
+         'highlife': 'B36/S23',
+         'seeds': 'B2/S',
+         'daynight': 'B3678/S34678',
+         'briansbrain': 'B2/S/C3',
+         'starwars': 'B2/S345/C4'}
+
+BS_RULE = re.compile(r'^B([0-8]*)/S([0-8]*)(?:/C?(\d+))?$')
+SB_RULE = re.compile(r'^([0-8]*)/([0-8]*)(?:/(\d+))?$')
+
+def parse(rule):
+    """ Returns the (birth, survival, states) of a rule string, birth and survival being sorted tuples of neighbour
+        counts. Raises a ValueError if the rule can not be read."""
+    text = NAMES.get(re.sub(r'[\s&_-]', '', rule).lower(), rule).replace(' ', '').upper()
+
+    match = BS_RULE.match(text)
+    if match:
+        birth, survival, states = match.groups()
+    else:
+        match = SB_RULE.match(text)
+        if match is None:
+            raise ValueError(f'{rule!r} is not a Life-like (B3/S23) or Generations (B2/S/C3) rule')
+        survival, birth, states = match.groups()
+
+    states = int(states) if states else 2
+    if states < 2 or states > 256:
+        raise ValueError(f'{rule!r} has {states} states, between 2 and 256 are allowed')
+    return tuple(sorted(set(map(int, birth)))), tuple(sorted(set(map(int, survival)))), states
+
+""" Compiled rules """
+
+class Rule():
+
+    """ Compiled rule: table[state, living neighbours] is the next state of a cell. """
+
+    def __init__(self,birth,survival,states=2):
+        self.birth = birth
+        self.survival = survival
+        self.states = states
+
+        self.table = np.zeros((states, 9), dtype=cs.DTYPE)
+        self.table[0, list(birth)] = 1
+        self.table[1] = 2 if states > 2 else 0 # living cells that do not survive start dying
+        self.table[1, list(survival)] = 1
+        for state in range(2, states):
+            self.table[state] = (state + 1) % states # dying cells age whatever their neighbours
+
+    def __str__(self):
+        name = f'B{"".join(map(str, self.birth))}/S{"".join(map(str, self.survival))}'
+        return name if self.states == 2 else f'{name}/C{self.states}'
+
+    def __repr__(self):
+        return f'Rule({str(self)!r})'
+
+@functools.lru_cache(maxsize=None)
+def compile_rule(rule):
+    """ Returns the compiled Rule of a rule string, each rule being compiled once"""
+    return _compiled(*parse(rule))
+
+@functools.lru_cache(maxsize=None)
+def _compiled(birth,survival,states):
+    ## Different spellings of the same rule share their table
+    return Rule(birth, survival, states)
+
+""" Stepping """
+
+def lookup(table,grid,total):
+    """ Returns table[grid, total], indexing the flattened table (much faster than indexing it with two arrays)"""
+    dtype = np.uint8 if table.size <= 256 else np.intp
+    return table.ravel().take(grid.astype(dtype, copy=False) * dtype(9) + total)
+
+def step(grid,rule='B3/S23'):
+    """ Returns the next generation of grid under rule, the board wrapping around its edges like ConwayEngine.step.
+        grid can also be a stack of boards on its last two axes."""
+    table = compile_rule(rule).table
+    alive = (grid == 1).astype(np.uint8)
+    padding = [(0, 0)] * (alive.ndim - 2) + [(1, 1), (1, 1)]
+    total = ce.count_padded(np.pad(alive, padding, mode='wrap'))
+
+    return lookup(table, grid, total)
+
+def stepper(rule):
+    """ Returns an engine (a function of the grid only, like the ones of ConwayEngine.ENGINES) stepping under rule"""
+    table = compile_rule(rule).table
+    def step_rule(grid):
+        total = ce.count_neighbors(grid)
+        return lookup(table, grid, total)
+    step_rule.rule = compile_rule(rule)
+    return step_rule
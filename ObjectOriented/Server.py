@@ -0,0 +1,265 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Thu Oct 22 18:41:09 2026
+
+@author: ChrisZeThird
+
+Streaming of a running game to many clients over TCP or a Unix socket, with asyncio. The server runs a single
+Game.Classic or Game.Versus and every client receives the generations at its own frame rate as deltas (the cells that
+changed since the last frame it received, encoded like the records of Recorder). A client that does not read fast
+enough is never waited for: the frames it misses are coalesced into its next delta, and it is disconnected if it stays
+behind for too long, so the simulation never stalls.
+
+    python Server.py --mode classic --size 512 --port 8765
+
+Messages sent by the server: a HELLO (magic, N, M), then frames made of a FRAME header (kind, generation, payload
+length) followed by the zlib compressed payload, a keyframe (b'K') holding the whole board or a delta (b'D'). Clients
+send text lines: 'fps 5' sets their frame rate, 'keyframe' asks for the whole board. A command that is refused gets an
+error frame (b'X') whose payload is the reason, as text.
+"""
+
+import argparse
+import asyncio
+import math
+import struct
+import time
+import zlib
+
+import numpy as np
+
+import Game as gm
+import Recorder as rc
+import CellStates as cs
+
+""" Protocol """
+
+MAGIC = b'GLS1'
+HELLO = struct.Struct('<4sQQ') # magic, N, M
+FRAME = struct.Struct('<cQI') # kind, generation, payload length
+ERROR = b'X' # kind of the frames answering a refused command
+
+def encode_frame(kind,generation,payload,level=1):
+    """ Returns the bytes of a frame"""
+    data = zlib.compress(payload, level)
+    return FRAME.pack(kind, generation, len(data)) + data
+
+""" Classes """
+
+class Client():
+
+    """ State of a connected client: the last board it received, and the frame rate it asked for. """
+
+    def __init__(self,reader,writer,fps):
+        self.reader = reader
+        self.writer = writer
+        self.fps = fps
+        self.known = None # board as the client knows it, None until its first keyframe
+        self.generation = -1
+        self.coalesced = 0 # frames skipped because the client was behind
+        self.closed = False
+
+
+class Server():
+
+    """ Runs game, computing a frame every interval seconds (as fast as possible by default), and streams it to the
+        clients. A client is considered behind while more than max_buffer bytes are waiting to be sent to it, and is
+        disconnected after timeout seconds behind. """
+
+    def __init__(self,game,interval=0.0,fps=10,max_buffer=2**20,timeout=5.0,level=1):
+        self.game = game
+        self.interval = interval
+        self.fps = fps # default frame rate of the clients
+        self.max_buffer = max_buffer
+        self.timeout = timeout
+        self.level = level
+
+        self.index_dtype = rc.index_dtype(game.data.shape)
+        self.frame = cs.as_states(game.data).copy() # last frame, never modified once published
+        self.generation = game.generation
+        self.messages = {} # id of a board known by clients -> (board, message bringing it to the last frame)
+        self.finished = False
+        self.clients = set()
+        self.server = None
+        self.tasks = []
+
+    def advance(self):
+        """ Computes the next frame and its delta from the current one, in a worker thread so the clients are served
+            meanwhile. Returns whether the game is over, the frame, its generation and the delta."""
+        finished = bool(self.game.advance_frame()) # Versus returns True once the game is over
+        frame = cs.as_states(self.game.data).copy()
+        generation = self.game.generation
+        delta = encode_frame(rc.DELTA, generation, rc.encode_delta(self.frame, frame, self.index_dtype), self.level)
+        return finished, frame, generation, delta
+
+    async def simulate(self):
+        """ Advances the game frame after frame, until it is over"""
+        while not self.finished:
+            self.finished, frame, generation, delta = await asyncio.to_thread(self.advance)
+            self.messages = {id(self.frame): (self.frame, delta)}
+            self.frame, self.generation = frame, generation
+            await asyncio.sleep(self.interval) # lets the clients be served between two frames
+
+    def send(self,client):
+        """ Writes the current frame to client, as a delta if it knows an earlier board. A message is encoded once per
+            frame and board known, the clients that received the same frames (at the same frame rate) share it."""
+        frame, generation, known = self.frame, self.generation, client.known
+        board, message = self.messages.get(id(known), (None, None))
+        if message is None or board is not known:
+            if known is None:
+                message = encode_frame(rc.KEYFRAME, generation, frame.tobytes(), self.level)
+            else:
+                payload = rc.encode_delta(known, frame, self.index_dtype)
+                message = encode_frame(rc.DELTA, generation, payload, self.level)
+            self.messages[id(known)] = (known, message)
+        client.writer.write(message)
+        client.known = frame
+        client.generation = generation
+
+    async def listen(self,client):
+        """ Reads the commands of client until it disconnects"""
+        try:
+            while True:
+                line = await client.reader.readline()
+                if not line:
+                    break
+                command, *args = line.decode(errors='replace').split() or ['']
+                if command == 'fps' and args:
+                    try:
+                        fps = float(args[0])
+                    except ValueError:
+                        fps = math.nan
+                    ## nan would go through the clamp, and the client would then wait forever between two frames
+                    if math.isfinite(fps):
+                        client.fps = min(max(fps, 0.1), 1000)
+                    else:
+                        message = f'fps must be a finite number, not {args[0]!r}'
+                        client.writer.write(encode_frame(ERROR, client.generation, message.encode(), self.level))
+                elif command == 'keyframe':
+                    client.known = None
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        client.closed = True
+
+    async def handle(self,reader,writer):
+        """ Serves a client from its connection to its disconnection"""
+        client = Client(reader, writer, self.fps)
+        self.clients.add(client)
+        listening = asyncio.create_task(self.listen(client))
+        behind_since = None
+
+        try:
+            writer.write(HELLO.pack(MAGIC, *self.frame.shape))
+            self.send(client)
+            while not client.closed:
+                await asyncio.sleep(1 / client.fps)
+                if client.generation == self.generation and client.known is not None:
+                    continue
+
+                ## Frames are not queued for a client that does not keep up: the next delta covers all of them
+                if writer.transport.get_write_buffer_size() > self.max_buffer:
+                    client.coalesced += 1
+                    now = time.monotonic()
+                    behind_since = now if behind_since is None else behind_since
+                    if now - behind_since > self.timeout:
+                        break
+                    continue
+                behind_since = None
+                self.send(client)
+        except (ConnectionError, asyncio.CancelledError):
+            pass # the client left, or the server is closing
+        finally:
+            self.clients.discard(client)
+            listening.cancel()
+            if behind_since is not None:
+                writer.transport.abort() # the buffered frames of a client left behind are dropped
+            else:
+                writer.close()
+
+    async def start(self,host='127.0.0.1',port=8765,path=None):
+        """ Starts listening on host:port, or on the Unix socket path if given, and starts the simulation"""
+        if path is None:
+            self.server = await asyncio.start_server(self.handle, host, port)
+        else:
+            self.server = await asyncio.start_unix_server(self.handle, path)
+        self.tasks.append(asyncio.create_task(self.simulate()))
+        return self.server
+
+    async def close(self):
+        """ Stops the simulation and disconnects every client"""
+        for task in self.tasks:
+            task.cancel()
+        self.server.close()
+        for client in list(self.clients):
+            client.closed = True
+            client.writer.transport.abort()
+        await self.server.wait_closed()
+
+
+async def watch(host='127.0.0.1',port=8765,path=None,fps=10):
+    """ Connects to a server and yields (generation, board) for every frame received. The board is updated in place
+        from frame to frame, copy it to keep it. Raises a ValueError if the server refuses the frame rate."""
+    if path is None:
+        reader, writer = await asyncio.open_connection(host, port)
+    else:
+        reader, writer = await asyncio.open_unix_connection(path)
+    writer.write(f'fps {fps}\n'.encode())
+
+    try:
+        magic, N, M = HELLO.unpack(await reader.readexactly(HELLO.size))
+        if magic != MAGIC:
+            raise ValueError('the server does not stream a game')
+        dtype = rc.index_dtype((N, M))
+        board = cs.board(N, M)
+        while True:
+            try:
+                kind, generation, length = FRAME.unpack(await reader.readexactly(FRAME.size))
+                payload = zlib.decompress(await reader.readexactly(length))
+            except asyncio.IncompleteReadError:
+                return
+            if kind == ERROR:
+                raise ValueError(f'the server refused a command: {payload.decode()}')
+            if kind == rc.KEYFRAME:
+                board[...] = np.frombuffer(payload, dtype=np.uint8).reshape(N, M)
+            else:
+                rc.apply_delta(board, payload, dtype)
+            yield generation, board
+    finally:
+        writer.close()
+
+""" Running a server """
+
+def random_game(mode,N,density=0.3,seed=None,**kwargs):
+    """ Returns a Game.Classic or Game.Versus holding a random soup, the cells being shared between the players in
+        the versus mode"""
+    r = np.random.default_rng(seed).random((N, N))
+    if mode == 'classic':
+        game = gm.Classic(N, **kwargs)
+        game.data = (r < density).astype(cs.DTYPE)
+    else:
+        game = gm.Versus(N, N*N, seed=seed, **kwargs)
+        game.data = np.where(r < density/2, cs.P1, np.where(r < density, cs.P2, cs.EMPTY)).astype(cs.DTYPE)
+        game.start() # counts the cells of the players
+    return game
+
+async def main(args):
+    kwargs = {'rule': args.rule} if args.rule else {}
+    game = random_game(args.mode, args.size, args.density, args.seed, generations_per_frame=args.generations, **kwargs)
+    server = Server(game, args.interval, args.fps)
+    await server.start(args.host, args.port, args.unix)
+    async with server.server:
+        await server.server.serve_forever()
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Stream a random game to many clients.')
+    parser.add_argument('--mode', choices=['classic', 'versus'], default='classic')
+    parser.add_argument('--size', type=int, default=256, help='size N of the N x N board')
+    parser.add_argument('--density', type=float, default=0.3, help='density of the random soup')
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--rule', default=None, help='rule of the classic mode, such as B36/S23')
+    parser.add_argument('--generations', type=int, default=1, help='generations computed per frame')
+    parser.add_argument('--interval', type=float, default=0.0, help='delay between two frames in seconds')
+    parser.add_argument('--fps', type=float, default=10, help='default frame rate of the clients')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--unix', default=None, help='listen on this Unix socket instead of TCP')
+    asyncio.run(main(parser.parse_args()))
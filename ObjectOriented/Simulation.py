@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Fri Oct 23 09:26:51 2026
+
+@author: ChrisZeThird
+
+Headless simulation of the classic game, for scripts and pipelines. A Simulation steps its board under any rule of
+Rules and computes the statistics of every generation (population, births, deaths, bounding box) while stepping, so
+the callers never scan the board again. iter_generations is lazy and yields read-only views of the board instead of
+copies, so a pipeline of generators consumes any number of generations in constant memory:
+
+    sim = Simulation(grid, 'B3/S23')
+    for gen in sample(sim.iter_generations(10000), 100):
+        print(gen.generation, gen.population, gen.bbox)
+"""
+
+import numpy as np
+
+import ConwayEngine as ce
+import Recorder as rc
+import CellStates as cs
+import Rules as rl
+
+""" Classes """
+
+class Generation():
+
+    """ A generation and its statistics. board is a read-only view of the board of the simulation, it is only valid
+        until the next step: copy it to keep it. bbox is the (top, left, bottom, right) box holding the living cells,
+        bottom and right excluded, or None if there is none. """
+
+    __slots__ = ('generation', 'board', 'population', 'births', 'deaths', 'bbox')
+
+    def __init__(self,generation,board,population,births,deaths,bbox):
+        self.generation = generation
+        self.board = board
+        self.population = population
+        self.births = births
+        self.deaths = deaths
+        self.bbox = bbox
+
+    def __repr__(self):
+        return (f'Generation({self.generation}, population={self.population}, births={self.births}, '
+                f'deaths={self.deaths}, bbox={self.bbox})')
+
+
+class Simulation():
+
+    """ Board stepped under rule (a rule string, see Rules), wrapping around its edges. The board is copied once into
+        two padded buffers, each generation being written into the buffer of the previous one. """
+
+    def __init__(self,grid,rule='B3/S23'):
+        grid = cs.as_states(grid)
+        self.shape = grid.shape
+        self.rule = rl.compile_rule(rule)
+        self.table = self.rule.table
+
+        N, M = self.shape
+        self.buffers = [np.zeros((N + 2, M + 2), dtype=cs.DTYPE) for _ in range(2)]
+        self.current, self.other = [buffer[1:-1, 1:-1] for buffer in self.buffers]
+        self.current[...] = grid
+
+        alive = self.current == cs.ALIVE
+        self.last = Generation(0, self.view(), int(np.count_nonzero(alive)), 0, 0, bounding_box(alive))
+
+    @property
+    def generation(self):
+        return self.last.generation
+
+    @property
+    def board(self):
+        """ Returns a read-only view of the current board"""
+        return self.last.board
+
+    def view(self):
+        ## Read-only view of the current board, the callers can not break the buffers
+        view = self.current.view()
+        view.flags.writeable = False
+        return view
+
+    def wrap(self):
+        ## Copy the opposite edges into the border of the current buffer
+        padded = self.buffers[0]
+        padded[0, 1:-1], padded[-1, 1:-1] = self.current[-1], self.current[0]
+        padded[:, 0], padded[:, -1] = padded[:, -2], padded[:, 1]
+
+    def step(self):
+        """ Computes the next generation and returns its Generation"""
+        self.wrap()
+        padded = self.buffers[0]
+        if self.rule.states > 2:
+            padded = (padded == cs.ALIVE).view(np.uint8) # only the cells of state 1 are living neighbours
+        total = ce.count_padded(padded)
+        self.other[...] = rl.lookup(self.table, self.current, total)
+
+        ## Statistics from the two generations, before the old one is overwritten by the next step. The cells that
+        ## flipped (one xor of the boards) are births plus deaths, and the change of population is births minus deaths
+        if self.rule.states > 2:
+            was_alive, alive = self.current == cs.ALIVE, self.other == cs.ALIVE
+        else:
+            was_alive, alive = self.current, self.other # already 0 and 1
+        population = int(np.count_nonzero(alive))
+        flipped = int(np.count_nonzero(alive ^ was_alive))
+        births = (flipped + population - self.last.population) // 2
+
+        self.buffers.reverse()
+        self.current, self.other = self.other, self.current
+        self.last = Generation(self.last.generation + 1, self.view(), population, births, flipped - births,
+                               bounding_box(alive))
+        return self.last
+
+    def advance(self,n):
+        """ Computes n generations and returns the Generation of the last one"""
+        for _ in range(n):
+            self.step()
+        return self.last
+
+    def iter_generations(self,n=None):
+        """ Yields the Generation of the next n generations (forever if n is None), computing each one when it is
+            asked for"""
+        stop = None if n is None else self.last.generation + n
+        while stop is None or self.last.generation < stop:
+            yield self.step()
+
+    def to_array(self):
+        """ Returns a copy of the current board"""
+        return self.current.copy()
+
+""" Useful methods """
+
+def bounding_box(alive):
+    """ Returns the (top, left, bottom, right) box holding the non zero cells of alive, or None if there is none. The
+        columns are only searched between the first and last rows found."""
+    rows = np.flatnonzero(alive.max(axis=1))
+    if rows.size == 0:
+        return None
+    columns = np.flatnonzero(alive[rows[0]:rows[-1] + 1].max(axis=0))
+    return int(rows[0]), int(columns[0]), int(rows[-1]) + 1, int(columns[-1]) + 1
+
+""" Pipeline stages """
+
+def sample(generations,every):
+    """ Yields one generation out of every"""
+    for gen in generations:
+        if gen.generation % every == 0:
+            yield gen
+
+def until_extinct(generations):
+    """ Yields the generations until the board is empty"""
+    for gen in generations:
+        yield gen
+        if gen.population == 0:
+            return
+
+def record(generations,path,keyframe_interval=100):
+    """ Yields the generations, writing each one to the recording path (see Recorder)"""
+    recorder = None
+    try:
+        for gen in generations:
+            if recorder is None:
+                recorder = rc.Recorder(path, gen.board.shape, keyframe_interval)
+            recorder.record(gen.board) # the recorder keeps its own copy to compute the next delta
+            yield gen
+    finally:
+        if recorder is not None:
+            recorder.close()
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 15:40:52 2026
+
+@author: ChrisZeThird
+
+Sparse boards on an unbounded plane. Only the living cells are stored, so the cost of a generation and the memory used
+grow with the population instead of the area of the board, and patterns never wrap around or fall off an edge.
+"""
+
+from collections import Counter
+
+import numpy as np
+
+import CellStates as cs
+
+""" Useful methods """
+
+OFFSETS = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
+
+def cells_of(grid, value=1, top=0, left=0):
+    """ Returns the set of (top + i, left + j) coordinates where grid[i,j] == value"""
+    return {(top + i, left + j) for i, j in np.argwhere(np.asarray(grid) == value).tolist()}
+
+""" Classes """
+
+class SparseBoard():
+
+    """ Classic game on an unbounded plane, stored as the set of (i, j) coordinates of the living cells (row i going
+        down, column j going right, like array indexes). """
+
+    def __init__(self,cells=()):
+        self.cells = set(cells)
+        self.generation = 0
+
+    @classmethod
+    def from_array(cls,grid,top=0,left=0):
+        """ Returns a board holding the living cells (value 1) of grid, cell grid[i,j] being placed at (top + i,
+            left + j)"""
+        return cls(cells_of(grid, 1, top, left))
+
+    def step(self):
+        """ Advances the board by one generation"""
+        ## Count the living neighbours of every cell next to a living cell, the others can't change
+        counts = Counter((i + di, j + dj) for i, j in self.cells for di, dj in OFFSETS)
+
+        ## Apply Conway's rules
+        cells = self.cells
+        self.cells = {cell for cell, total in counts.items() if total == 3 or (total == 2 and cell in cells)}
+        self.generation += 1
+
+    def advance(self,generations):
+        """ Advances the board by the given number of generations"""
+        for _ in range(generations):
+            self.step()
+
+    def toggle(self,i,j):
+        """ Turns cell (i, j) on if it was off, off otherwise"""
+        self.cells ^= {(i, j)}
+
+    def population(self):
+        """ Returns the number of living cells"""
+        return len(self.cells)
+
+    def bounding_box(self):
+        """ Returns (top, left, bottom, right) of the living cells, bounds included, or None if the board is empty"""
+        if not self.cells:
+            return None
+        rows, cols = zip(*self.cells)
+        return min(rows), min(cols), max(rows), max(cols)
+
+    def to_array(self,top,left,N,M=None,dtype=cs.DTYPE):
+        """ Returns the N x M window of the board whose top-left cell is (top, left), as a dense array of 0 and 1 that
+            can be given to imshow"""
+        M = N if M is None else M
+        grid = np.zeros((N, M), dtype=dtype)
+        for i, j in self.cells:
+            if top <= i < top + N and left <= j < left + M:
+                grid[i - top, j - left] = 1
+        return grid
+
+
+class SparseVersus():
+
+    """ 1v1 game on an unbounded plane, stored as a dict mapping the (i, j) coordinates of the living cells to their
+        player (1 or 2). The rules are the ones of VersusEngine, ties on birth being broken with a random generator
+        seeded by seed. """
+
+    def __init__(self,cells=None,seed=None):
+        self.cells = dict(cells or {})
+        self.rng = np.random.default_rng(seed)
+        self.generation = 0
+
+    @classmethod
+    def from_array(cls,grid,top=0,left=0,seed=None):
+        """ Returns a board holding the cells of player 1 and player 2 of a grid of state codes like Versus.data"""
+        cells = dict.fromkeys(cells_of(grid, cs.P1, top, left), 1)
+        cells.update(dict.fromkeys(cells_of(grid, cs.P2, top, left), 2))
+        return cls(cells, seed)
+
+    def rule(self,total,other):
+        """ Returns True if a living cell with total friendly and other enemy neighbours survives (see
+            VersusEngine.rule)"""
+        diff = abs(total - other)
+        return (diff == 2) or (diff == 3) or ((diff == 1) and (total > 1))
+
+    def step(self):
+        """ Advances the board by one generation"""
+        ## Count the neighbours of each player around every cell next to a living cell
+        counts = {}
+        for (i, j), p in self.cells.items():
+            for di, dj in OFFSETS:
+                total = counts.setdefault((i + di, j + dj), [0, 0, 0])
+                total[p] += 1
+
+        newCells = {}
+        for cell, (_, total1, total2) in counts.items():
+            p = self.cells.get(cell)
+            if p == 1:
+                if self.rule(total1, total2):
+                    newCells[cell] = 1
+            elif p == 2:
+                if self.rule(total2, total1):
+                    newCells[cell] = 2
+            elif (total1 == 3) and (total2 == 3):
+                newCells[cell] = int(self.rng.integers(1, 3))
+            elif total1 == 3:
+                newCells[cell] = 1
+            elif total2 == 3:
+                newCells[cell] = 2
+
+        self.cells = newCells
+        self.generation += 1
+
+    def advance(self,generations):
+        """ Advances the board by the given number of generations"""
+        for _ in range(generations):
+            self.step()
+
+    def population(self):
+        """ Returns the number of living cells of player 1 and player 2"""
+        total1 = sum(1 for p in self.cells.values() if p == 1)
+        return total1, len(self.cells) - total1
+
+    def to_array(self,top,left,N,M=None,dtype=cs.DTYPE):
+        """ Returns the N x M window of the board whose top-left cell is (top, left), as state codes like in
+            Versus.data"""
+        M = N if M is None else M
+        grid = np.zeros((N, M), dtype=dtype)
+        for (i, j), p in self.cells.items():
+            if top <= i < top + N and left <= j < left + M:
+                grid[i - top, j - left] = cs.P1 if p == 1 else cs.P2
+        return grid
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 11:47:19 2026
+
+@author: ChrisZeThird
+
+End of game detection. Every board state gets a Zobrist hash (the XOR of one random 64-bit key per cell and state),
+which can be updated from the cells that changed instead of being recomputed, and the hashes already seen are kept in
+a dict mapping them to their generation. A still life or a period-k oscillator is then found with a single dict
+lookup per generation, whatever the length of the game.
+"""
+
+import copy
+
+import numpy as np
+
+""" Classes """
+
+class CycleDetector():
+
+    """ Detects when a board of the given shape comes back to a state it already had. Boards are given as integer
+        arrays of state codes (0 for empty, 1 to states-1 for the species). seed sets the Zobrist keys, two detectors
+        with the same seed give the same hashes. """
+
+    def __init__(self,shape,states=3,seed=0):
+        self.shape = shape
+        size = int(np.prod(shape))
+
+        ## One random key per state and cell, the empty state gets 0 so that an empty board hashes to 0
+        self.keys = np.random.default_rng(seed).integers(0, 2**64, size=(states, size), dtype=np.uint64)
+        self.keys[0] = 0
+
+        self.reset(np.zeros(shape, dtype=np.uint8))
+
+    def hash(self,codes):
+        """ Returns the Zobrist hash of a whole board"""
+        codes = np.asarray(codes).ravel()
+        return int(np.bitwise_xor.reduce(self.keys[codes, np.arange(codes.size)]))
+
+    def reset(self,codes):
+        """ Forgets the history and starts a new one from the board codes, at generation 0"""
+        self.current = self.hash(codes)
+        self.seen = {self.current: 0}
+        self.generation = 0
+        self.period = None
+
+    def update(self,old,new,changed=None):
+        """ Records the next generation new, old being the previous one. changed holds the flat positions of the cells
+            that changed if the caller knows them (the Versus engines do), otherwise the boards are compared. Returns
+            the period of the cycle (1 for a still life) if new was already seen, None otherwise."""
+        old = np.asarray(old).ravel()
+        new = np.asarray(new).ravel()
+
+        ## Only the cells that changed modify the hash: remove their old key and add the new one
+        if changed is None:
+            changed = np.flatnonzero(old != new)
+        self.current ^= int(np.bitwise_xor.reduce(self.keys[old[changed], changed] ^ self.keys[new[changed], changed]))
+        self.generation += 1
+
+        first = self.seen.setdefault(self.current, self.generation)
+        if first != self.generation:
+            self.period = self.generation - first
+        return self.period
+
+    def edit(self,index,old,new):
+        """ Updates the hash after the cell at flat position index was changed from state old to state new between two
+            generations (a cell placed by a player). The boards seen are kept, the cycle found so far is forgotten."""
+        self.current ^= int(self.keys[old, index] ^ self.keys[new, index])
+        self.period = None
+
+    def __deepcopy__(self,memo):
+        ## The copy gets its own history, the Zobrist keys never change and are shared
+        other = copy.copy(self)
+        other.seen = dict(self.seen)
+        return other
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 14:32:58 2026
+
+@author: ChrisZeThird
+
+Headless tournament runner for the 1v1 mod. Matches are played to the end with the Versus rules, without matplotlib,
+over a pool of processes, and every result is written to a CSV or JSONL file as soon as it is known.
+
+A match is a dict with an 'id', a 'seed' (used for the 3-3 birth ties) and the lists of [i, j] cells placed by each
+player under 'p1' and 'p2'. Matches can be read from a JSONL file, one match per line:
+
+    python Tournament.py matches.jsonl results.csv --size 20 --nbr 10
+"""
+
+import argparse
+import csv
+import json
+from multiprocessing import Pool
+
+import numpy as np
+
+import VersusEngine as ve
+import Termination as tm
+import CellStates as cs
+
+""" Playing a match """
+
+FIELDS = ['id', 'seed', 'winner', 'end', 'generations', 'period', 'count_p1', 'count_p2', 'error']
+
+def place(N,nbr,p1,p2):
+    """ Returns the N x N board of state codes (0 empty, 1 player 1, 2 player 2) holding the cells of each player.
+        Raises a ValueError if a player places more than nbr cells, or a cell is outside the board or taken twice."""
+    grid = cs.board(N)
+    for code, cells in ((cs.P1, p1), (cs.P2, p2)):
+        if len(cells) > nbr:
+            raise ValueError(f'player {code} places {len(cells)} cells, at most {nbr} are allowed')
+        for i, j in cells:
+            if not (0 <= i < N and 0 <= j < N):
+                raise ValueError(f'cell [{i},{j}] of player {code} is outside the board')
+            if grid[i, j] != 0:
+                raise ValueError(f'cell [{i},{j}] is placed twice')
+            grid[i, j] = code
+    return grid
+
+def play(grid,seed=None,max_generations=10000):
+    """ Plays a match from the board of state codes grid (see place) and returns a dict with the winner ('P1', 'P2' or
+        'DRAW'), how the game ended ('extinction', 'cycle' or 'limit' when max_generations is reached), the number of
+        generations, the period of the final cycle and the final cell count of each player"""
+    rng = np.random.default_rng(seed)
+    detector = tm.CycleDetector(grid.shape)
+    detector.reset(grid)
+    count_p1 = int(np.count_nonzero(grid == cs.P1))
+    count_p2 = int(np.count_nonzero(grid == cs.P2))
+
+    winner, end, period, generation = 'DRAW', 'limit', None, 0
+    for generation in range(1, max_generations + 1):
+        newGrid, births, deaths, changed = ve.step(grid, rng)
+        count_p1 += births[0] - deaths[0]
+        count_p2 += births[1] - deaths[1]
+        period = detector.update(grid, newGrid, changed)
+        grid = newGrid
+
+        ## Same end conditions as Versus._update
+        if (count_p1 == 0) or (count_p2 == 0):
+            winner = 'P1' if count_p1 else ('P2' if count_p2 else 'DRAW')
+            end = 'extinction'
+            break
+        if period is not None:
+            end = 'cycle'
+            break
+
+    return {'winner': winner, 'end': end, 'generations': generation, 'period': period,
+            'count_p1': count_p1, 'count_p2': count_p2}
+
+def play_match(match,N,nbr,max_generations=10000):
+    """ Plays one match (a dict with 'id', 'seed', 'p1' and 'p2', see the module) on an N x N board and returns its
+        result row. A match whose cells can not be placed gets a row with its id, its seed and the error instead, so
+        it does not stop the whole tournament."""
+    try:
+        grid = place(N, nbr, match['p1'], match['p2'])
+    except ValueError as error:
+        return {'id': match.get('id'), 'seed': match.get('seed'), 'error': str(error)}
+    result = play(grid, match.get('seed'), max_generations)
+    return {'id': match.get('id'), 'seed': match.get('seed'), **result}
+
+def _play_match(args):
+    """ Pool task, plays one match and returns its result row"""
+    return play_match(*args)
+
+""" Running a tournament """
+
+def read_matches(path):
+    """ Yields the matches of a JSONL file, one per line"""
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+def run(matches,out_path,N,nbr,workers=None,max_generations=10000,chunksize=64):
+    """ Plays every match of the iterable matches across a pool of workers and streams the results to out_path, as CSV
+        or as JSONL if the file name ends with .jsonl. Results are written in the order the matches finish, invalid
+        matches getting a row with an 'error' instead of a result. Returns the number of matches played."""
+    tasks = ((match, N, nbr, max_generations) for match in matches)
+    jsonl = str(out_path).endswith('.jsonl')
+
+    played = 0
+    with open(out_path, 'w', newline='') as f, Pool(workers) as pool:
+        if not jsonl:
+            writer = csv.DictWriter(f, fieldnames=FIELDS)
+            writer.writeheader()
+        for row in pool.imap_unordered(_play_match, tasks, chunksize):
+            if jsonl:
+                f.write(json.dumps(row) + '\n')
+            else:
+                writer.writerow(row)
+            played += 1
+
+    return played
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Play Versus matches headlessly and write the results.')
+    parser.add_argument('matches', help='JSONL file of matches')
+    parser.add_argument('results', help='output file, .csv or .jsonl')
+    parser.add_argument('--size', type=int, default=20, help='size N of the board')
+    parser.add_argument('--nbr', type=int, default=10, help='maximum number of cells per player')
+    parser.add_argument('--workers', type=int, default=None, help='number of processes (all cores by default)')
+    parser.add_argument('--max-generations', type=int, default=10000, help='length after which a match is a draw')
+    args = parser.parse_args()
+
+    played = run(read_matches(args.matches), args.results, args.size, args.nbr, args.workers, args.max_generations)
+    print(f'{played} matches played')
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 09:20:44 2026
+
+@author: ChrisZeThird
+
+Stepping engines for the 1v1 mod. An engine takes the current grid of state codes (CellStates.P1 and P2 for the two
+players) and a numpy random Generator (used to break 3-3 birth ties), and returns the next grid along with the number
+of births and deaths of each player and the flat positions of the cells that changed, so the populations and the hash
+of the board (see Termination.CycleDetector) can be kept up to date without scanning the board. Unlike the classic
+game the board does not wrap around: cells on the edges simply have fewer neighbours.
+"""
+
+import numpy as np
+
+import ConwayEngine as ce
+import CellStates as cs
+
+""" Rules of the Game """
+
+def rule(p,q,total1,total2):
+    """ We suppose p and q different. And we look at a cell with value p
+        Returns the new value of the cell for fixed indexes."""
+
+    if ((abs(total1 - total2) == 2) or (abs(total1 - total2) == 3)):
+        return p
+
+    elif ((abs(total1 - total2) == 1) and (total1 > 1)):
+        return p
+
+    else:
+        return 0
+
+## rule compiled into a table: SURVIVAL[total1, total2] is True if a cell with total1 friendly and total2 enemy
+## neighbours survives
+SURVIVAL = np.array([[rule(1, 2, total1, total2) == 1 for total2 in range(9)] for total1 in range(9)])
+
+def survives(total1,total2):
+    """ Returns the boolean array of the cells surviving according to rule, total1 being the number of friendly
+        neighbours and total2 the number of enemy neighbours"""
+    return SURVIVAL.ravel().take(total1 * np.uint8(9) + total2)
+
+def get_neighbors(grid, i, j):
+    """ Returns the list of values of the neighbours of cell [i,j], cells outside the board being left out"""
+    N, M = grid.shape
+
+    North = grid[(i-1), j] if (i > 0) else None
+    S = grid[(i+1), j] if (i < N - 1) else None
+    W = grid[i, (j-1)]  if ((j > 0)) else None
+    E = grid[i, (j+1)] if (j < M - 1) else None
+
+    NW = grid[(i-1), (j-1)] if (i > 0 and j > 0) else None
+    NE = grid[(i-1), (j+1)] if (i > 0 and j < M - 1) else None
+    SW = grid[(i+1), (j-1)] if (i < N - 1 and j > 0) else None
+    SE = grid[(i+1), (j+1)] if (i < N - 1 and j < M - 1) else None
+
+    neighbors = [North, S, W, E, NW, NE, SW, SE]
+
+    return [x for x in neighbors if x is not None]
+
+def count_clipped(alive):
+    """ Returns the number of living neighbours of every cell of the boolean array alive, the board being surrounded by
+        dead cells"""
+    return ce.count_padded(np.pad(alive.astype(np.uint8), 1))
+
+""" Stepping engines """
+
+def step(grid,rng):
+    """ Returns the next grid, the (player 1, player 2) births and deaths and the flat positions of the cells that
+        changed, computed as whole-array operations (default engine)"""
+    alive1 = (grid == cs.P1)
+    alive2 = (grid == cs.P2)
+    total1 = count_clipped(alive1)
+    total2 = count_clipped(alive2)
+
+    ## Living cells follow rule, with their own neighbours counted as friendly
+    keep1 = alive1 & survives(total1, total2)
+    keep2 = alive2 & survives(total2, total1)
+
+    ## Empty cells are born with 3 neighbours of a single player, 3-3 ties are drawn at random in one go
+    empty = ~(alive1 | alive2)
+    born1 = empty & (total1 == 3)
+    born2 = empty & (total2 == 3)
+    tie = born1 & born2
+    draw = rng.random(np.count_nonzero(tie)) < 0.5
+    born1[tie] = draw
+    born2[tie] = ~draw
+
+    newGrid = np.zeros_like(grid)
+    newGrid[keep1 | born1] = cs.P1
+    newGrid[keep2 | born2] = cs.P2
+
+    births = (int(np.count_nonzero(born1)), int(np.count_nonzero(born2)))
+    deaths = (int(np.count_nonzero(alive1) - np.count_nonzero(keep1)),
+              int(np.count_nonzero(alive2) - np.count_nonzero(keep2)))
+
+    ## The cells born or dead are the ones that changed, a cell never goes from one player to the other directly
+    changed = np.flatnonzero(born1 | born2 | (alive1 ^ keep1) | (alive2 ^ keep2))
+
+    return newGrid, births, deaths, changed
+
+def step_reference(grid,rng):
+    """ Same as step, cell by cell. This is the original loop of Versus.update, kept to check the other engines
+        against."""
+
+    ## Copy grid since we require 8 neighbors for calculation and we go cell by cell
+    newGrid = grid.copy()
+    N, M = grid.shape
+    p1, p2 = cs.P1, cs.P2
+    births = [0, 0]
+    deaths = [0, 0]
+    changed = []
+    for i in range(N):
+        for j in range(M):
+            ## Apply adapated Conway's rules
+            neighbors = get_neighbors(grid,i,j)
+            total1 = sum((x==p1) for x in neighbors)
+            total2 = sum((x==p2) for x in neighbors)
+
+            if grid[i,j] != 0:
+                if grid[i,j] == p1:
+                    newGrid[i,j] = rule(p1, p2, total1, total2)
+                    deaths[0] += int(newGrid[i,j] == 0)
+
+                elif grid[i,j] == p2:
+                    newGrid[i,j] = rule(p2, p1, total2, total1)
+                    deaths[1] += int(newGrid[i,j] == 0)
+
+            else:
+                if ((total1 == 3) and (total2 != 3)):
+                    newGrid[i,j] = p1
+                    births[0] += 1
+
+                elif ((total1 != 3) and (total2 == 3)):
+                    newGrid[i,j] = p2
+                    births[1] += 1
+
+                elif ((total1 == 3) and (total2 == 3)):
+                    p = rng.choice([p1,p2])
+                    newGrid[i,j] = p
+                    if p == p1:
+                        births[0] += 1
+                    else:
+                        births[1] += 1
+
+            if newGrid[i,j] != grid[i,j]:
+                changed.append(i*M + j)
+
+    return newGrid, tuple(births), tuple(deaths), np.array(changed, dtype=np.intp)
+
+## Engines available to the Versus class, selected by name
+ENGINES = {'numpy': step,
+           'reference': step_reference}
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sat Oct 24 10:12:40 2026
+
+@author: ChrisZeThird
+
+Window of a board shown on screen, for boards larger than the screen. Only the cells of the window are drawn, and a
+window larger than the screen is reduced by pooling blocks of k x k cells into one pixel: 'max' shows a pixel as alive
+if any of its cells is (the highest state code), 'mean' as the fraction of living cells, and 'sample' takes one cell
+per block (only reading the cells that are shown). The image is therefore never larger than the screen, whatever the
+size of the board.
+
+The window is placed in the coordinates of the whole board, the ones of the figures (x = j, y = N - i), so the mouse
+coordinates of a click give the right cell at any zoom, see cell.
+"""
+
+import math
+
+import numpy as np
+
+import CellStates as cs
+
+## Ways to reduce a block of cells to a pixel
+LOD = ('max', 'mean', 'sample')
+
+""" Useful methods """
+
+def pool(window,k,mode='max'):
+    """ Returns window reduced by blocks of k x k cells, according to mode (see LOD). The window is completed with dead
+        cells up to a multiple of k."""
+    if k == 1:
+        return window
+    if mode == 'sample':
+        return window[::k, ::k]
+
+    rows, cols = -(-window.shape[0] // k), -(-window.shape[1] // k)
+    if window.shape != (rows * k, cols * k):
+        window = np.pad(window, ((0, rows*k - window.shape[0]), (0, cols*k - window.shape[1])))
+
+    ## Splitting both axes gives a view of the blocks, without copy
+    blocks = window.reshape(rows, k, cols, k)
+    if mode == 'max':
+        return blocks.max(axis=(1, 3))
+    return np.count_nonzero(blocks == cs.ALIVE, axis=(1, 3)).astype(np.float32) / (k * k)
+
+""" Classes """
+
+class Viewport():
+
+    """ Window of rows x cols cells of an N x M board, whose top left cell is [top, left]. The board is drawn on at
+        most size x size pixels, and the window can not be smaller than min_cells cells. The whole board is shown at
+        first. """
+
+    def __init__(self,N,M=None,size=1024,min_cells=8):
+        self.N = N
+        self.M = N if M is None else M
+        self.size = size
+        self.min_cells = min(min_cells, self.N, self.M)
+        self.top, self.left, self.rows, self.cols = 0, 0, self.N, self.M
+
+    @property
+    def scale(self):
+        """ Number k of cells per pixel on each side, 1 when the window fits on the screen"""
+        return max(1, math.ceil(max(self.rows, self.cols) / self.size))
+
+    def clamp(self):
+        ## Keep the window inside the board
+        self.rows = int(min(max(self.rows, self.min_cells), self.N))
+        self.cols = int(min(max(self.cols, self.min_cells), self.M))
+        self.top = int(min(max(self.top, 0), self.N - self.rows))
+        self.left = int(min(max(self.left, 0), self.M - self.cols))
+
+    def zoom(self,factor,i=None,j=None):
+        """ Multiplies the size of the window by factor (less than 1 to zoom in), cell [i,j] staying at the same place
+            on screen (the centre of the window by default)"""
+        ## The centre of the cell is kept in place, so the cell stays inside the window even on the edges of the board
+        y = self.top + self.rows / 2 if i is None else i + 0.5
+        x = self.left + self.cols / 2 if j is None else j + 0.5
+        u, v = (y - self.top) / self.rows, (x - self.left) / self.cols # position of the point in the window
+
+        self.rows, self.cols = round(self.rows * factor), round(self.cols * factor)
+        self.clamp() # the size first, the window is then placed around [i,j]
+        self.top, self.left = round(y - u * self.rows), round(x - v * self.cols)
+        self.clamp()
+
+    def pan(self,di,dj):
+        """ Moves the window by di rows and dj columns"""
+        self.top += int(di)
+        self.left += int(dj)
+        self.clamp()
+
+    def reset(self):
+        """ Shows the whole board again"""
+        self.top, self.left, self.rows, self.cols = 0, 0, self.N, self.M
+
+    def window(self,board):
+        """ Returns the view of the cells of board inside the window"""
+        return board[self.top:self.top + self.rows, self.left:self.left + self.cols]
+
+    def render(self,board,mode='max'):
+        """ Returns the image of the window (at most size x size) and its extent in the coordinates of the figures"""
+        k = self.scale
+        image = pool(self.window(board), k, mode)
+
+        ## A pooled image can cover a few dead cells past the edge of the window, the extent follows the image
+        height, width = image.shape[0] * k, image.shape[1] * k
+        return image, [self.left, self.left + width, self.N - self.top - height, self.N - self.top]
+
+    def limits(self):
+        """ Returns the (x, y) limits of the axes showing the window"""
+        return (self.left, self.left + self.cols), (self.N - self.top - self.rows, self.N - self.top)
+
+    def cell(self,x,y):
+        """ Returns the cell [i,j] under the point (x, y) of the figure, or None if it is outside the board"""
+        i, j = self.N - 1 - math.floor(y), math.floor(x)
+        if 0 <= i < self.N and 0 <= j < self.M:
+            return i, j
+        return None
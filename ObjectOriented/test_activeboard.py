@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 17:10:32 2026
+
+@author: ChrisZeThird
+
+Tests of the activity tracked engine (ActiveBoard), checked against ConwayEngine.step_reference.
+"""
+
+import numpy as np
+import pytest
+
+import ConwayEngine as ce
+import ActiveBoard as ab
+import Game as gm
+import CellStates as cs
+
+## Board shapes checked, odd, prime and non-square ones included
+SHAPES = [(1, 1), (3, 3), (8, 8), (17, 17), (5, 11), (23, 9), (32, 70)]
+
+def soup(shape,density=0.35,seed=0):
+    """ Returns a random classic board"""
+    return (np.random.default_rng(seed).random(shape) < density).astype(cs.DTYPE)
+
+def late_soup(N,seed=0):
+    """ Returns an N x N board of blocks and blinkers around a small random soup, mostly skipped by the engine"""
+    grid = cs.board(N)
+    grid[2::8, 2::8] = grid[2::8, 3::8] = grid[3::8, 2::8] = grid[3::8, 3::8] = cs.ALIVE
+    grid[6::8, 4:N-2:8] = grid[6::8, 5:N-1:8] = grid[6::8, 6::8] = cs.ALIVE
+    grid[:16, :16] = soup((16, 16), seed=seed)
+    return grid
+
+@pytest.mark.parametrize('shape', SHAPES)
+@pytest.mark.parametrize('tile', [2, 5, 64])
+def test_active_board(shape,tile):
+    grid = soup(shape, seed=2)
+    board = ab.ActiveBoard(grid, tile)
+    for _ in range(20):
+        board.step()
+        grid = ce.step_reference(grid)
+        assert np.array_equal(board.to_array(), grid)
+        assert board.population() == np.count_nonzero(grid)
+
+def test_late_soup():
+    ## Most tiles are skipped once the soup settled, the board stays right
+    grid = late_soup(96)
+    board = ab.ActiveBoard(grid, 8)
+    fractions = board.advance(60)
+    for _ in range(60):
+        grid = ce.step(grid)
+    assert np.array_equal(board.to_array(), grid)
+    assert max(fractions[5:]) < 0.5
+
+@pytest.mark.parametrize('shape', SHAPES)
+def test_stepper(shape):
+    grid = soup(shape, seed=shape[0])
+    step = ce.engine('active')
+    for _ in range(8):
+        grid, expected = step(grid), ce.step_reference(grid)
+        assert np.array_equal(grid, expected)
+
+def test_stepper_view():
+    ## The board returned is a read-only view, not copied at every generation, valid until the next call
+    step = ab.ActiveStepper(tile=4)
+    grid = step(soup((16, 16), seed=3))
+    assert not grid.flags.writeable
+    with pytest.raises(ValueError):
+        grid[0, 0] = 1
+    kept = grid.copy()
+    new = step(grid)
+    assert np.shares_memory(grid, step.board.buffers[1])
+    assert np.array_equal(grid, kept)
+    assert np.array_equal(new, ce.step(kept))
+
+def test_stepper_new_board():
+    ## Called with another array, the engine starts again from it
+    step = ab.ActiveStepper(tile=4)
+    step(soup((16, 16), seed=1))
+    grid = soup((12, 20), seed=2)
+    assert np.array_equal(step(grid), ce.step(grid))
+
+def test_engines_are_not_shared():
+    first, second = gm.Classic(16, engine='active'), gm.Classic(16, engine='active')
+    assert first.step is not second.step
+
+def test_toggle():
+    ## Cells edited between two steps are taken into account
+    active, numpy = gm.Classic(20, engine='active'), gm.Classic(20)
+    active.data, numpy.data = soup((20, 20), seed=4), soup((20, 20), seed=4)
+    active.step.tile = 4
+    for n in range(12):
+        active.advance_frame()
+        numpy.advance_frame()
+        active.toggle(n, 2*n % 20)
+        numpy.toggle(n, 2*n % 20)
+        assert np.array_equal(active.data, numpy.data)
+
+def test_toggle_after_fork():
+    ## A copy of the game gets a board of its own, which it can edit
+    game = gm.Classic(16, engine='active')
+    game.data = soup((16, 16), seed=5)
+    game.advance_frame()
+    other = game.fork()
+    other.toggle(3, 3)
+    assert other.data[3, 3] != game.data[3, 3]
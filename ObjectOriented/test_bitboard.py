@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 14:02:51 2026
+
+@author: ChrisZeThird
+
+Tests of the bit-packed board (BitBoard), checked against ConwayEngine.step_reference.
+"""
+
+import numpy as np
+import pytest
+
+import ConwayEngine as ce
+import BitBoard as bb
+import CellStates as cs
+
+## Widths around the 64 cells of a word, odd and non-square shapes included
+SHAPES = [(1, 1), (3, 3), (8, 8), (5, 11), (23, 9), (7, 63), (6, 64), (5, 65), (32, 130)]
+
+def soup(shape,density=0.35,seed=0):
+    """ Returns a random classic board"""
+    return (np.random.default_rng(seed).random(shape) < density).astype(cs.DTYPE)
+
+@pytest.mark.parametrize('shape', SHAPES)
+def test_pack(shape):
+    grid = soup(shape, seed=1)
+    assert np.array_equal(bb.unpack(bb.pack(grid), shape[1]), grid)
+
+@pytest.mark.parametrize('shape', SHAPES)
+def test_step_dense(shape):
+    grid = expected = soup(shape, seed=2)
+    for _ in range(8):
+        grid, expected = ce.engine('bitpacked')(grid), ce.step_reference(expected)
+        assert np.array_equal(grid, expected)
+
+@pytest.mark.parametrize('shape', SHAPES)
+def test_bitboard(shape):
+    grid = soup(shape, seed=3)
+    board = bb.BitBoard.from_array(grid)
+    for _ in range(8):
+        board.step()
+        grid = ce.step_reference(grid)
+        assert np.array_equal(board.to_array(), grid)
+        assert board.population() == np.count_nonzero(grid)
+
+def test_get_toggle():
+    board = bb.BitBoard(4, 70)
+    board.toggle(2, 65)
+    board.toggle(3, 0)
+    assert board.get(2, 65) == 1 and board.get(3, 0) == 1 and board.get(2, 64) == 0
+    board.toggle(2, 65)
+    assert board.get(2, 65) == 0
+    assert board.population() == 1
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 18:38:57 2026
+
+@author: ChrisZeThird
+
+Tests of the soup census: apgcodes of well known objects, splitting of a board into objects, and the object cache.
+"""
+
+import collections
+import json
+
+import numpy as np
+import pytest
+
+import Census as cn
+import CellStates as cs
+
+## Well known objects and their apgcodes on Catagolue
+OBJECTS = {'xs4_33': ['oo', 'oo'],
+           'xs4_252': ['.o.', 'o.o', '.o.'],
+           'xs5_253': ['oo.', 'o.o', '.o.'],
+           'xs6_696': ['.oo.', 'o..o', '.oo.'],
+           'xs6_356': ['oo.', 'o.o', '.oo'],
+           'xs7_2596': ['.oo.', 'o..o', '.o.o', '..o.'],
+           'xs8_6996': ['.oo.', 'o..o', 'o..o', '.oo.'],
+           'xp2_7': ['ooo'],
+           'xp2_7e': ['.ooo', 'ooo.'],
+           'xp2_318c': ['oo..', 'oo..', '..oo', '..oo'],
+           'xq4_153': ['.o.', '..o', 'ooo'],
+           'xq4_6frc': ['.o..o', 'o....', 'o...o', 'oooo.']}
+
+def pattern(rows):
+    """ Returns the 0/1 array of a pattern drawn with 'o' and '.'"""
+    return np.array([[c == 'o' for c in row] for row in rows], dtype=cs.DTYPE)
+
+@pytest.mark.parametrize('code', OBJECTS)
+def test_classify(code):
+    cells = pattern(OBJECTS[code])
+    for cells in cn.orientations(cells):
+        assert cn.classify(cells) == code
+
+def test_classify_unnamed():
+    assert cn.classify(pattern(['oo'])) == cn.DIED
+    assert cn.classify(np.zeros((3, 3), dtype=cs.DTYPE)) == cn.DIED
+    assert cn.classify(pattern(['ooo']), max_period=1) == cn.UNKNOWN
+
+def test_wechsler():
+    ## Strips of 5 rows, runs of empty columns shortened
+    assert cn.wechsler(pattern(['o' + '.' * 2 + 'o'])) == '1w1'
+    assert cn.wechsler(pattern(['o' + '.' * 3 + 'o'])) == '1x1'
+    assert cn.wechsler(pattern(['o' + '.' * 10 + 'o'])) == '1y61'
+    assert cn.wechsler(pattern(['o' + '.' * 45 + 'o'])) == '1yzy21'
+    assert cn.wechsler(pattern(['o', '.', '.', '.', '.', 'o'])) == '1z1'
+
+def test_objects():
+    ## Objects apart are split, the parts of an oscillator stay together, an object across the edge is in one piece
+    board = cs.board(32)
+    board[2:4, 2:4] = pattern(OBJECTS['xs4_33'])
+    board[10, 10:13] = cs.ALIVE
+    board[20:24, 20:24] = pattern(OBJECTS['xp2_318c'])
+    board[15:17, 31] = board[15:17, 0] = cs.ALIVE # a block across the edge
+    census = cn.Census()
+    assert census.count(board) == collections.Counter({'xs4_33': 2, 'xp2_7': 1, 'xp2_318c': 1})
+
+def test_cache():
+    census = cn.Census()
+    board = cs.board(40)
+    for k in range(4):
+        board[4 + 8*k:6 + 8*k, 4:6] = cs.ALIVE # 4 blocks
+        board[4 + 8*k, 20:23] = cs.ALIVE # and 4 blinkers
+    assert census.count(board) == collections.Counter({'xs4_33': 4, 'xp2_7': 4})
+    assert (census.cache.misses, census.cache.hits) == (2, 6)
+
+def test_cache_lru():
+    cache = cn.ObjectCache(maxsize=2)
+    cache.put('a', 'A')
+    cache.put('b', 'B')
+    assert cache.get('a') == 'A'
+    cache.put('c', 'C') # 'b' is the least recently used
+    assert cache.get('b') is None
+    assert list(cache.codes) == ['a', 'c']
+
+@pytest.mark.parametrize('kind', [str, lambda path: path])
+def test_cache_file(tmp_path,kind):
+    ## The cache is saved to a str or a pathlib.Path, and loaded back in the same order
+    path = kind(tmp_path / 'objects.json')
+    cache = cn.ObjectCache(path)
+    for key in ('x', 'y', 'z'):
+        cache.put(key, key.upper())
+    cache.get('x')
+    cache.save()
+    assert json.loads((tmp_path / 'objects.json').read_text()) == [['y', 'Y'], ['z', 'Z'], ['x', 'X']]
+    assert list(cn.ObjectCache(path).codes.items()) == [('y', 'Y'), ('z', 'Z'), ('x', 'X')]
+
+    cache.save(kind(tmp_path / 'other.json'))
+    assert len(cn.ObjectCache(kind(tmp_path / 'other.json'))) == 3
+    with pytest.raises(ValueError):
+        cn.ObjectCache().save()
+
+def test_soups():
+    ## Soups run one by one or as an ensemble leave the same objects once they settled
+    census = cn.Census(generations=3000)
+    one = [census.soup(16, 0.375, seed) for seed in range(6)]
+    batch = cn.Census(generations=3000).batch(6, 16, 0.375)
+    for a, b in zip(one, batch):
+        assert a == b
+    assert census.soups == 6 and census.totals == sum(one, collections.Counter())
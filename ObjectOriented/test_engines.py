@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 11:05:27 2026
+
+@author: ChrisZeThird
+
+Checks the classic engine (ConwayEngine.step and step_rows) against the cell by cell reference loop
+ConwayEngine.step_reference on random boards of several sizes, odd and non-square ones included. The other engines are
+tested in the file of their module. Run with pytest from this directory:
+
+    python -m pytest -q
+"""
+
+import numpy as np
+import pytest
+
+import ConwayEngine as ce
+import CellStates as cs
+
+## Board shapes checked, odd and non-square ones included
+SHAPES = [(1, 1), (3, 3), (8, 8), (17, 17), (5, 11), (23, 9), (32, 70)]
+GENERATIONS = 8
+
+""" Useful methods """
+
+def soup(shape,density=0.35,seed=0):
+    """ Returns a random classic board"""
+    return (np.random.default_rng(seed).random(shape) < density).astype(cs.DTYPE)
+
+def references(grid,generations=GENERATIONS):
+    """ Returns the boards of the next generations of grid, computed by the reference loop"""
+    boards = []
+    for _ in range(generations):
+        grid = ce.step_reference(grid)
+        boards.append(grid)
+    return boards
+
+""" Classic engines """
+
+@pytest.mark.parametrize('shape', SHAPES)
+def test_step(shape):
+    grid = soup(shape, seed=shape[0])
+    for expected in references(grid):
+        grid = ce.step(grid)
+        assert np.array_equal(grid, expected)
+
+@pytest.mark.parametrize('shape', SHAPES)
+def test_step_rows(shape):
+    ## The rows of a band with its halo rows give the same generation as the whole board
+    grid = soup(shape, seed=1)
+    halo = np.concatenate((grid[-1:], grid, grid[:1]))
+    assert np.array_equal(ce.step_rows(halo), ce.step_reference(grid))
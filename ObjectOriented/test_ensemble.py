@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 16:24:40 2026
+
+@author: ChrisZeThird
+
+Tests of the batched ensembles: every board evolves and stops like a board stepped alone.
+"""
+
+import numpy as np
+import pytest
+
+import ConwayEngine as ce
+import Ensemble as en
+
+def alone(board,max_generations):
+    """ Steps board alone and returns its final board, status and stopping generation (-1 while it runs)"""
+    previous = None
+    for generation in range(1, max_generations + 1):
+        new = ce.step(board)
+        if not new.any():
+            return new, en.DIED, generation
+        if np.array_equal(new, board):
+            return new, en.STILL, generation
+        if previous is not None and np.array_equal(new, previous):
+            return new, en.PERIOD2, generation
+        previous, board = board, new
+    return board, en.RUNNING, -1
+
+@pytest.mark.parametrize('rule', [None, 'B3/S23'])
+def test_status(rule):
+    ## Small boards of various densities die, stop or keep running within a few hundred generations
+    K, N, generations = 60, 6, 300
+    ensemble = en.Ensemble(K, N, densities=np.linspace(0.05, 0.6, K), rule=rule)
+    start = ensemble.boards.copy()
+    assert ensemble.run(generations) == np.sum(ensemble.status == en.RUNNING)
+
+    for k in range(K):
+        board, status, stopped_at = alone(start[k], generations)
+        assert ensemble.status[k] == status
+        assert ensemble.stopped_at[k] == stopped_at
+        assert np.array_equal(ensemble.boards[k], board)
+        assert ensemble.population[k] == np.count_nonzero(board)
+
+    ## Every status is met
+    assert set(ensemble.status.tolist()) == {en.RUNNING, en.DIED, en.STILL, en.PERIOD2}
+
+def test_seeds():
+    ## A board only depends on its seed and density
+    ensemble = en.Ensemble(5, 16, densities=0.3, seeds=[7, 3, 9, 3, 0])
+    single = en.Ensemble(1, 16, densities=0.3, seeds=[3])
+    assert np.array_equal(ensemble.boards[1], single.boards[0])
+    assert np.array_equal(ensemble.boards[1], ensemble.boards[3])
+    assert np.array_equal(ensemble.boards[4], en.Ensemble(1, 16, densities=0.3).boards[0])
+
+def test_summary():
+    ensemble = en.Ensemble(40, 5, densities=0.3)
+    ensemble.run(200)
+    summary = ensemble.summary()
+    assert sum(summary[key] for key in ('running', 'died', 'still', 'period2')) == 40
+    stopped = ensemble.status != en.RUNNING
+    assert summary['mean_stop'] == pytest.approx(ensemble.stopped_at[stopped].mean())
+    assert summary['mean_population'] == pytest.approx(ensemble.population[stopped].mean())
+
+def test_frozen():
+    ## Stopped boards are no longer stepped
+    ensemble = en.Ensemble(20, 5, densities=0.3)
+    ensemble.run(50)
+    stopped = np.flatnonzero(ensemble.status != en.RUNNING)
+    boards = ensemble.boards[stopped].copy()
+    ensemble.run(80)
+    assert np.array_equal(ensemble.boards[stopped], boards)
+    assert (ensemble.stopped_at[stopped] <= 50).all()
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 14:20:36 2026
+
+@author: ChrisZeThird
+
+Tests of the Hashlife engine. The plane of HashLife is unbounded, so it is compared with the dense engine on a torus
+large enough for the pattern never to reach around it.
+"""
+
+import numpy as np
+import pytest
+
+import ConwayEngine as ce
+import HashLife as hl
+import CellStates as cs
+
+## Side of the torus of the dense engine, a soup of SOUP cells grows by at most one cell per generation on each side
+SIDE = 128
+SOUP = 16
+GLIDER = np.array([[0, 1, 0], [0, 0, 1], [1, 1, 1]], dtype=cs.DTYPE)
+
+def torus(seed):
+    """ Returns a SIDE x SIDE board holding a random soup in its centre"""
+    grid = cs.board(SIDE)
+    soup = np.random.default_rng(seed).random((SOUP, SOUP)) < 0.4
+    grid[(SIDE - SOUP)//2:(SIDE + SOUP)//2, (SIDE - SOUP)//2:(SIDE + SOUP)//2] = soup
+    return grid
+
+def dense(grid,generations):
+    for _ in range(generations):
+        grid = ce.step(grid)
+    return grid
+
+def window(board):
+    """ Returns the cells of board lying on the torus, the torus being placed at (-SIDE/2, -SIDE/2)"""
+    return board.to_array(-SIDE//2, -SIDE//2, SIDE)
+
+@pytest.mark.parametrize('generations', [1, 2, 7, 16, 37, 50])
+def test_advance(generations):
+    grid = torus(generations)
+    board = hl.HashLife.from_array(grid, -SIDE//2, -SIDE//2)
+    board.advance(generations)
+    expected = dense(grid, generations)
+    assert board.generation == generations
+    assert np.array_equal(window(board), expected)
+    assert board.population() == np.count_nonzero(expected)
+
+def test_advance_in_steps():
+    ## Many small jumps give the same board as the dense engine at every step
+    grid = torus(1)
+    board = hl.HashLife.from_array(grid, -SIDE//2, -SIDE//2)
+    for generations in (3, 1, 5, 8, 2, 13):
+        board.advance(generations)
+        grid = dense(grid, generations)
+        assert np.array_equal(window(board), grid)
+
+def test_collect():
+    ## A table of nodes far too small is collected after every jump, the board is unchanged
+    grid = torus(2)
+    small = hl.HashLife.from_array(grid, -SIDE//2, -SIDE//2, max_nodes=50)
+    large = hl.HashLife.from_array(grid, -SIDE//2, -SIDE//2)
+    for generations in (1, 4, 9, 16, 10):
+        small.advance(generations)
+        large.advance(generations)
+        assert small.root is not large.root
+        assert np.array_equal(window(small), window(large))
+    assert len(small.nodes) < len(large.nodes)
+
+    ## Only the nodes reachable from the root are kept
+    small.collect()
+    assert len(small.results) == 0
+    reachable = set()
+    stack = [small.root]
+    while stack:
+        node = stack.pop()
+        if node.k and node not in reachable:
+            reachable.add(node)
+            stack.extend((node.a, node.b, node.c, node.d))
+    assert set(small.nodes.values()) == reachable
+
+def test_glider_far_away():
+    ## A glider moves one cell diagonally every 4 generations, whatever the distance
+    board = hl.HashLife.from_array(GLIDER)
+    board.advance(4 * 10**6)
+    assert board.population() == 5
+    assert board.bounding_box() == (10**6, 10**6, 10**6 + 2, 10**6 + 2)
+    assert np.array_equal(board.to_array(10**6, 10**6, 3), GLIDER)
+
+def test_empty():
+    board = hl.HashLife()
+    board.advance(1000)
+    assert board.population() == 0
+    assert board.bounding_box() is None
+    assert list(board.cells()) == []
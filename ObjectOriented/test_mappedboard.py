@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 19:40:05 2026
+
+@author: ChrisZeThird
+
+Tests of the boards stored in memory-mapped files, stepped band by band and checked against
+ConwayEngine.step_reference, and of their checkpoints.
+"""
+
+import numpy as np
+import pytest
+
+import ConwayEngine as ce
+import MappedBoard as mb
+import CellStates as cs
+
+def soup(shape,density=0.35,seed=0):
+    """ Returns a random classic board"""
+    return (np.random.default_rng(seed).random(shape) < density).astype(cs.DTYPE)
+
+@pytest.mark.parametrize('shape,band', [((17, 17), 4), ((23, 9), 23), ((5, 11), 1), ((32, 70), 7)])
+def test_mapped_board(tmp_path,shape,band):
+    grid = soup(shape, seed=8)
+    with mb.MappedBoard(str(tmp_path / 'board'), shape=shape, band=band) as board:
+        board.load(grid)
+        for _ in range(8):
+            board.step()
+            grid = ce.step_reference(grid)
+            assert np.array_equal(board.to_array(), grid)
+        assert board.population() == np.count_nonzero(grid)
+        assert np.array_equal(board.to_array(3, 2, 4, 5), grid[3:7, 2:7])
+
+def test_mapped_board_checkpoint(tmp_path):
+    ## A board opened again is at its last checkpoint, the edits made since being lost
+    path = str(tmp_path / 'board')
+    grid = soup((12, 10), seed=9)
+    with mb.MappedBoard(path, shape=grid.shape, band=5) as board:
+        board.load(grid)
+        board.advance(3)
+        board.checkpoint()
+        saved = board.to_array()
+        board.randomize(0.5, seed=1)
+        board.advance(2)
+    with mb.MappedBoard(path) as board:
+        assert board.generation == 3
+        assert np.array_equal(board.to_array(), saved)
+
+def test_mapped_board_edits(tmp_path):
+    ## The edits are written into the spare file, the checkpoint is left as it is
+    path = str(tmp_path / 'board')
+    grid = soup((9, 13), seed=10)
+    with mb.MappedBoard(path, shape=grid.shape, band=2) as board:
+        board.load(grid)
+        board.checkpoint()
+        saved = board.saved
+        board.load(np.ones((2, 2)), top=4, left=6)
+        assert board.current not in (saved, board.spare())
+        assert np.array_equal(board.boards[saved], grid) # the cells not loaded were copied, the checkpoint is intact
+        grid[4:6, 6:8] = cs.ALIVE
+        assert np.array_equal(board.to_array(), grid)
+
+        board.checkpoint()
+        board.randomize(0.5, seed=2)
+        assert np.array_equal(board.boards[board.saved], grid)
+        assert 0 < board.population() < grid.size
+
+    with mb.MappedBoard(path) as board:
+        assert board.generation == 0
+        assert np.array_equal(board.to_array(), grid)
+
+def test_mapped_board_missing(tmp_path):
+    with pytest.raises(ValueError):
+        mb.MappedBoard(str(tmp_path / 'board'))
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 15:06:44 2026
+
+@author: ChrisZeThird
+
+Tests of the multi-core tiled engine (ParallelBoard), checked against ConwayEngine.step_reference.
+"""
+
+from multiprocessing import shared_memory
+
+import numpy as np
+import pytest
+
+import ConwayEngine as ce
+import ParallelEngine as pe
+import CellStates as cs
+
+def soup(shape,density=0.35,seed=0):
+    """ Returns a random classic board"""
+    return (np.random.default_rng(seed).random(shape) < density).astype(cs.DTYPE)
+
+@pytest.mark.parametrize('shape,tiles', [((17, 17), 3), ((23, 9), 4), ((5, 11), 5), ((32, 70), 2), ((3, 8), 7)])
+def test_parallel_board(shape,tiles):
+    grid = soup(shape, seed=7)
+    with pe.ParallelBoard(grid, workers=2, tiles=tiles) as board:
+        for _ in range(8):
+            board.step()
+            grid = ce.step_reference(grid)
+            assert np.array_equal(board.to_array(), grid)
+        assert board.generation == 8
+
+def test_close():
+    ## The shared buffers are gone once the board is closed, closing twice does nothing
+    board = pe.ParallelBoard(soup((16, 16)), workers=2)
+    names = [shm.name for shm in board.shm]
+    board.close()
+    board.close()
+    for name in names:
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=name)
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 16:41:55 2026
+
+@author: ChrisZeThird
+
+Tests of the pattern files: boards written as RLE, plaintext and Macrocell are read back unchanged.
+"""
+
+import numpy as np
+import pytest
+
+import HashLife as hl
+import PatternIO as pio
+import CellStates as cs
+
+def soup(shape,density=0.35,seed=0):
+    """ Returns a random classic board"""
+    return (np.random.default_rng(seed).random(shape) < density).astype(cs.DTYPE)
+
+def state_tag(state):
+    """ Returns the tag of a state of a multi-state RLE file: '.' for 0, 'A' to 'X' for 1 to 24, then 'pA' to 'yO'"""
+    if state == 0:
+        return '.'
+    if state <= 24:
+        return chr(ord('A') + state - 1)
+    return chr(ord('p') + (state - 25) // 24) + chr(ord('A') + (state - 25) % 24)
+
+def write_multistate(path,grid):
+    """ Writes grid of states 0 to 255 as a multi-state RLE file, one tag per cell and at most 10 tags per line"""
+    tags = [tag for row in grid for tag in [state_tag(s) for s in row] + ['$']]
+    tags[-1] = '!'
+    with open(path, 'w') as f:
+        f.write(f'#C multi-state\nx = {grid.shape[1]}, y = {grid.shape[0]}, rule = Generations\n')
+        for k in range(0, len(tags), 10):
+            f.write(''.join(tags[k:k + 10]) + '\n')
+
+""" RLE """
+
+@pytest.mark.parametrize('shape', [(1, 1), (5, 11), (23, 9), (40, 150)])
+def test_rle(tmp_path,shape):
+    grid = soup(shape, seed=1)
+    grid[0, 0] = grid[-1, -1] = cs.ALIVE # the pattern fills the board, its size is the one of the header
+    path = str(tmp_path / 'soup.rle')
+    pio.write_rle(path, grid)
+    assert pio.rle_header(path) == (shape[1], shape[0])
+    assert np.array_equal(pio.load(path), grid)
+
+def test_rle_player(tmp_path):
+    ## The cells of a player are written and loaded back as the cells of that player
+    r = np.random.default_rng(0).random((12, 15))
+    grid = np.where(r < 0.2, cs.P1, np.where(r < 0.4, cs.P2, cs.EMPTY)).astype(cs.DTYPE)
+    path = str(tmp_path / 'p2.rle')
+    pio.write_rle(path, grid, value=cs.P2)
+    loaded = pio.load(path, cs.board(12, 15), value=cs.P2)
+    assert np.array_equal(loaded, np.where(grid == cs.P2, cs.P2, cs.EMPTY))
+
+@pytest.mark.parametrize('shape', [(1, 3), (6, 9), (20, 31)])
+def test_rle_multistate(tmp_path,shape):
+    ## Every state, of one or two characters, is a single living cell
+    rng = np.random.default_rng(shape[0])
+    grid = np.where(rng.random(shape) < 0.5, rng.integers(1, 256, shape), 0)
+    grid[0, -1] = 255
+    path = str(tmp_path / 'states.rle')
+    write_multistate(path, grid)
+    assert np.array_equal(pio.load(path), (grid != 0).astype(cs.DTYPE))
+
+def test_rle_without_header(tmp_path):
+    path = tmp_path / 'bare.rle'
+    path.write_text('#C no header\n\n2o$obo!\n')
+    with pytest.raises(ValueError):
+        pio.load(str(path))
+    assert np.array_equal(pio.load(str(path), cs.board(2, 3)), [[1, 1, 0], [1, 0, 1]])
+
+""" Plaintext """
+
+@pytest.mark.parametrize('shape', [(1, 1), (5, 11), (23, 9)])
+def test_plaintext(tmp_path,shape):
+    grid = soup(shape, seed=2)
+    path = str(tmp_path / 'soup.cells')
+    pio.write_plaintext(path, grid, name='soup')
+
+    ## Loaded into a larger board, at an offset
+    loaded = pio.load(path, cs.board(shape[0] + 4, shape[1] + 6), top=3, left=5)
+    assert np.array_equal(loaded[3:3 + shape[0], 5:5 + shape[1]], grid)
+    assert np.count_nonzero(loaded) == np.count_nonzero(grid)
+
+def test_pattern_too_large(tmp_path):
+    path = str(tmp_path / 'soup.rle')
+    pio.write_rle(path, np.ones((4, 4), dtype=cs.DTYPE))
+    with pytest.raises(ValueError):
+        pio.load(path, cs.board(3))
+
+""" Macrocell """
+
+@pytest.mark.parametrize('shape', [(8, 8), (5, 11), (37, 20), (70, 90)])
+def test_macrocell(tmp_path,shape):
+    grid = soup(shape, seed=3)
+    path = str(tmp_path / 'soup.mc')
+    pio.write_macrocell(path, hl.HashLife.from_array(grid))
+
+    ## The pattern is loaded cropped to its living cells
+    rows, cols = np.nonzero(grid)
+    expected = grid[rows.min():rows.max() + 1, cols.min():cols.max() + 1]
+    assert np.array_equal(pio.load(path), expected)
+
+def test_macrocell_board(tmp_path):
+    ## The quadtree read back is the same board, advanced like the one written
+    board = hl.HashLife.from_array(soup((30, 30), seed=4), -15, -15)
+    path = str(tmp_path / 'soup.mc')
+    pio.write_macrocell(path, board)
+    read = pio.read_macrocell(path)
+    assert read.population() == board.population()
+    board.advance(64)
+    read.advance(64)
+    assert set(read.cells()) == set(board.cells())
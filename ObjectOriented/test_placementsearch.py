@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 19:02:14 2026
+
+@author: ChrisZeThird
+
+Tests of the placement search: the matches it plays, its transposition table and the ranking of the candidates.
+"""
+
+import numpy as np
+import pytest
+
+import PlacementSearch as ps
+import Tournament as tn
+import CellStates as cs
+
+N, NBR = 12, 8
+
+## Two blocks far from the opponent draw, a lone cell dies at once and loses
+BLOCKS = [[1, 1], [1, 2], [2, 1], [2, 2], [1, 8], [1, 9], [2, 8], [2, 9]]
+LONE = [[3, 5]]
+OPPONENT = [[8, 4], [8, 5], [9, 4], [9, 5]]
+
+def test_random_placement():
+    opponents = ps.RandomPlacement(N, NBR, rows=(6, 12))
+    cells = opponents(np.random.default_rng(0))
+    assert len(cells) == NBR == len(set(map(tuple, cells)))
+    assert all(6 <= i < 12 and 0 <= j < N for i, j in cells)
+
+def test_match():
+    ## Opponent cells falling on the candidate are left out
+    search = ps.PlacementSearch(N, 20, ps.RandomPlacement(N, 20), player='P2', workers=1, seed=0)
+    for _ in range(20):
+        grid, seed = search.match(BLOCKS)
+        assert 0 <= seed < search.seeds
+        assert all(grid[i, j] == cs.P2 for i, j in BLOCKS)
+        assert 0 < np.count_nonzero(grid == cs.P1) <= 20
+
+def test_play():
+    ## Winners are the ones of the tournament, and a match is only played once
+    search = ps.PlacementSearch(N, NBR, ps.RandomPlacement(N, NBR, rows=(6, 12)), workers=1, seed=1)
+    matches = [search.match(cells) for cells in (BLOCKS, LONE, BLOCKS[:4]) for _ in range(5)]
+    winners = search.play(matches)
+    for (grid, seed), winner in zip(matches, winners):
+        row = tn.play(grid, seed, search.max_generations)
+        assert winner == row['winner']
+    played = search.played
+    assert search.play(matches[::-1]) == winners[::-1]
+    assert search.played == played
+
+def test_table_size():
+    search = ps.PlacementSearch(N, NBR, ps.RandomPlacement(N, NBR, rows=(6, 12)), workers=1, seed=2, table_size=5)
+    matches = [search.match(BLOCKS) for _ in range(12)]
+    winners = search.play(matches)
+    assert len(search.table) == 5
+    assert search.play(matches) == winners # the matches forgotten are played again
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_evaluate(workers):
+    with ps.PlacementSearch(N, NBR, ps.Choice([OPPONENT]), workers=workers, seed=3) as search:
+        results = search.evaluate([LONE, BLOCKS], batch=32, max_matches=512)
+    best, worst = results
+    assert (best['index'], best['score'], worst['score']) == (1, 0.5, 0.0)
+    assert best['low'] <= 0.5 <= best['high']
+    assert worst['matches'] == best['matches'] < 512 # the lone cell is dropped early, which ends the search
+    assert search.played <= search.seeds * 2 # at most one match per seed and candidate, the others are in the table
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 20:03:37 2026
+
+@author: ChrisZeThird
+
+Tests of the producer computing the frames in a background thread. The game taking its frames must go through the
+same states as the same game advanced without a producer, edits between the frames included.
+"""
+
+import time
+
+import numpy as np
+
+import Producer as pr
+import Game as gm
+import CellStates as cs
+
+N = 32
+
+""" Useful methods """
+
+def next_frame(producer,timeout=10):
+    """ Waits for the next frame and puts it into the game"""
+    deadline = time.monotonic() + timeout
+    while (frame := producer.consume()) is None:
+        assert time.monotonic() < deadline, 'no frame was produced'
+        time.sleep(0.001)
+    return frame
+
+def versus(seed):
+    """ Returns a game of random cells of both players"""
+    game = gm.Versus(N, N * N, seed=seed)
+    rng = np.random.default_rng(seed)
+    for i, j in zip(*np.nonzero(rng.random((N, N)) < 0.4)):
+        game.place(i, j, 'P1' if rng.random() < 0.5 else 'P2')
+    game.start()
+    return game
+
+def assert_same(game,headless):
+    assert game.generation == headless.generation
+    assert np.array_equal(game.data, headless.data)
+    assert (game.count_p1, game.count_p2, game.period) == (headless.count_p1, headless.count_p2, headless.period)
+    assert game.detector.current == headless.detector.current == game.detector.hash(game.data)
+    assert game.detector.seen == headless.detector.seen
+    assert game.detector.generation == headless.detector.generation
+
+""" Tests """
+
+def test_versus():
+    ## Cells placed between the frames are followed by the frames computed after the invalidation
+    game, headless = versus(1), versus(1)
+    producer = pr.Producer(game, capacity=4)
+    try:
+        for k in range(60):
+            if k % 7 == 3:
+                ## A cell of player 1 placed on an empty cell, then the history goes on from the edited board
+                i, j = np.argwhere(game.data == cs.EMPTY)[k % 5]
+                game.place(i, j, 'P1')
+                headless.place(i, j, 'P1')
+                assert_same(game, headless)
+                producer.invalidate()
+
+            frame = next_frame(producer)
+            over = headless.advance_frame()
+            assert_same(game, headless)
+            assert frame.over == over
+            if over:
+                break
+    finally:
+        producer.stop()
+
+def test_versus_detector_copied():
+    ## The detector of a frame is not the one the worker goes on updating
+    game = versus(2)
+    producer = pr.Producer(game, capacity=2)
+    try:
+        next_frame(producer)
+        assert game.detector is not producer.worker.detector
+        assert game.detector.keys is producer.worker.detector.keys # the Zobrist keys are shared
+        seen = dict(game.detector.seen)
+        while len(producer) < 2:
+            time.sleep(0.001)
+        assert game.detector.seen == seen
+    finally:
+        producer.stop()
+
+def test_classic():
+    game = gm.Classic(N)
+    game.data[:] = np.random.default_rng(3).random((N, N)) < 0.35
+    headless = game.fork()
+    producer = pr.Producer(game, capacity=3)
+    try:
+        for k in range(20):
+            if k == 10:
+                game.toggle(4, 5)
+                headless.toggle(4, 5)
+                producer.invalidate()
+            next_frame(producer)
+            headless.advance_frame()
+            assert game.generation == headless.generation
+            assert np.array_equal(game.data, headless.data)
+    finally:
+        producer.stop()
+
+def test_pause():
+    ## A paused producer throws its frames away and computes no more until it is resumed
+    game = versus(4)
+    producer = pr.Producer(game, capacity=4, paused=True)
+    try:
+        time.sleep(0.05)
+        assert producer.consume() is None and producer.produced == 0
+        producer.resume()
+        next_frame(producer)
+        producer.pause()
+        assert len(producer) == 0
+        produced = producer.produced
+        time.sleep(0.05)
+        assert producer.consume() is None and producer.produced == produced
+        producer.resume()
+        assert next_frame(producer).state['generation'] == game.generation == 2
+    finally:
+        producer.stop()
+
+def test_stop():
+    producer = pr.Producer(versus(5), capacity=2)
+    next_frame(producer)
+    producer.stop()
+    producer.thread.join(5)
+    assert not producer.thread.is_alive()
@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 11:42:09 2026
+
+@author: ChrisZeThird
+
+Tests of the recordings: the generations written by Recorder, and the cells edited between them, are read back
+unchanged by Replay.
+"""
+
+import os
+
+import numpy as np
+import pytest
+
+import ConwayEngine as ce
+import VersusEngine as ve
+import Recorder as rc
+import Game as gm
+import CellStates as cs
+
+""" Useful methods """
+
+def soup(shape,density=0.35,seed=0):
+    """ Returns a random classic board"""
+    return (np.random.default_rng(seed).random(shape) < density).astype(cs.DTYPE)
+
+def classic_run(shape,generations,seed=0):
+    """ Returns the boards of generations generations of a random classic board"""
+    boards = [soup(shape, seed=seed)]
+    for _ in range(generations - 1):
+        boards.append(ce.step(boards[-1]))
+    return boards
+
+def versus_run(shape,generations,seed=0):
+    """ Returns the boards of generations generations of a random versus board"""
+    r = np.random.default_rng(seed).random(shape)
+    boards = [np.where(r < 0.2, cs.P1, np.where(r < 0.4, cs.P2, cs.EMPTY)).astype(cs.DTYPE)]
+    rng = np.random.default_rng(seed)
+    for _ in range(generations - 1):
+        boards.append(ve.step(boards[-1], rng)[0])
+    return boards
+
+def record(path,boards,keyframe_interval):
+    with rc.Recorder(path, boards[0].shape, keyframe_interval) as recorder:
+        for board in boards:
+            recorder.record(board)
+
+""" Recorder """
+
+@pytest.mark.parametrize('run', [classic_run, versus_run])
+@pytest.mark.parametrize('shape,keyframe_interval', [((16, 16), 1), ((9, 23), 7), ((40, 13), 100)])
+def test_recorder(tmp_path,run,shape,keyframe_interval):
+    path = str(tmp_path / 'run.glr')
+    boards = run(shape, 30)
+    record(path, boards, keyframe_interval)
+
+    replay = rc.Replay(path)
+    assert len(replay) == len(boards)
+    assert replay.shape == shape
+    for board, expected in zip(replay, boards):
+        assert np.array_equal(board, expected)
+
+    ## Any generation, in any order
+    for g in (29, 0, 13, 7, 6, 28):
+        assert np.array_equal(replay[g], boards[g])
+    with pytest.raises(IndexError):
+        replay[30]
+    replay.close()
+
+def test_recorder_empty(tmp_path):
+    path = str(tmp_path / 'empty.glr')
+    rc.Recorder(path, (8, 8)).close()
+    replay = rc.Replay(path)
+    assert len(replay) == 0
+    assert list(replay) == []
+    replay.close()
+
+def test_recorder_interrupted(tmp_path):
+    ## A recording never closed has no index, the generations written entirely are still read
+    path = str(tmp_path / 'cut.glr')
+    boards = classic_run((12, 12), 25)
+    recorder = rc.Recorder(path, (12, 12), keyframe_interval=10)
+    for board in boards:
+        recorder.record(board)
+    recorder.file.flush()
+    with open(path, 'rb') as file:
+        data = file.read()
+    recorder.file.close()
+
+    with open(path, 'wb') as file:
+        file.write(data)
+    replay = rc.Replay(path)
+    assert len(replay) == len(boards)
+    assert np.array_equal(replay[24], boards[24])
+    replay.close()
+
+    ## The last record cut short is left out
+    with open(path, 'wb') as file:
+        file.write(data[:-3])
+    replay = rc.Replay(path)
+    assert len(replay) == len(boards) - 1
+    assert np.array_equal(replay[23], boards[23])
+    replay.close()
+
+def test_recorder_not_a_recording(tmp_path):
+    path = tmp_path / 'noise.glr'
+    path.write_bytes(b'\0' * 64)
+    with pytest.raises(ValueError):
+        rc.Replay(str(path))
+
+""" Edits between two generations """
+
+def test_record_copies():
+    ## The recorder keeps its own copy of the last board, the caller may edit it in place
+    grid = classic_run((10, 10), 1)[0]
+    recorder = rc.Recorder(os.devnull, grid.shape)
+    recorder.record(grid)
+    grid[0, 0] ^= 1
+    assert recorder.previous is not grid and recorder.previous[0, 0] != grid[0, 0]
+
+@pytest.mark.parametrize('keyframe_interval', [1, 3, 100])
+def test_toggle_while_recording(tmp_path,keyframe_interval):
+    path = str(tmp_path / 'classic.glr')
+    game = gm.Classic(16)
+    game.data = classic_run((16, 16), 1, seed=4)[0]
+    game.start_recording(path, keyframe_interval)
+    boards = [game.data.copy()]
+    for n in range(12):
+        if n % 4 == 1:
+            game.toggle(n, 3)
+            game.toggle(n + 1, 3)
+            boards[-1] = game.data.copy() # the board the next generation is computed from
+        game.advance_frame()
+        boards.append(game.data.copy())
+    game.toggle(0, 0) # edits of the last generation are kept too
+    boards[-1] = game.data.copy()
+    game.stop_recording()
+
+    replay = rc.Replay(path)
+    assert len(replay) == len(boards)
+    for board, expected in zip(replay, boards):
+        assert np.array_equal(board, expected)
+    for g in (12, 2, 5, 6, 0, 9):
+        assert np.array_equal(replay[g], boards[g])
+    replay.close()
+
+def test_place_while_recording(tmp_path):
+    path = str(tmp_path / 'versus.glr')
+    game = gm.Versus(16, 200, seed=1)
+    game.data = versus_run((16, 16), 1, seed=5)[0]
+    game.start()
+    game.start_recording(path, keyframe_interval=4)
+    boards = [game.data.copy()]
+    rng = np.random.default_rng(0)
+    for n in range(15):
+        for i, j in rng.integers(16, size=(3, 2)):
+            game.place(i, j, 'P1' if n % 2 else 'P2')
+        boards[-1] = game.data.copy()
+        if game.advance_frame():
+            break
+        boards.append(game.data.copy())
+    game.clear()
+    boards[-1] = game.data.copy()
+    game.stop_recording()
+
+    replay = rc.Replay(path)
+    assert len(replay) == len(boards)
+    for g in reversed(range(len(boards))):
+        assert np.array_equal(replay[g], boards[g])
+    replay.close()
+
+def test_edits_interrupted(tmp_path):
+    ## Edits are found in a recording without index, and an edit cut short is left out
+    path = str(tmp_path / 'cut.glr')
+    game = gm.Classic(12)
+    game.data = classic_run((12, 12), 1)[0]
+    game.start_recording(path, keyframe_interval=10)
+    game.advance_frame()
+    game.toggle(5, 5)
+    edited = game.data.copy()
+    game.recorder.file.flush()
+    with open(path, 'rb') as file:
+        data = file.read()
+    game.recorder.file.close()
+
+    with open(path, 'wb') as file:
+        file.write(data)
+    replay = rc.Replay(path)
+    assert len(replay) == 2
+    assert np.array_equal(replay[1], edited)
+    replay.close()
+
+    with open(path, 'wb') as file:
+        file.write(data[:-2])
+    replay = rc.Replay(path)
+    assert len(replay) == 2
+    assert replay[1][5, 5] != edited[5, 5]
+    replay.close()
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 17:34:08 2026
+
+@author: ChrisZeThird
+
+Tests of the compiled rules: parsing of the rule strings, and boards stepped under Life-like and Generations rules
+checked against a cell by cell loop.
+"""
+
+import numpy as np
+import pytest
+
+import ConwayEngine as ce
+import Rules as rl
+import CellStates as cs
+
+## Board shapes checked, odd and non-square ones included
+SHAPES = [(1, 1), (3, 3), (8, 8), (17, 17), (5, 11), (23, 9), (32, 70)]
+
+def soup(shape,states=2,density=0.35,seed=0):
+    """ Returns a random board of the given number of states"""
+    rng = np.random.default_rng(seed)
+    return np.where(rng.random(shape) < density, rng.integers(1, states, shape), 0).astype(cs.DTYPE)
+
+def step_loop(grid,birth,survival,states):
+    """ Returns the next generation of grid under a rule, cell by cell, the board wrapping around its edges"""
+    N, M = grid.shape
+    new = np.zeros_like(grid)
+    for i in range(N):
+        for j in range(M):
+            total = sum(grid[(i + di) % N, (j + dj) % M] == 1 for di in (-1, 0, 1) for dj in (-1, 0, 1) if di or dj)
+            if grid[i, j] == 0:
+                new[i, j] = 1 if total in birth else 0
+            elif grid[i, j] == 1:
+                new[i, j] = 1 if total in survival else (2 if states > 2 else 0)
+            else:
+                new[i, j] = (grid[i, j] + 1) % states
+    return new
+
+@pytest.mark.parametrize('shape', SHAPES)
+def test_conway(shape):
+    grid = a = b = soup(shape, seed=6)
+    step = rl.stepper('B3/S23')
+    for _ in range(8):
+        grid = ce.step_reference(grid)
+        a, b = rl.step(a, 'B3/S23'), step(b)
+        assert np.array_equal(a, grid)
+        assert np.array_equal(b, grid)
+
+@pytest.mark.parametrize('rule', ['B36/S23', 'B2/S', 'B3678/S34678', 'B2/S/C3', 'B2/S345/C4', 'B3/S23/C12'])
+@pytest.mark.parametrize('shape', [(9, 9), (7, 12)])
+def test_rules(rule,shape):
+    birth, survival, states = rl.parse(rule)
+    grid = a = b = soup(shape, states, seed=len(rule))
+    step = rl.stepper(rule)
+    for _ in range(6):
+        grid = step_loop(grid, birth, survival, states)
+        a, b = rl.step(a, rule), step(b)
+        assert np.array_equal(a, grid)
+        assert np.array_equal(b, grid)
+
+def test_stack():
+    ## A stack of boards is stepped like every board alone
+    boards = np.stack([soup((10, 10), 4, seed=k) for k in range(5)])
+    stepped = rl.step(boards, 'starwars')
+    for board, expected in zip(boards, stepped):
+        assert np.array_equal(rl.step(board, 'starwars'), expected)
+
+@pytest.mark.parametrize('rule,parsed', [('B3/S23', ((3,), (2, 3), 2)),
+                                         ('b63/s32', ((3, 6), (2, 3), 2)),
+                                         ('23/36', ((3, 6), (2, 3), 2)),
+                                         ('/2/3', ((2,), (), 3)),
+                                         ('B2/S345/4', ((2,), (3, 4, 5), 4)),
+                                         ('Brians Brain', ((2,), (), 3)),
+                                         ('Day & Night', ((3, 6, 7, 8), (3, 4, 6, 7, 8), 2))])
+def test_parse(rule,parsed):
+    assert rl.parse(rule) == parsed
+
+@pytest.mark.parametrize('rule', ['B9/S23', 'B3/S23/C1', 'B3/S23/C300', 'life like', 'B3S23'])
+def test_parse_errors(rule):
+    with pytest.raises(ValueError):
+        rl.parse(rule)
+
+def test_compiled_once():
+    assert rl.compile_rule('B3/S23') is rl.compile_rule('23/3') is rl.compile_rule('life')
+    assert str(rl.compile_rule('briansbrain')) == 'B2/S/C3'
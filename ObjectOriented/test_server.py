@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 17:52:46 2026
+
+@author: ChrisZeThird
+
+Tests of the streaming server, run over a Unix socket: the boards rebuilt by a client are the frames of the game, and
+refused commands get an error frame without stopping the stream.
+"""
+
+import asyncio
+import zlib
+
+import numpy as np
+import pytest
+
+import Recorder as rc
+import Server as sv
+
+def serve(tmp_path,test,mode='classic'):
+    """ Runs the coroutine test(server, path) against a server streaming a random game on a Unix socket"""
+    path = str(tmp_path / 'game.sock')
+    async def run():
+        server = sv.Server(sv.random_game(mode, 32, seed=1), interval=0.005)
+        await server.start(path=path)
+        try:
+            await asyncio.wait_for(test(server, path), 10)
+        finally:
+            await server.close()
+    asyncio.run(run())
+
+async def read_frame(reader):
+    """ Returns the (kind, generation, payload) of the next frame sent by the server"""
+    kind, generation, length = sv.FRAME.unpack(await reader.readexactly(sv.FRAME.size))
+    return kind, generation, zlib.decompress(await reader.readexactly(length))
+
+@pytest.mark.parametrize('mode', ['classic', 'versus'])
+def test_watch(tmp_path,mode):
+    ## The boards rebuilt from the deltas are the frames of the game, whatever the frames skipped
+    async def test(server, path):
+        frames = {}
+        async for generation, board in sv.watch(path=path, fps=200):
+            frames[generation] = board.copy()
+            if generation == server.generation:
+                assert np.array_equal(board, server.frame)
+            if len(frames) == 10 or server.finished:
+                break
+        assert len(frames) > 1
+    serve(tmp_path, test, mode)
+
+@pytest.mark.parametrize('fps', ['nan', 'NaN', 'inf', '-inf', 'fast'])
+def test_fps_refused(tmp_path,fps):
+    async def test(server, path):
+        reader, writer = await asyncio.open_unix_connection(path)
+        await reader.readexactly(sv.HELLO.size)
+        assert (await read_frame(reader))[0] == rc.KEYFRAME
+
+        writer.write(f'fps 100\nfps {fps}\n'.encode())
+        while True:
+            kind, generation, payload = await read_frame(reader)
+            if kind == sv.ERROR:
+                break
+        assert repr(fps) in payload.decode()
+
+        ## The previous frame rate is kept, frames keep coming
+        generations = [(await read_frame(reader))[1] for _ in range(3)]
+        assert generations == sorted(set(generations))
+        writer.close()
+    serve(tmp_path, test)
+
+def test_watch_refused(tmp_path):
+    async def test(server, path):
+        with pytest.raises(ValueError):
+            async for _ in sv.watch(path=path, fps=float('nan')):
+                pass
+    serve(tmp_path, test)
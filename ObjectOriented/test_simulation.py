@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 18:15:22 2026
+
+@author: ChrisZeThird
+
+Tests of the headless Simulation: the statistics computed while stepping are the ones found by scanning the boards.
+"""
+
+import numpy as np
+import pytest
+
+import Rules as rl
+import Recorder as rc
+import Simulation as sm
+import CellStates as cs
+
+def soup(shape,states=2,density=0.35,seed=0):
+    """ Returns a random board of the given number of states"""
+    rng = np.random.default_rng(seed)
+    return np.where(rng.random(shape) < density, rng.integers(1, states, shape), 0).astype(cs.DTYPE)
+
+def scanned(previous,board,generation):
+    """ Returns the statistics of board scanned from scratch, previous being the board of the previous generation"""
+    alive, was_alive = board == cs.ALIVE, previous == cs.ALIVE
+    rows, cols = np.nonzero(alive)
+    bbox = (rows.min(), cols.min(), rows.max() + 1, cols.max() + 1) if rows.size else None
+    return (generation, int(alive.sum()), int((alive & ~was_alive).sum()), int((was_alive & ~alive).sum()), bbox)
+
+@pytest.mark.parametrize('rule', ['B3/S23', 'B36/S23', 'B2/S/C3', 'B2/S345/C4'])
+@pytest.mark.parametrize('shape', [(1, 1), (16, 16), (9, 25)])
+def test_statistics(rule,shape):
+    states = rl.compile_rule(rule).states
+    grid = soup(shape, states, seed=shape[1])
+    sim = sm.Simulation(grid, rule)
+    assert sim.last.population == np.count_nonzero(grid == cs.ALIVE)
+    for gen in sim.iter_generations(30):
+        new = rl.step(grid, rule)
+        assert np.array_equal(gen.board, new)
+        assert (gen.generation, gen.population, gen.births, gen.deaths, gen.bbox) == scanned(grid, new, gen.generation)
+        grid = new
+
+def test_bounding_box():
+    alive = np.zeros((10, 12), dtype=bool)
+    assert sm.bounding_box(alive) is None
+    alive[3, 7] = alive[6, 2] = True
+    assert sm.bounding_box(alive) == (3, 2, 7, 8)
+    alive[0, 11] = True
+    assert sm.bounding_box(alive) == (0, 2, 7, 12)
+
+def test_views():
+    ## The boards are read-only views of the simulation, valid until the next step
+    sim = sm.Simulation(soup((12, 12)))
+    gen = sim.step()
+    assert not gen.board.flags.writeable
+    kept = sim.to_array()
+    assert np.array_equal(gen.board, kept)
+    assert np.array_equal(sim.step().board, rl.step(kept, 'B3/S23'))
+    with pytest.raises(ValueError):
+        sim.board[0, 0] = 1
+
+def test_pipeline(tmp_path):
+    ## A pipeline of stages, recording the generations it goes through
+    grid = cs.board(20)
+    grid[5, 5:8] = cs.ALIVE # a blinker
+    grid[12, 12] = cs.ALIVE # a cell dying at once
+    sim = sm.Simulation(grid)
+    path = str(tmp_path / 'run.glr')
+    sampled = [(gen.generation, gen.population) for gen in sm.sample(sm.record(sim.iter_generations(20), path), 5)]
+    assert sampled == [(5, 3), (10, 3), (15, 3), (20, 3)]
+
+    replay = rc.Replay(path)
+    assert len(replay) == 20
+    assert np.array_equal(replay[19], sim.to_array())
+    replay.close()
+
+    dying = sm.Simulation(soup((8, 8), density=0.15, seed=1))
+    generations = list(sm.until_extinct(dying.iter_generations(100)))
+    assert generations[-1].population == 0
+    assert all(gen.population for gen in generations[:-1])
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 14:48:13 2026
+
+@author: ChrisZeThird
+
+Tests of the sparse boards. Their plane is unbounded, so they are compared with the dense engines on a board large
+enough for the pattern never to reach its edges.
+"""
+
+import numpy as np
+import pytest
+
+import ConwayEngine as ce
+import VersusEngine as ve
+import SparseBoard as sb
+import CellStates as cs
+
+## Side of the dense board, a soup of SOUP cells grows by at most one cell per generation on each side
+SIDE = 96
+SOUP = 16
+GENERATIONS = 30
+GLIDER = np.array([[0, 1, 0], [0, 0, 1], [1, 1, 1]], dtype=cs.DTYPE)
+
+def centred(soup):
+    """ Returns a SIDE x SIDE board holding soup in its centre"""
+    grid = cs.board(SIDE)
+    grid[(SIDE - SOUP)//2:(SIDE + SOUP)//2, (SIDE - SOUP)//2:(SIDE + SOUP)//2] = soup
+    return grid
+
+@pytest.mark.parametrize('seed', [0, 1, 2])
+def test_sparse_board(seed):
+    grid = centred(np.random.default_rng(seed).random((SOUP, SOUP)) < 0.4)
+    board = sb.SparseBoard.from_array(grid)
+    for _ in range(GENERATIONS):
+        board.step()
+        grid = ce.step(grid)
+        assert np.array_equal(board.to_array(0, 0, SIDE), grid)
+        assert board.population() == np.count_nonzero(grid)
+    assert board.generation == GENERATIONS
+
+def test_sparse_board_unbounded():
+    board = sb.SparseBoard.from_array(GLIDER, top=-1, left=-1)
+    board.advance(4000)
+    assert board.bounding_box() == (999, 999, 1001, 1001)
+    assert np.array_equal(board.to_array(999, 999, 3), GLIDER)
+
+    board.toggle(-5, -5)
+    assert board.population() == 6
+    board.toggle(-5, -5)
+    assert board.population() == 5
+    assert sb.SparseBoard().bounding_box() is None
+
+@pytest.mark.parametrize('seed', [0, 1, 2])
+def test_sparse_versus(seed):
+    ## Every generation is compared starting from the same board, the ties being drawn differently
+    r = np.random.default_rng(seed).random((SOUP, SOUP))
+    grid = centred(np.where(r < 0.2, cs.P1, np.where(r < 0.4, cs.P2, cs.EMPTY)))
+    board = sb.SparseVersus.from_array(grid, seed=seed)
+    for _ in range(GENERATIONS):
+        tie = ((grid == cs.EMPTY) & (ve.count_clipped(grid == cs.P1) == 3) & (ve.count_clipped(grid == cs.P2) == 3))
+        expected = ve.step(grid, np.random.default_rng(seed))[0]
+        board.step()
+        grid = board.to_array(0, 0, SIDE)
+
+        assert np.array_equal(grid[~tie], expected[~tie])
+        assert np.isin(grid[tie], (cs.P1, cs.P2)).all()
+        assert board.population() == (np.count_nonzero(grid == cs.P1), np.count_nonzero(grid == cs.P2))
+        assert len(board.cells) == np.count_nonzero(grid) # nothing left outside the board
+
+def test_sparse_versus_seed():
+    ## The same seed draws the same ties
+    r = np.random.default_rng(5).random((SOUP, SOUP))
+    grid = np.where(r < 0.25, cs.P1, np.where(r < 0.5, cs.P2, cs.EMPTY))
+    first, second = sb.SparseVersus.from_array(grid, seed=3), sb.SparseVersus.from_array(grid, seed=3)
+    first.advance(20)
+    second.advance(20)
+    assert first.cells == second.cells
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 15:37:25 2026
+
+@author: ChrisZeThird
+
+Tests of the detection of stasis and cycles (Termination.CycleDetector) and of the end of the Versus games.
+"""
+
+import numpy as np
+import pytest
+
+import ConwayEngine as ce
+import Termination as tm
+import Game as gm
+import CellStates as cs
+
+def versus_soup(shape,density=0.4,seed=0):
+    """ Returns a random versus board, half of the living cells belonging to each player"""
+    r = np.random.default_rng(seed).random(shape)
+    return np.where(r < density/2, cs.P1, np.where(r < density, cs.P2, cs.EMPTY)).astype(cs.DTYPE)
+
+def blocks_game():
+    """ Returns a Versus game holding a block of each player and a cell of player 1 dying at the first generation,
+        stepped once: its board is the two blocks and no cycle is found yet"""
+    game = gm.Versus(16, 10, seed=0)
+    game.data[1:3, 1:3] = cs.P1
+    game.data[12:14, 12:14] = cs.P2
+    game.data[0, 8] = cs.P1
+    game.start()
+    assert not game.advance_frame()
+    return game
+
+""" Cycle detector """
+
+@pytest.mark.parametrize('changed', [False, True])
+def test_hash_follows_the_board(changed):
+    ## The hash kept from the changed cells is the hash of the whole board
+    grid = versus_soup((20, 30), seed=1)
+    detector = tm.CycleDetector(grid.shape)
+    detector.reset(grid)
+    rng = np.random.default_rng(0)
+    for _ in range(20):
+        new = np.where(rng.random(grid.shape) < 0.1, versus_soup(grid.shape, seed=rng.integers(100)), grid)
+        detector.update(grid, new, np.flatnonzero(new != grid) if changed else None)
+        assert detector.current == detector.hash(new)
+        grid = new
+
+def test_detector_periods():
+    ## A blinker comes back every 2 generations, a block at once
+    grid = cs.board(8)
+    grid[3, 2:5] = cs.ALIVE
+    detector = tm.CycleDetector(grid.shape, states=2)
+    detector.reset(grid)
+    periods = []
+    for _ in range(3):
+        new = ce.step(grid)
+        periods.append(detector.update(grid, new))
+        grid = new
+    assert periods == [None, 2, 2]
+
+    grid = cs.board(8)
+    grid[3:5, 3:5] = cs.ALIVE
+    detector.reset(grid)
+    assert detector.update(grid, ce.step(grid)) == 1
+
+def test_edit():
+    grid = versus_soup((10, 10), seed=2)
+    detector = tm.CycleDetector(grid.shape)
+    detector.reset(grid)
+    for i, j, state in ((0, 0, cs.P1), (9, 9, cs.P2), (4, 5, cs.EMPTY), (0, 0, cs.P2)):
+        detector.edit(i*10 + j, grid[i, j], state)
+        grid[i, j] = state
+        assert detector.current == detector.hash(grid)
+
+""" Versus games """
+
+def test_versus_hash():
+    game = gm.Versus(24, 24*24, seed=3)
+    game.data = versus_soup((24, 24), seed=3)
+    game.start()
+    while not game.advance_frame():
+        assert game.detector.current == game.detector.hash(game.data)
+
+def test_place_then_stasis():
+    ## A cell placed during the game dies, the board is back to the two blocks of the previous generation
+    game = blocks_game()
+    game.place(8, 0, 'P2')
+    assert game.detector.current == game.detector.hash(game.data)
+    assert game.advance_frame()
+    assert (game.period, game.generation, game.result()) == (1, 2, 'DRAW')
+
+def test_place_then_period_2():
+    ## A blinker placed during the game, the cycle is found once a board after the edit comes back
+    game = blocks_game()
+    for j in (6, 7, 8):
+        game.place(7, j, 'P1')
+    assert game.detector.current == game.detector.hash(game.data)
+    assert not game.advance_frame()
+    assert not game.advance_frame()
+    assert game.advance_frame()
+    assert (game.period, game.generation, game.result()) == (2, 4, 'DRAW')
+
+def test_place_removes_cell():
+    ## Removing a cell is an edit too, and so is placing it back
+    game = blocks_game()
+    game.place(1, 1, 'P1')
+    game.place(1, 1, 'P1')
+    game.place(12, 12, 'P1') # a cell of the other player is left alone
+    assert game.data[12, 12] == cs.P2
+    assert game.detector.current == game.detector.hash(game.data)
+    assert game.advance_frame()
+    assert game.period == 1
+
+def test_place_after_draw():
+    ## An edit breaks the cycle that ended the game, it goes on
+    game = blocks_game()
+    assert game.advance_frame()
+    game.place(7, 6, 'P1')
+    game.place(7, 7, 'P1')
+    game.place(7, 8, 'P1')
+    assert game.period is None and game.result() is None
+    assert not game.advance_frame()
+
+def test_clear():
+    game = blocks_game()
+    game.clear()
+    assert game.detector.current == 0
+    assert (game.count_p1, game.count_p2) == (0, 0)
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 16:02:17 2026
+
+@author: ChrisZeThird
+
+Tests of the headless tournament runner: the matches end like the games of Game.Versus, and every match, valid or
+not, gets its row in the results.
+"""
+
+import csv
+import json
+
+import numpy as np
+import pytest
+
+import Tournament as tn
+import Game as gm
+import CellStates as cs
+
+N, NBR = 12, 20
+
+def random_match(k):
+    """ Returns match k, whose players place NBR random cells each in their half of the board"""
+    rng = np.random.default_rng(k)
+    cells = rng.choice(N * N // 2, size=NBR, replace=False)
+    p1 = [[int(c) // N, int(c) % N] for c in cells]
+    cells = rng.choice(N * N // 2, size=NBR, replace=False)
+    p2 = [[N//2 + int(c) // N, int(c) % N] for c in cells]
+    return {'id': k, 'seed': k, 'p1': p1, 'p2': p2}
+
+""" Playing a match """
+
+@pytest.mark.parametrize('k', range(8))
+def test_play_like_versus(k):
+    ## A match ends like a Versus game played from the same board with the same seed
+    match = random_match(k)
+    row = tn.play_match(match, N, NBR)
+
+    game = gm.Versus(N, NBR, seed=k)
+    game.data = tn.place(N, NBR, match['p1'], match['p2'])
+    game.start()
+    while not game.advance_frame():
+        pass
+    assert row['winner'] == game.result()
+    assert (row['generations'], row['period']) == (game.generation, game.period)
+    assert (row['count_p1'], row['count_p2']) == (game.count_p1, game.count_p2)
+    assert row['end'] == ('cycle' if game.period is not None else 'extinction')
+
+def test_play_ends():
+    ## A lone cell dies at once, blocks are still, blinkers are drawn at the limit
+    grid = tn.place(8, 4, [[1, 1]], [[5, 5], [5, 6], [6, 5], [6, 6]])
+    assert tn.play(grid) == {'winner': 'P2', 'end': 'extinction', 'generations': 1, 'period': None,
+                             'count_p1': 0, 'count_p2': 4}
+
+    grid = tn.place(8, 4, [[1, 1], [1, 2], [2, 1], [2, 2]], [[5, 5], [5, 6], [6, 5], [6, 6]])
+    assert tn.play(grid)['end'] == 'cycle' and tn.play(grid)['period'] == 1
+
+    grid = tn.place(8, 3, [[1, 1], [1, 2], [1, 3]], [[5, 4], [5, 5], [5, 6]])
+    row = tn.play(grid, max_generations=1)
+    assert (row['winner'], row['end'], row['generations']) == ('DRAW', 'limit', 1)
+    assert tn.play(grid)['period'] == 2
+
+@pytest.mark.parametrize('p1,p2,error', [([[0, 0]] * (NBR + 1), [], 'at most'),
+                                         ([[0, N]], [], 'outside'),
+                                         ([[-1, 0]], [], 'outside'),
+                                         ([[3, 3]], [[3, 3]], 'twice')])
+def test_error_rows(p1,p2,error):
+    row = tn.play_match({'id': 'bad', 'seed': 1, 'p1': p1, 'p2': p2}, N, NBR)
+    assert row['id'] == 'bad' and row['seed'] == 1
+    assert error in row['error']
+    assert 'winner' not in row
+
+""" Running a tournament """
+
+@pytest.mark.parametrize('name', ['results.csv', 'results.jsonl'])
+def test_run(tmp_path,name):
+    matches = [random_match(k) for k in range(10)]
+    matches.insert(4, {'id': 'bad', 'seed': 0, 'p1': [[N, 0]], 'p2': []})
+    path = tmp_path / 'matches.jsonl'
+    path.write_text(''.join(json.dumps(match) + '\n' for match in matches) + '\n')
+
+    out = str(tmp_path / name)
+    assert tn.run(tn.read_matches(str(path)), out, N, NBR, workers=2, chunksize=3) == len(matches)
+    with open(out, newline='') as f:
+        if name.endswith('.csv'):
+            rows = {row['id']: row for row in csv.DictReader(f)}
+        else:
+            rows = {str(row['id']): row for row in map(json.loads, f)}
+
+    assert len(rows) == len(matches)
+    assert 'outside' in rows['bad']['error']
+    for k in range(10):
+        expected = tn.play_match(matches[k if k < 4 else k + 1], N, NBR)
+        assert rows[str(k)]['winner'] == expected['winner']
+        assert str(rows[str(k)]['generations']) == str(expected['generations'])
+        assert not rows[str(k)].get('error')
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 15:21:09 2026
+
+@author: ChrisZeThird
+
+Tests of the two-species engine, checked against VersusEngine.step_reference. The engines draw the 3-3 ties
+differently, so the tie cells only have to go to one of the players.
+"""
+
+import numpy as np
+import pytest
+
+import VersusEngine as ve
+import Game as gm
+import CellStates as cs
+
+## Board shapes checked, odd and non-square ones included
+SHAPES = [(1, 1), (3, 3), (8, 8), (17, 17), (5, 11), (23, 9), (32, 70)]
+
+def versus_soup(shape,density=0.4,seed=0):
+    """ Returns a random versus board, half of the living cells belonging to each player"""
+    r = np.random.default_rng(seed).random(shape)
+    return np.where(r < density/2, cs.P1, np.where(r < density, cs.P2, cs.EMPTY)).astype(cs.DTYPE)
+
+def ties(grid):
+    """ Returns the empty cells of grid with 3 neighbours of each player, drawn at random by the engines"""
+    total1 = ve.count_clipped(grid == cs.P1)
+    total2 = ve.count_clipped(grid == cs.P2)
+    return (grid == cs.EMPTY) & (total1 == 3) & (total2 == 3)
+
+@pytest.mark.parametrize('shape', SHAPES)
+@pytest.mark.parametrize('seed', [0, 1, 2])
+def test_versus_engine(shape,seed):
+    grid = versus_soup(shape, seed=seed)
+    for _ in range(8):
+        tie = ties(grid)
+        new, births, deaths, changed = ve.step(grid, np.random.default_rng(seed))
+        expected, births_ref, deaths_ref, changed_ref = ve.step_reference(grid, np.random.default_rng(seed))
+
+        assert np.array_equal(new[~tie], expected[~tie])
+        assert np.isin(new[tie], (cs.P1, cs.P2)).all()
+        assert deaths == deaths_ref
+        assert sum(births) == sum(births_ref)
+        assert np.array_equal(changed, changed_ref)
+        assert np.array_equal(changed, np.flatnonzero(new != grid))
+        grid = new
+
+def test_rule_table():
+    for total1 in range(9):
+        for total2 in range(9):
+            assert ve.survives(np.array(total1), np.array(total2)) == (ve.rule(1, 2, total1, total2) == 1)
+
+def test_versus_counts():
+    ## The counts kept from the births and deaths match the board
+    game = gm.Versus(24, 24*24, seed=3)
+    game.data = versus_soup((24, 24), seed=3)
+    game.start()
+    while not game.advance_frame():
+        assert game.count_p1 == np.count_nonzero(game.data == cs.P1)
+        assert game.count_p2 == np.count_nonzero(game.data == cs.P2)
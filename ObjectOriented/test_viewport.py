@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 19:21:48 2026
+
+@author: ChrisZeThird
+
+Tests of the viewport: the cell under a point of the figure at any zoom and position of the window, and the pooling
+of the windows larger than the screen.
+"""
+
+import numpy as np
+import pytest
+
+import Viewport as vp
+import CellStates as cs
+
+N, M = 100, 80
+
+""" Useful methods """
+
+def centres(view,image,extent):
+    """ Yields every pixel [r,c] of image and the point (x, y) of the figure at its centre, the image being drawn by
+        imshow with extent (row 0 on top)"""
+    k = view.scale
+    for r in range(image.shape[0]):
+        for c in range(image.shape[1]):
+            yield r, c, extent[0] + (c + 0.5) * k, extent[3] - (r + 0.5) * k
+
+""" Tests """
+
+@pytest.mark.parametrize('size', [1024, 16])
+def test_cell(size):
+    ## Every pixel drawn gives back the cell it shows, after zooms and moves
+    board = np.arange(N * M).reshape(N, M)
+    view = vp.Viewport(N, M, size=size)
+    ## The cells zoomed on are given by their position in the window, the last one of a row and of a column included
+    for factor, u, v, di, dj in [(0.5, 0.3, 0.4, 0, 0), (0.5, 0.9, 0.1, 5, -3), (2, None, None, -20, 12), (0.3, 1, 0, 0, 0)]:
+        i = None if u is None else min(view.top + int(u * view.rows), view.top + view.rows - 1)
+        j = None if v is None else min(view.left + int(v * view.cols), view.left + view.cols - 1)
+        view.zoom(factor, i, j)
+        if i is not None:
+            assert view.top <= i < view.top + view.rows and view.left <= j < view.left + view.cols
+        view.pan(di, dj)
+        image, extent = view.render(board, 'sample')
+        k = view.scale
+        for r, c, x, y in centres(view, image, extent):
+            i, j = view.cell(x, y)
+            assert view.top + r*k <= i < view.top + (r + 1)*k and view.left + c*k <= j < view.left + (c + 1)*k
+            assert image[r, c] == board[view.top + r*k, view.left + c*k] # the sample is the top left cell
+
+def test_cell_outside():
+    view = vp.Viewport(N, M)
+    assert view.cell(0, N - 0.5) == (0, 0)
+    assert view.cell(M - 0.5, 0) == (N - 1, M - 1)
+    assert view.cell(-0.5, 10) is None and view.cell(M, 10) is None
+    assert view.cell(10, N) is None and view.cell(10, -0.1) is None
+
+def test_zoom():
+    ## The cell zoomed on stays at the same place on screen
+    view = vp.Viewport(N, M)
+    view.zoom(0.5, 30, 40)
+    assert (view.rows, view.cols) == (50, 40)
+    assert (30 - view.top) / view.rows == pytest.approx(30 / N, abs=0.02)
+    assert (40 - view.left) / view.cols == pytest.approx(40 / M, abs=0.02)
+    assert view.limits() == ((view.left, view.left + 40), (N - view.top - 50, N - view.top))
+
+def test_clamp():
+    ## The window stays inside the board and is never smaller than min_cells, the cell zoomed on being kept inside it
+    view = vp.Viewport(N, M, min_cells=8)
+    view.zoom(0.001, 99, 79)
+    assert (view.top, view.left, view.rows, view.cols) == (92, 72, 8, 8)
+    view.reset()
+    view.zoom(0.001, 0, 0)
+    assert (view.top, view.left) == (0, 0)
+    view.reset()
+    view.zoom(0.001, 99, 79)
+    view.pan(100, 100)
+    assert (view.top, view.left) == (92, 72)
+    view.zoom(1, 99, 79)
+    assert (view.top, view.left) == (92, 72)
+    view.pan(-1000, -5)
+    assert (view.top, view.left) == (0, 67)
+    view.zoom(1000)
+    assert (view.top, view.left, view.rows, view.cols) == (0, 0, N, M)
+    view.zoom(0.5)
+    view.reset()
+    assert (view.top, view.left, view.rows, view.cols) == (0, 0, N, M)
+
+def test_render():
+    ## The image is never larger than the screen and its extent covers the window
+    board = (np.random.default_rng(0).random((N, M)) < 0.3).astype(cs.DTYPE)
+    view = vp.Viewport(N, M, size=32)
+    image, extent = view.render(board)
+    assert view.scale == 4 and image.shape == (25, 20)
+    assert extent == [0, M, 0, N]
+    view.zoom(0.5, 50, 40)
+    image, extent = view.render(board)
+    assert max(image.shape) <= 32
+    assert extent[0] == view.left and extent[3] == N - view.top
+    assert extent[1] >= view.left + view.cols and extent[2] <= N - view.top - view.rows
+
+def test_pool():
+    window = np.array([[1, 0, 0, 0, 0],
+                       [0, 0, 0, 0, 1],
+                       [0, 0, 0, 0, 0]], dtype=cs.DTYPE)
+    assert vp.pool(window, 1) is window
+    assert np.array_equal(vp.pool(window, 2, 'max'), [[1, 0, 1], [0, 0, 0]])
+    assert np.array_equal(vp.pool(window, 2, 'sample'), [[1, 0, 0], [0, 0, 0]])
+    assert np.allclose(vp.pool(window, 2, 'mean'), [[0.25, 0, 0.25], [0, 0, 0]]) # completed with dead cells
+    assert np.array_equal(vp.pool(np.array([[0, 2], [1, 0]]), 2, 'max'), [[2]]) # the highest state is shown